@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('affiliate', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='commission',
+            index=models.Index(fields=['affiliate', 'status'], name='affiliate_comm_aff_status'),
+        ),
+    ]
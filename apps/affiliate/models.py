@@ -130,6 +130,10 @@ class Commission(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Affiliate dashboard: commission totals per status
+            models.Index(fields=['affiliate', 'status'], name='affiliate_comm_aff_status'),
+        ]
     
     def __str__(self):
         return f"{self.affiliate.user.username} - ₹{self.amount}"
@@ -0,0 +1,190 @@
+"""
+Cart Service for Zero To Hero
+
+Anonymous visitors keep their cart in the session as {product_id: quantity}.
+Signed-in users keep it in CartItem rows with a price snapshot taken when the
+product was added. The session cart is folded into CartItem on login
+(see apps.cart.signals), and by Cart itself whenever a signed-in request
+still carries one (a cart from before the user's last login, or an older
+deploy).
+"""
+from decimal import Decimal
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from apps.platforms.models import Product
+from .models import CartItem
+
+SESSION_KEY = 'cart'
+
+
+class Cart:
+    """Shopping cart for the current request"""
+
+    def __init__(self, request, user=None):
+        self.request = request
+        self.session = request.session
+        user = user or getattr(request, 'user', None)
+        self.user = user if user is not None and user.is_authenticated else None
+        if self.user is not None and self._session_cart():
+            self.merge_session()
+
+    # ===== SESSION STORAGE =====
+
+    def _session_cart(self):
+        return self.session.get(SESSION_KEY, {})
+
+    def _save_session_cart(self, cart):
+        self.session[SESSION_KEY] = cart
+        self.session.modified = True
+
+    def _items(self):
+        return CartItem.objects.filter(user=self.user, product__is_active=True)
+
+    # ===== MUTATIONS =====
+
+    def add(self, product, quantity=1):
+        """Add quantity of product, snapshotting its current price"""
+        if self.user is None:
+            cart = self._session_cart()
+            key = str(product.pk)
+            cart[key] = cart.get(key, 0) + quantity
+            self._save_session_cart(cart)
+            return
+
+        items = CartItem.objects.filter(user=self.user, product=product, session_key=None)
+        if items.update(quantity=F('quantity') + quantity, price=product.our_price):
+            return
+        try:
+            with transaction.atomic():
+                CartItem.objects.create(
+                    user=self.user, product=product, quantity=quantity, price=product.our_price,
+                )
+        except IntegrityError:
+            # A concurrent request created the line first (cart_item_user_product)
+            items.update(quantity=F('quantity') + quantity, price=product.our_price)
+
+    def update(self, product_id, quantity):
+        """Set the quantity for a line; zero or less removes it"""
+        if quantity <= 0:
+            return self.remove(product_id)
+
+        if self.user is None:
+            cart = self._session_cart()
+            if cart.get(str(product_id)) != quantity:
+                cart[str(product_id)] = quantity
+                self._save_session_cart(cart)
+            return True
+        return CartItem.objects.filter(user=self.user, product_id=product_id).update(quantity=quantity) > 0
+
+    def remove(self, product_id):
+        """Remove a line. Returns True if something was removed."""
+        if self.user is None:
+            cart = self._session_cart()
+            if str(product_id) not in cart:
+                return False
+            del cart[str(product_id)]
+            self._save_session_cart(cart)
+            return True
+        deleted, _ = CartItem.objects.filter(user=self.user, product_id=product_id).delete()
+        return deleted > 0
+
+    def clear(self):
+        if self.user is not None:
+            CartItem.objects.filter(user=self.user).delete()
+        if self._session_cart():
+            self._save_session_cart({})
+
+    def merge_session(self):
+        """Move the anonymous session cart into the user's CartItem rows"""
+        cart = self._session_cart()
+        if self.user is None or not cart:
+            return
+
+        products = Product.objects.filter(id__in=cart.keys(), is_active=True).in_bulk()
+        existing = {
+            item.product_id: item
+            for item in CartItem.objects.filter(user=self.user, product_id__in=products.keys())
+        }
+
+        new_items = []
+        for product_id, product in products.items():
+            quantity = cart[str(product_id)]
+            if product_id in existing:
+                existing[product_id].quantity += quantity
+                existing[product_id].price = product.our_price
+            else:
+                new_items.append(CartItem(
+                    user=self.user,
+                    product=product,
+                    quantity=quantity,
+                    price=product.our_price,
+                ))
+
+        CartItem.objects.bulk_update(existing.values(), ['quantity', 'price'])
+        try:
+            with transaction.atomic():
+                CartItem.objects.bulk_create(new_items)
+        except IntegrityError:
+            # Another request added one of these lines meanwhile; add one by one
+            for item in new_items:
+                self.add(item.product, item.quantity)
+        self._save_session_cart({})
+
+    # ===== READS =====
+
+    def lines(self):
+        """
+        Cart lines with their products resolved in a single query.
+        Each line: {'product', 'quantity', 'price', 'item_total'}
+        """
+        if self.user is not None:
+            return [
+                {
+                    'product': item.product,
+                    'quantity': item.quantity,
+                    'price': item.price,
+                    'item_total': item.total_price,
+                }
+                for item in self._items().select_related('product__platform')
+            ]
+
+        cart = self._session_cart()
+        if not cart:
+            return []
+        products = Product.objects.filter(
+            id__in=cart.keys(), is_active=True
+        ).select_related('platform').in_bulk()
+
+        lines = []
+        for product_id, quantity in cart.items():
+            product = products.get(int(product_id))
+            if product is None:
+                continue
+            lines.append({
+                'product': product,
+                'quantity': quantity,
+                'price': product.our_price,
+                'item_total': product.our_price * quantity,
+            })
+        return lines
+
+    def summary(self):
+        """
+        Line count and total for checkout. Signed-in carts are priced from
+        the CartItem snapshot in one aggregate, without loading products.
+        """
+        if self.user is None:
+            lines = self.lines()
+            return {
+                'count': len(lines),
+                'total': sum((line['item_total'] for line in lines), Decimal('0')),
+            }
+
+        summary = self._items().aggregate(
+            count=Count('id'),
+            total=Sum(F('price') * F('quantity')),
+        )
+        return {
+            'count': summary['count'],
+            'total': summary['total'] or Decimal('0'),
+        }
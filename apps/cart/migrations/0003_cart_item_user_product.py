@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:05
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def merge_duplicate_lines(apps, schema_editor):
+    """Fold duplicate signed-in cart lines into the newest one before the constraint"""
+    CartItem = apps.get_model('cart', 'CartItem')
+    duplicates = (
+        CartItem.objects.filter(user__isnull=False, session_key__isnull=True)
+        .values('user_id', 'product_id')
+        .annotate(lines=Count('id'))
+        .filter(lines__gt=1)
+    )
+    for row in duplicates:
+        items = list(
+            CartItem.objects.filter(user_id=row['user_id'], product_id=row['product_id'], session_key__isnull=True)
+            .order_by('-added_at', '-pk')
+        )
+        keep = items[0]
+        keep.quantity = sum(item.quantity for item in items)
+        keep.save(update_fields=['quantity'])
+        CartItem.objects.filter(pk__in=[item.pk for item in items[1:]]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cart', '0002_initial'),
+        ('platforms', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_lines, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='cartitem',
+            constraint=models.UniqueConstraint(condition=models.Q(('session_key__isnull', True)), fields=('user', 'product'), name='cart_item_user_product'),
+        ),
+    ]
@@ -23,6 +23,15 @@ class CartItem(models.Model):
     class Meta:
         unique_together = ['user', 'product', 'session_key']
         ordering = ['-added_at']
+        constraints = [
+            # unique_together treats NULL session keys as distinct, so it
+            # doesn't stop duplicate lines in a signed-in user's cart
+            models.UniqueConstraint(
+                fields=['user', 'product'],
+                condition=models.Q(session_key__isnull=True),
+                name='cart_item_user_product',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.user or self.session_key} - {self.product.name} x {self.quantity}"
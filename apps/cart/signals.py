@@ -0,0 +1,14 @@
+"""
+Signal handlers for the cart app
+"""
+from django.contrib.auth.signals import user_logged_in
+from django.dispatch import receiver
+from .cart import Cart
+
+
+@receiver(user_logged_in)
+def merge_session_cart(sender, request, user, **kwargs):
+    """Carry an anonymous cart over to the account that just logged in"""
+    if request is None or not hasattr(request, 'session'):
+        return
+    Cart(request, user=user).merge_session()
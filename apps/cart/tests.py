@@ -1,3 +1,69 @@
-from django.test import TestCase
+from decimal import Decimal
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.backends.db import SessionStore
+from django.db import IntegrityError, transaction
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from apps.platforms.models import Platform, Product
+from apps.users.models import User
+from .cart import SESSION_KEY, Cart
+from .models import CartItem
 
-# Create your tests here.
+
+class CartTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('buyer', 'buyer@example.com', 'password')
+        platform = Platform.objects.create(name='Platform', slug='platform', website='https://example.com')
+        self.products = [
+            Product.objects.create(
+                platform=platform, name=f'Course {i}', slug=f'course-{i}',
+                original_price=Decimal('100'), our_price=Decimal('90'), commission_rate=Decimal('0'),
+            )
+            for i in range(2)
+        ]
+
+    def request(self, user=None, session_cart=None):
+        request = RequestFactory().get('/')
+        request.session = SessionStore()
+        if session_cart:
+            request.session[SESSION_KEY] = session_cart
+        request.user = user or AnonymousUser()
+        return request
+
+    def test_anonymous_cart_lives_in_session(self):
+        request = self.request()
+        Cart(request).add(self.products[0], 2)
+        self.assertEqual(request.session[SESSION_KEY], {str(self.products[0].pk): 2})
+        self.assertEqual(Cart(request).summary(), {'count': 1, 'total': Decimal('180')})
+        self.assertFalse(CartItem.objects.exists())
+
+    def test_adding_twice_increments_one_line(self):
+        cart = Cart(self.request(self.user))
+        cart.add(self.products[0])
+        cart.add(self.products[0], 2)
+        item = CartItem.objects.get(user=self.user)
+        self.assertEqual((item.quantity, item.price), (3, Decimal('90')))
+
+    def test_session_cart_merged_on_login(self):
+        self.client.post(reverse('add-to-cart', args=[self.products[0].pk]))
+        self.client.login(username='buyer', password='password')
+        item = CartItem.objects.get(user=self.user)
+        self.assertEqual((item.product, item.quantity), (self.products[0], 1))
+        self.assertNotIn(str(self.products[0].pk), self.client.session.get(SESSION_KEY, {}))
+
+    def test_leftover_session_cart_merged_for_signed_in_user(self):
+        Cart(self.request(self.user)).add(self.products[0])
+        request = self.request(self.user, {str(self.products[0].pk): 2, str(self.products[1].pk): 1})
+
+        lines = Cart(request).lines()
+
+        self.assertEqual(
+            sorted((line['product'].pk, line['quantity']) for line in lines),
+            [(self.products[0].pk, 3), (self.products[1].pk, 1)],
+        )
+        self.assertEqual(request.session[SESSION_KEY], {})
+
+    def test_one_line_per_user_and_product(self):
+        CartItem.objects.create(user=self.user, product=self.products[0], price=Decimal('90'))
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            CartItem.objects.create(user=self.user, product=self.products[0], price=Decimal('90'))
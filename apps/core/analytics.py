@@ -0,0 +1,106 @@
+"""
+Analytics Metrics for Zero To Hero
+
+Headline numbers for the admin analytics views. Every metric family is one
+aggregate() over its table, with the today / 7d / 30d variants folded in as
+filtered Count/Sum expressions instead of separate queries.
+"""
+from datetime import timedelta
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+from apps.users.models import User
+from apps.orders.models import Order
+from apps.platforms.models import Product
+from apps.affiliate.models import Affiliate, Commission
+
+
+def period_filters(field, today=None):
+    """Q objects for the rolling windows shown on the dashboard"""
+    today = today or timezone.now().date()
+    return {
+        'today': Q(**{f'{field}__date': today}),
+        '7d': Q(**{f'{field}__date__gte': today - timedelta(days=7)}),
+        '30d': Q(**{f'{field}__date__gte': today - timedelta(days=30)}),
+    }
+
+
+def _aggregate(queryset, **expressions):
+    # Sum() over no rows is None; the dashboard wants 0
+    return {key: value or 0 for key, value in queryset.aggregate(**expressions).items()}
+
+
+def user_metrics(today=None):
+    expressions = {'total_users': Count('id')}
+    for period, condition in period_filters('date_joined', today).items():
+        expressions[f'new_users_{period}'] = Count('id', filter=condition)
+    return _aggregate(User.objects.all(), **expressions)
+
+
+def order_metrics(today=None):
+    paid = Q(payment_status='paid')
+    expressions = {
+        'total_orders': Count('id'),
+        'total_revenue': Sum('total', filter=paid),
+    }
+    for period, condition in period_filters('created_at', today).items():
+        expressions[f'orders_{period}'] = Count('id', filter=condition)
+        expressions[f'revenue_{period}'] = Sum('total', filter=paid & condition)
+    return _aggregate(Order.objects.all(), **expressions)
+
+
+def product_metrics():
+    return _aggregate(
+        Product.objects.all(),
+        total_products=Count('id'),
+        active_products=Count('id', filter=Q(is_active=True)),
+    )
+
+
+def commission_metrics(affiliate=None):
+    commissions = Commission.objects.all()
+    if affiliate is not None:
+        commissions = commissions.filter(affiliate=affiliate)
+    return _aggregate(
+        commissions,
+        total_commissions=Sum('amount', filter=Q(status='paid')),
+        pending_commissions=Sum('amount', filter=Q(status='pending')),
+    )
+
+
+def affiliate_metrics():
+    return {'total_affiliates': Affiliate.objects.count(), **commission_metrics()}
+
+
+def sales_by_period(today=None):
+    """Paid revenue and order count since each period start, in one query"""
+    today = today or timezone.now().date()
+    starts = {
+        'today': today,
+        'yesterday': today - timedelta(days=1),
+        'last_7_days': today - timedelta(days=7),
+        'last_30_days': today - timedelta(days=30),
+        'this_month': today.replace(day=1),
+    }
+    expressions = {}
+    for period, start in starts.items():
+        condition = Q(created_at__date__gte=start)
+        expressions[f'{period}__revenue'] = Sum('total', filter=condition)
+        expressions[f'{period}__orders'] = Count('id', filter=condition)
+    row = Order.objects.filter(payment_status='paid').aggregate(**expressions)
+    return {
+        period: {
+            'revenue': row[f'{period}__revenue'],
+            'orders': row[f'{period}__orders'],
+        }
+        for period in starts
+    }
+
+
+def dashboard_metrics(today=None):
+    """Everything the analytics dashboard headline cards need"""
+    return {
+        **user_metrics(today),
+        **order_metrics(today),
+        **product_metrics(),
+        **affiliate_metrics(),
+    }
@@ -9,4 +9,6 @@ urlpatterns = [
     path('users/', analytics_views.user_analytics, name='user-analytics'),
     path('sales/', analytics_views.sales_analytics, name='sales-analytics'),
     path('affiliates/', analytics_views.affiliate_analytics, name='affiliate-analytics'),
+    path('export/<slug:dataset>/', analytics_views.export_data, name='analytics-export'),
+    path('profile/', analytics_views.profiling_report, name='analytics-profile'),
 ]
@@ -2,17 +2,20 @@
 Analytics & Tracking Views for Zero To Hero
 """
 import json
+from django.conf import settings
 from django.shortcuts import render
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.db.models import Count, Sum, Avg, F
-from django.db.models.functions import TruncDate, TruncMonth
 from django.utils import timezone
 from django.core.serializers.json import DjangoJSONEncoder
 from datetime import datetime, timedelta
 from apps.users.models import User
 from apps.orders.models import Order
+from apps.orders import ledger
 from apps.platforms.models import Product, Platform
 from apps.affiliate.models import Affiliate, Commission
+from . import analytics, exports, metrics, profiling, rollups
 
 
 def is_staff_or_admin(user):
@@ -31,129 +34,59 @@ def analytics_dashboard(request):
     last_30_days = today - timedelta(days=30)
     last_90_days = today - timedelta(days=90)
     
-    # ===== USER STATISTICS =====
-    total_users = User.objects.count()
-    new_users_today = User.objects.filter(date_joined__date=today).count()
-    new_users_7d = User.objects.filter(date_joined__date__gte=last_7_days).count()
-    new_users_30d = User.objects.filter(date_joined__date__gte=last_30_days).count()
+    # ===== HEADLINE METRICS =====
+    # One aggregate per table: users, orders, products, affiliates, commissions
+    headline = analytics.dashboard_metrics(today)
     
     # User type distribution
     user_types = User.objects.values('user_type').annotate(count=Count('id'))
     
-    # ===== ORDER STATISTICS =====
-    total_orders = Order.objects.count()
-    orders_today = Order.objects.filter(created_at__date=today).count()
-    orders_7d = Order.objects.filter(created_at__date__gte=last_7_days).count()
-    orders_30d = Order.objects.filter(created_at__date__gte=last_30_days).count()
-    
-    # Revenue statistics
-    total_revenue = Order.objects.filter(payment_status='paid').aggregate(
-        total=Sum('total')
-    )['total'] or 0
-    
-    revenue_today = Order.objects.filter(
-        payment_status='paid',
-        created_at__date=today
-    ).aggregate(total=Sum('total'))['total'] or 0
-    
-    revenue_7d = Order.objects.filter(
-        payment_status='paid',
-        created_at__date__gte=last_7_days
-    ).aggregate(total=Sum('total'))['total'] or 0
-    
-    revenue_30d = Order.objects.filter(
-        payment_status='paid',
-        created_at__date__gte=last_30_days
-    ).aggregate(total=Sum('total'))['total'] or 0
-    
     # ===== PRODUCT STATISTICS =====
-    total_products = Product.objects.count()
-    active_products = Product.objects.filter(is_active=True).count()
-    
     # Top selling products
     top_products = Product.objects.annotate(
         order_count=Count('orderitem')
     ).order_by('-order_count')[:10]
     
     # ===== PLATFORM STATISTICS =====
-    platform_stats = Platform.objects.annotate(
-        product_count=Count('products'),
-        order_count=Count('products__orderitem')
+    # Sales come from the ledger, not a join through every order item
+    platform_stats = ledger.with_sales(
+        Platform.objects.annotate(product_count=Count('products'))
     ).order_by('-order_count')
     
-    # ===== AFFILIATE STATISTICS =====
-    total_affiliates = Affiliate.objects.count()
-    total_commissions = Commission.objects.filter(status='paid').aggregate(
-        total=Sum('amount')
-    )['total'] or 0
-    
-    pending_commissions = Commission.objects.filter(status='pending').aggregate(
-        total=Sum('amount')
-    )['total'] or 0
-    
     # ===== CHART DATA =====
+    # Read from the DailyMetric rollups (see rollup_metrics), not the order table
+    rollups.refresh()
     # Daily orders for last 30 days
-    daily_orders = Order.objects.filter(
-        created_at__date__gte=last_30_days
-    ).annotate(
-        date=TruncDate('created_at')
-    ).values('date').annotate(
-        count=Count('id'),
-        revenue=Sum('total')
-    ).order_by('date')
+    daily_orders = rollups.daily(last_30_days).annotate(
+        count=F('orders')
+    ).values('date', 'count', 'revenue')
     
     # Monthly revenue for last 6 months
     six_months_ago = today - timedelta(days=180)
-    monthly_revenue = Order.objects.filter(
-        payment_status='paid',
-        created_at__date__gte=six_months_ago
-    ).annotate(
-        month=TruncMonth('created_at')
-    ).values('month').annotate(
-        revenue=Sum('total'),
-        orders=Count('id')
-    ).order_by('month')
+    monthly_revenue = rollups.monthly(
+        six_months_ago,
+        revenue=Sum('paid_revenue'),
+        orders=Sum('paid_orders'),
+    )
     
     # Serialize data for JavaScript
     daily_orders_json = json.dumps(list(daily_orders), cls=DjangoJSONEncoder)
     user_types_json = json.dumps(list(user_types), cls=DjangoJSONEncoder)
     
     context = {
-        # User stats
-        'total_users': total_users,
-        'new_users_today': new_users_today,
-        'new_users_7d': new_users_7d,
-        'new_users_30d': new_users_30d,
+        # User, order, revenue, product & affiliate headline stats
+        **headline,
         'user_types': user_types_json,
         
-        # Order stats
-        'total_orders': total_orders,
-        'orders_today': orders_today,
-        'orders_7d': orders_7d,
-        'orders_30d': orders_30d,
-        
-        # Revenue stats
-        'total_revenue': total_revenue,
-        'revenue_today': revenue_today,
-        'revenue_7d': revenue_7d,
-        'revenue_30d': revenue_30d,
-        
         # Product stats
-        'total_products': total_products,
-        'active_products': active_products,
         'top_products': top_products,
         
         # Platform stats
         'platform_stats': platform_stats,
         
-        # Affiliate stats
-        'total_affiliates': total_affiliates,
-        'total_commissions': total_commissions,
-        'pending_commissions': pending_commissions,
-        
         # Chart data
         'daily_orders': daily_orders_json,
-        'monthly_revenue': json.dumps(list(monthly_revenue), cls=DjangoJSONEncoder),
+        'monthly_revenue': json.dumps(monthly_revenue, cls=DjangoJSONEncoder),
         
         # Date range
         'date_range': f'{last_30_days} to {today}',
@@ -168,11 +101,8 @@ def user_analytics(request):
     """Detailed User Analytics"""
     
     # User growth over time
-    user_growth = User.objects.annotate(
-        month=TruncMonth('date_joined')
-    ).values('month').annotate(
-        count=Count('id')
-    ).order_by('month')
+    rollups.refresh()
+    user_growth = rollups.monthly(count=Sum('signups'))
     
     # Active users (logged in within last 30 days)
     last_30_days = timezone.now() - timedelta(days=30)
@@ -184,7 +114,7 @@ def user_analytics(request):
     ).filter(order_count__gte=2).count()
     
     context = {
-        'user_growth': list(user_growth),
+        'user_growth': user_growth,
         'active_users': active_users,
         'repeat_customers': repeat_customers,
     }
@@ -198,30 +128,10 @@ def sales_analytics(request):
     """Detailed Sales Analytics"""
     
     # Sales by platform
-    platform_sales = Platform.objects.annotate(
-        total_sales=Sum('products__orderitem__order__total'),
-        order_count=Count('products__orderitem__order')
-    ).order_by('-total_sales')
+    platform_sales = ledger.with_sales(Platform.objects.all()).order_by('-total_sales')
     
-    # Sales by date range
-    today = timezone.now().date()
-    date_ranges = {
-        'today': today,
-        'yesterday': today - timedelta(days=1),
-        'last_7_days': today - timedelta(days=7),
-        'last_30_days': today - timedelta(days=30),
-        'this_month': today.replace(day=1),
-    }
-    
-    sales_by_period = {}
-    for period, start_date in date_ranges.items():
-        sales_by_period[period] = Order.objects.filter(
-            payment_status='paid',
-            created_at__date__gte=start_date
-        ).aggregate(
-            revenue=Sum('total'),
-            orders=Count('id')
-        )
+    # Sales by date range - one conditional aggregate for all periods
+    sales_by_period = analytics.sales_by_period()
     
     context = {
         'platform_sales': platform_sales,
@@ -249,16 +159,51 @@ def affiliate_analytics(request):
     )
     
     # Monthly affiliate growth
-    monthly_affiliates = Affiliate.objects.annotate(
-        month=TruncMonth('created_at')
-    ).values('month').annotate(
-        count=Count('id')
-    ).order_by('month')
+    rollups.refresh()
+    monthly_affiliates = rollups.monthly(count=Sum('affiliates_joined'))
     
     context = {
         'top_affiliates': top_affiliates,
         'commission_stats': commission_stats,
-        'monthly_affiliates': list(monthly_affiliates),
+        'monthly_affiliates': monthly_affiliates,
     }
     
     return render(request, 'admin/affiliate_analytics.html', context)
+
+
+@login_required
+@user_passes_test(is_staff_or_admin)
+def export_data(request, dataset):
+    """Stream orders / commissions / products as CSV or JSONL"""
+    if dataset not in exports.DATASETS:
+        raise Http404('Unknown export')
+    fmt = request.GET.get('format', 'csv')
+    if fmt not in exports.FORMATS:
+        fmt = 'csv'
+
+    response = StreamingHttpResponse(
+        exports.stream(dataset, request.GET, fmt),
+        content_type=exports.FORMATS[fmt],
+    )
+    filename = f"{dataset}-{timezone.now():%Y%m%d-%H%M}.{fmt}"
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+@login_required
+@user_passes_test(is_staff_or_admin)
+def profiling_report(request):
+    """Per-view query counts and timings from this worker's profiling buffer"""
+    limit = request.GET.get('recent', '50')
+    return JsonResponse({
+        'enabled': settings.PROFILING_ENABLED,
+        'views': profiling.summary(),
+        'recent': profiling.recent(int(limit) if limit.isdigit() else 50),
+    })
+
+
+def metrics_endpoint(request):
+    """Prometheus text exposition for all worker processes"""
+    if not metrics.authorized(request):
+        raise Http404
+    return HttpResponse(metrics.exposition(), content_type=metrics.CONTENT_TYPE_LATEST)
@@ -0,0 +1,283 @@
+"""
+Benchmarks for Zero To Hero
+
+Two suites, meant to be run against a seeded database (seed_bench):
+
+- Queries: the hot queries behind our list pages, dashboards and analytics,
+  built exactly as the views build them, so their EXPLAIN plans and timings
+  can be compared before and after a schema change (explain_queries).
+- Views: every GET-able URL in config/urls.py driven through the test
+  client, recording latency percentiles, query counts and response size
+  (bench_views). Reports are JSON so two commits can be compared.
+"""
+import re
+import statistics
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.models import Count, Sum
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.utils import timezone
+from apps.affiliate.models import Affiliate, Commission
+from apps.learning.models import GemCategory, HiddenGem, Roadmap
+from apps.orders.models import Order
+from apps.platforms.models import Platform, Product
+from apps.users.models import User
+from .models import BlogPost
+
+
+def _sample(model, **filters):
+    return model.objects.filter(**filters).order_by('pk').first()
+
+
+# ===== SAFETY =====
+
+NOT_PRODUCTION_FLAG = '--i-know-this-is-not-production'
+
+
+def add_safety_argument(parser):
+    parser.add_argument(
+        NOT_PRODUCTION_FLAG, action='store_true', dest='not_production',
+        help='Run even though DEBUG is off (the database must be disposable)',
+    )
+
+
+def check_not_production(options):
+    """seed_bench and bench_views write users and data; refuse outside DEBUG unless told otherwise"""
+    if not (settings.DEBUG or options.get('not_production')):
+        raise CommandError(
+            f'DEBUG is off, so this may be a production database. Pass {NOT_PRODUCTION_FLAG} '
+            'if it is a throwaway benchmark database.'
+        )
+
+
+# ===== QUERIES =====
+
+
+def queries():
+    """{name: queryset} for the hot filter paths, using sample rows for parameters"""
+    platform = _sample(Platform)
+    gem_category = _sample(GemCategory)
+    affiliate = _sample(Affiliate)
+    user_id = Order.objects.order_by('pk').values_list('user_id', flat=True).first()
+    month_ago = timezone.now() - timedelta(days=30)
+
+    return {
+        'platform_list': Platform.objects.filter(is_active=True)[:12],
+        'platform_hidden_gems': Platform.objects.filter(is_active=True, is_hidden_gem=True)[:12],
+        'product_list': Product.objects.filter(is_active=True)[:12],
+        'platform_products': Product.objects.filter(platform=platform, is_active=True)[:6],
+        'user_recent_orders': Order.objects.filter(user_id=user_id).order_by('-created_at')[:5],
+        'user_paid_total': Order.objects.filter(user_id=user_id, payment_status='paid').values('user').annotate(
+            total=Sum('total')
+        ),
+        'paid_orders_last_30_days': Order.objects.filter(
+            payment_status='paid', created_at__gte=month_ago
+        ).values('payment_status').annotate(count=Count('id'), revenue=Sum('total')),
+        'orders_changed_since': Order.objects.filter(updated_at__gte=month_ago).order_by().values('pk'),
+        'affiliate_commissions_by_status': Commission.objects.filter(affiliate=affiliate).values('status').annotate(
+            total=Sum('amount')
+        ).order_by(),
+        'blog_list': BlogPost.objects.filter(status='published').select_related('category')[:9],
+        'hidden_gems': HiddenGem.objects.filter(is_active=True)[:12],
+        'hidden_gems_category': HiddenGem.objects.filter(is_active=True, category=gem_category)[:12],
+    }
+
+
+# "USING [COVERING] INDEX x" (SQLite), "Index [Only] Scan [Backward] using x"
+# and "Bitmap Index Scan on x" (PostgreSQL)
+INDEX_PATTERN = re.compile(
+    r'USING (?:COVERING )?INDEX (\w+)|Index (?:Only )?Scan (?:Backward )?using (\w+)|Index Scan on (\w+)'
+)
+
+
+def indexes_used(plan):
+    return sorted({name for match in INDEX_PATTERN.findall(plan) for name in match if name})
+
+
+def measure(queryset, runs=5, analyze=False):
+    """EXPLAIN plan plus median wall time (ms) of evaluating the queryset"""
+    options = {'analyze': True} if analyze and connection.vendor == 'postgresql' else {}
+    plan = queryset.explain(**options)
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        list(queryset.all())
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        'plan': plan,
+        'indexes': indexes_used(plan),
+        'median_ms': round(statistics.median(timings), 3),
+    }
+
+
+def run(names=None, runs=5, analyze=False):
+    """{name: measure()} for every benchmark query (or just `names`)"""
+    return {
+        name: measure(queryset, runs=runs, analyze=analyze)
+        for name, queryset in queries().items()
+        if not names or name in names
+    }
+
+
+# ===== VIEWS =====
+
+# Views that change state, take payment, or need a token; never benchmarked
+SKIP_VIEWS = {
+    'add-to-cart', 'remove-from-cart', 'update-cart', 'clear-cart',
+    'process-payment', 'payment-success', 'stripe-webhook',
+    'razorpay-checkout', 'razorpay-verify', 'razorpay-webhook',
+    'logout', 'password-reset-confirm',
+}
+SKIP_NAMESPACES = {'admin'}
+
+# Which client each URL prefix needs; everything else runs anonymously
+AUTH_PREFIXES = [
+    ('/analytics/', 'staff'),
+    ('/users/', 'user'),
+    ('/cart/', 'user'),
+    ('/payments/', 'user'),
+]
+
+BENCH_STAFF = 'bench-staff'
+
+
+def _url_kwargs():
+    """Sample URL arguments per URL name, from existing rows"""
+    samples = {
+        'blog_detail': lambda: {'slug': _sample(BlogPost, status='published').slug},
+        'product_detail': lambda: {'slug': _sample(Product, is_active=True).slug},
+        'platform_detail': lambda: {'slug': _sample(Platform, is_active=True).slug},
+        'platform-single': lambda: {'id': _sample(Platform, is_active=True).pk},
+        'hidden-gem-detail': lambda: {'slug': _sample(HiddenGem, is_active=True).slug},
+        'roadmap-single': lambda: {'slug': _sample(Roadmap, is_active=True).slug},
+        'analytics-export': lambda: {'dataset': 'products'},
+    }
+    kwargs = {}
+    for name, sample in samples.items():
+        try:
+            kwargs[name] = sample()
+        except AttributeError:
+            # No row to point at; the view is reported as skipped
+            pass
+    return kwargs
+
+
+def _walk(patterns, namespace=None):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _walk(pattern.url_patterns, pattern.namespace or namespace)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            yield namespace, pattern
+
+
+def view_urls():
+    """([(name, path)], [(name, reason)]) for every named URL pattern"""
+    kwargs = _url_kwargs()
+    urls, skipped, seen = [], [], set()
+    for namespace, pattern in _walk(get_resolver().url_patterns):
+        name = pattern.name
+        if namespace in SKIP_NAMESPACES or name in SKIP_VIEWS:
+            continue
+        if pattern.pattern.converters or '<' in str(pattern.pattern):
+            if name not in kwargs:
+                skipped.append((name, 'no sample row'))
+                continue
+            path = reverse(name, kwargs=kwargs[name])
+        else:
+            path = reverse(name)
+        if path not in seen:
+            seen.add(path)
+            urls.append((name, path))
+    return urls, skipped
+
+
+def _clients(staff):
+    user = _sample(User, is_active=True, is_staff=False)
+    clients = {'anonymous': Client(raise_request_exception=False)}
+    for role, account in (('user', user), ('staff', staff)):
+        client = Client(raise_request_exception=False)
+        if account is not None:
+            client.force_login(account)
+        clients[role] = client
+    return clients
+
+
+def _percentile(timings, percent):
+    ordered = sorted(timings)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return round(ordered[index], 3)
+
+
+def _request(client, path):
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        response = client.get(path)
+        body = b''.join(response.streaming_content) if response.streaming else response.content
+        elapsed = (time.perf_counter() - started) * 1000
+    return response.status_code, elapsed, len(queries), len(body)
+
+
+def bench_view(client, path, runs=20, warmup=1):
+    """Latency percentiles (ms), query count and bytes for GET path"""
+    for _ in range(warmup):
+        _request(client, path)
+    timings, queries = [], []
+    for _ in range(runs):
+        status, elapsed, query_count, size = _request(client, path)
+        timings.append(elapsed)
+        queries.append(query_count)
+    return {
+        'status': status,
+        'p50_ms': _percentile(timings, 50),
+        'p90_ms': _percentile(timings, 90),
+        'p99_ms': _percentile(timings, 99),
+        'queries': max(queries),
+        'bytes': size,
+    }
+
+
+def run_views(only=None, runs=20, warmup=1):
+    """{'views': {path: result}, 'skipped': {name: reason}}"""
+    # A staff account for the analytics pages, only for the length of the run
+    staff, _ = User.objects.get_or_create(
+        username=BENCH_STAFF,
+        defaults={'email': f'{BENCH_STAFF}@example.com', 'is_staff': True, 'password': make_password(None)},
+    )
+    try:
+        clients = _clients(staff)
+        urls, skipped = view_urls()
+        results = {}
+        for name, path in urls:
+            if only and name not in only and path not in only:
+                continue
+            role = next((role for prefix, role in AUTH_PREFIXES if path.startswith(prefix)), 'anonymous')
+            results[path] = {'name': name, 'as': role, **bench_view(clients[role], path, runs, warmup)}
+    finally:
+        staff.delete()
+    return {'views': results, 'skipped': dict(skipped)}
+
+
+def compare(current, baseline, tolerance=0.2, min_ms=2.0):
+    """
+    Regressions of `current` against a `baseline` report: more queries, or a
+    p50 slower by more than `tolerance` (a fraction) and at least `min_ms`.
+    """
+    regressions = []
+    for path, result in current['views'].items():
+        before = baseline.get('views', {}).get(path)
+        if not before:
+            continue
+        if result['queries'] > before['queries']:
+            regressions.append((path, f"queries {before['queries']} -> {result['queries']}"))
+        slower = result['p50_ms'] - before['p50_ms']
+        if slower > min_ms and slower > before['p50_ms'] * tolerance:
+            regressions.append((path, f"p50 {before['p50_ms']:.1f} -> {result['p50_ms']:.1f} ms"))
+        if result['status'] != before['status']:
+            regressions.append((path, f"status {before['status']} -> {result['status']}"))
+    return regressions
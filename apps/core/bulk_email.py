@@ -0,0 +1,165 @@
+"""
+Bulk Email for Zero To Hero
+
+Sends one template to many users without paying a TLS handshake per
+recipient. Recipients are streamed from the database, the template is
+rendered once per variant (by default the user type) and personalised with
+cheap $placeholder substitution, and messages go out in chunks over a small
+pool of persistent SMTP connections, one per sender thread.
+
+Transactional mail (welcome, order, password reset) still goes through the
+outbox; this path is for announcements and marketing sends.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from string import Template
+from django.conf import settings
+from django.core import mail
+from django.db.models import Q
+from django.template.loader import render_to_string
+from django.utils.html import escape, strip_tags
+from apps.users.models import User
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# Per-recipient fields available as $placeholders in the rendered template
+RECIPIENT_FIELDS = ['email', 'first_name', 'last_name', 'username', 'user_type']
+
+
+def marketing_recipients():
+    """Active users who opted in via their profile or dashboard settings"""
+    return (
+        User.objects.filter(is_active=True)
+        .exclude(email='')
+        .filter(Q(profile__marketing_emails=True) | Q(settings__email_promotions=True))
+        .order_by('pk')
+        .values(*RECIPIENT_FIELDS)
+    )
+
+
+def all_recipients():
+    return User.objects.filter(is_active=True).exclude(email='').order_by('pk').values(*RECIPIENT_FIELDS)
+
+
+class _Renderer:
+    """Renders the template once per variant and personalises per recipient"""
+
+    def __init__(self, template_name, subject, context, variant):
+        self.template_name = template_name
+        self.subject = Template(subject)
+        self.context = context or {}
+        self.variant = variant
+        self.variants = {}
+
+    def _render(self, key):
+        html = render_to_string(self.template_name, {**self.context, 'variant': key})
+        return Template(html), Template(strip_tags(html))
+
+    def __call__(self, recipient):
+        key = self.variant(recipient) if self.variant else None
+        if key not in self.variants:
+            self.variants[key] = self._render(key)
+        html, text = self.variants[key]
+        values = {field: recipient.get(field) or '' for field in RECIPIENT_FIELDS}
+        if not values['first_name']:
+            values['first_name'] = values['username']
+        return (
+            self.subject.safe_substitute(values),
+            text.safe_substitute(values),
+            html.safe_substitute({field: escape(value) for field, value in values.items()}),
+        )
+
+
+class _ConnectionPool:
+    """One persistent connection per sender thread, closed at the end"""
+
+    def __init__(self):
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.connections = []
+
+    def get(self):
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            # fail_silently: send_messages() then reports how many went out
+            connection = mail.get_connection(fail_silently=True)
+            self.local.connection = connection
+            with self.lock:
+                self.connections.append(connection)
+        return connection
+
+    def close(self):
+        for connection in self.connections:
+            connection.close()
+
+
+def _send_chunk(pool, messages):
+    connection = pool.get()
+    connection.open()
+    sent = connection.send_messages(messages) or 0
+    if sent < len(messages):
+        # A failure often means a dropped connection; reconnect next chunk
+        connection.close()
+    return sent
+
+
+def send_bulk(template_name, subject, recipients, context=None,
+              variant=lambda recipient: recipient['user_type'],
+              from_email=None, connections=3, chunk_size=50, dry_run=False):
+    """
+    Send template_name to every recipient in a values() queryset of
+    RECIPIENT_FIELDS, such as marketing_recipients().
+    Returns stats: recipients, sent, failed, variants, seconds, per_second.
+    """
+    from_email = from_email or settings.DEFAULT_FROM_EMAIL
+    render = _Renderer(template_name, subject, context, variant)
+    pool = _ConnectionPool()
+    stats = {'recipients': 0, 'sent': 0, 'failed': 0}
+    started = time.monotonic()
+
+    # Bound the chunks waiting on the pool so a large audience isn't
+    # rendered into memory faster than it can be sent
+    in_flight = threading.BoundedSemaphore(connections * 2)
+    futures = []
+
+    def submit(executor, chunk):
+        in_flight.acquire()
+        future = executor.submit(_send_chunk, pool, chunk)
+        future.add_done_callback(lambda _: in_flight.release())
+        futures.append((future, len(chunk)))
+
+    with ThreadPoolExecutor(max_workers=connections, thread_name_prefix='bulk-email') as executor:
+        chunk = []
+        for recipient in recipients.iterator(chunk_size=1000):
+            stats['recipients'] += 1
+            subject_line, text, html = render(recipient)
+            if dry_run:
+                continue
+            message = mail.EmailMultiAlternatives(subject_line, text, from_email, [recipient['email']])
+            message.attach_alternative(html, 'text/html')
+            chunk.append(message)
+            if len(chunk) >= chunk_size:
+                submit(executor, chunk)
+                chunk = []
+        if chunk:
+            submit(executor, chunk)
+
+    pool.close()
+    for future, size in futures:
+        try:
+            sent = future.result()
+        except Exception:
+            logger.exception('Bulk email chunk failed')
+            sent = 0
+        stats['sent'] += sent
+        stats['failed'] += size - sent
+
+    metrics.email('sent', kind='bulk', count=stats['sent'])
+    metrics.email('failed', kind='bulk', count=stats['failed'])
+    stats['variants'] = len(render.variants)
+    stats['seconds'] = round(time.monotonic() - started, 2)
+    stats['per_second'] = round(stats['recipients'] / stats['seconds'], 1) if stats['seconds'] else stats['recipients']
+    return stats
@@ -0,0 +1,123 @@
+"""
+Model Caching for Zero To Hero
+
+Low-level caching for small, rarely changing tables (site settings, founder,
+categories). Every watched model has a version number in the cache; keys for
+its cached rows include that version, and the post_save / post_delete
+receivers connected by watch() bump it, so a change makes every cached read
+of that model miss at once without tracking individual keys.
+
+    categories = caching.cached_queryset(PlatformCategory.objects.all())
+    settings = caching.cached_get(SiteSettings)          # objects.first()
+    settings = caching.singleton(SiteSettings)           # same, memoised per process
+
+Models must be passed to watch() at startup (apps.core.signals does this)
+in every process that writes them, or their versions will not move.
+"""
+import hashlib
+import threading
+import time
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+
+CACHE_PREFIX = 'core:cache:'
+CACHE_TIMEOUT = 60 * 60
+
+_MISSING = object()
+
+# Per-process copies of singleton rows: {label: (version, obj)}
+_singletons = {}
+_singletons_lock = threading.Lock()
+
+
+def _label(model):
+    return model._meta.label_lower
+
+
+# ===== VERSIONS =====
+
+def version(model):
+    key = f'{CACHE_PREFIX}version:{_label(model)}'
+    current = cache.get(key)
+    if current is None:
+        cache.add(key, int(time.time()), None)
+        current = cache.get(key, 0)
+    return current
+
+
+def bump(model):
+    key = f'{CACHE_PREFIX}version:{_label(model)}'
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time()), None)
+
+
+def _bump_sender(sender, **kwargs):
+    bump(sender)
+
+
+def watch(*models):
+    """Bump a model's version whenever one of its rows is saved or deleted"""
+    for model in models:
+        uid = f'core.caching:{_label(model)}'
+        post_save.connect(_bump_sender, sender=model, dispatch_uid=uid)
+        post_delete.connect(_bump_sender, sender=model, dispatch_uid=uid)
+
+
+def key(model, name, depends_on=()):
+    versions = '.'.join(str(version(m)) for m in (model, *depends_on))
+    return f'{CACHE_PREFIX}{_label(model)}:{versions}:{name}'
+
+
+# ===== READS =====
+
+def cached_queryset(queryset, name=None, depends_on=(), timeout=CACHE_TIMEOUT):
+    """
+    The queryset's rows as a list, cached until its model (or any model in
+    depends_on, for querysets that join or filter on other tables) changes.
+    """
+    if name is None:
+        sql, params = queryset.query.sql_with_params()
+        name = hashlib.md5(f'{sql}{params}'.encode()).hexdigest()
+    cache_key = key(queryset.model, name, depends_on)
+    rows = cache.get(cache_key)
+    if rows is None:
+        rows = list(queryset)
+        cache.set(cache_key, rows, timeout)
+    return rows
+
+
+def cached_get(model, name='first', getter=None, depends_on=(), timeout=CACHE_TIMEOUT):
+    """
+    A single row (or None), cached until the model (or any model in
+    depends_on) changes. By default the model's first row; pass getter for
+    anything else.
+    """
+    cache_key = key(model, name, depends_on)
+    obj = cache.get(cache_key, _MISSING)
+    if obj is _MISSING:
+        obj = getter() if getter else model.objects.first()
+        # None is cached too, so an empty table isn't queried every time
+        cache.set(cache_key, obj, timeout)
+    return obj
+
+
+def singleton(model):
+    """
+    The model's only row, kept in process memory and reloaded (from the shared
+    cache, or the database) when its version moves. A hit costs one cache
+    read of the version and no query. With no row yet, an unsaved instance
+    with the field defaults is returned.
+    """
+    label = _label(model)
+    current = version(model)
+    memo = _singletons.get(label)
+    if memo and memo[0] == current:
+        return memo[1]
+    obj = cached_get(model)
+    if obj is None:
+        obj = model()
+    with _singletons_lock:
+        _singletons[label] = (current, obj)
+    return obj
@@ -1,6 +1,9 @@
 # apps/core/context_processors.py
 
 from django.conf import settings
+from django.utils.functional import SimpleLazyObject, lazy
+from . import caching
+from .models import SiteSettings
 
 
 def google_analytics(request):
@@ -11,8 +14,14 @@ def google_analytics(request):
 
 
 def site_settings(request):
-    """Add site-wide settings to template context"""
+    """
+    Add site-wide settings to template context. Everything is lazy, so pages
+    that don't use them pay nothing; pages that do read the per-process copy
+    of SiteSettings (no query).
+    """
+    site = SimpleLazyObject(lambda: caching.singleton(SiteSettings))
     return {
-        'SITE_NAME': 'Zero To Hero',
-        'SITE_URL': request.build_absolute_uri('/'),
+        'site_settings': site,
+        'SITE_NAME': lazy(lambda: site.site_name, str)(),
+        'SITE_URL': lazy(request.build_absolute_uri, str)('/'),
     }
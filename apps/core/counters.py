@@ -0,0 +1,102 @@
+"""
+View Counters for Zero To Hero
+
+Page views are buffered in process and written back in batches as
+UPDATE ... SET views = views + n. Detail pages therefore do no writes on the
+request path, concurrent workers never lose increments, and updated_at is
+left alone.
+
+A daemon thread flushes the buffer every VIEW_COUNTER_FLUSH_INTERVAL seconds.
+Whatever is left is drained at interpreter exit and by gunicorn.conf.py's
+worker_exit hook. The buffer belongs to the worker process, so it can only
+be flushed from inside that process. Setting the interval to 0 writes each
+increment straight through instead.
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_pending = defaultdict(Counter)  # (model label, field) -> {pk: increment}
+_flusher = None
+
+
+def _interval():
+    return getattr(settings, 'VIEW_COUNTER_FLUSH_INTERVAL', 30)
+
+
+def increment(instance, field='views', amount=1):
+    """Count `amount` views for instance without touching the database"""
+    model = type(instance)
+    if _interval() <= 0:
+        model._base_manager.filter(pk=instance.pk).update(**{field: F(field) + amount})
+        return
+
+    with _lock:
+        _pending[(model._meta.label, field)][instance.pk] += amount
+    _ensure_flusher()
+
+
+def pending_count():
+    with _lock:
+        return sum(sum(counts.values()) for counts in _pending.values())
+
+
+def flush():
+    """Write buffered increments, one UPDATE per distinct increment size"""
+    with _lock:
+        pending = dict(_pending)
+        _pending.clear()
+
+    flushed = 0
+    for (label, field), counts in pending.items():
+        model = apps.get_model(label)
+        by_amount = defaultdict(list)
+        for pk, amount in counts.items():
+            by_amount[amount].append(pk)
+
+        for amount, pks in by_amount.items():
+            try:
+                model._base_manager.filter(pk__in=pks).update(**{field: F(field) + amount})
+            except Exception:
+                logger.exception('Failed to flush %s.%s counters, keeping them buffered', label, field)
+                with _lock:
+                    for pk in pks:
+                        _pending[(label, field)][pk] += amount
+                continue
+            flushed += amount * len(pks)
+    return flushed
+
+
+# ===== BACKGROUND FLUSHER =====
+
+def _run():
+    while True:
+        time.sleep(_interval())
+        try:
+            flush()
+        finally:
+            # This thread owns its connection; don't keep it open between flushes
+            connections.close_all()
+
+
+def _ensure_flusher():
+    global _flusher
+    # is_alive() is False in a freshly forked worker, so each process gets its own
+    if _flusher is not None and _flusher.is_alive():
+        return
+    with _lock:
+        if _flusher is None or not _flusher.is_alive():
+            _flusher = threading.Thread(target=_run, name='view-counter-flusher', daemon=True)
+            _flusher.start()
+
+
+atexit.register(flush)
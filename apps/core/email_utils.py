@@ -1,7 +1,10 @@
 """
 Email Utility Functions for Zero To Hero
+
+Messages go through the outbox (apps.core.outbox): send_mail() here queues
+the email and returns immediately; the email_worker command delivers it.
 """
-from django.core.mail import send_mail, EmailMultiAlternatives
+from .outbox import send_mail
 from django.template.loader import render_to_string
 from django.conf import settings
 from django.utils.html import strip_tags
@@ -0,0 +1,136 @@
+"""
+Data Exports for Zero To Hero
+
+Streams orders, commissions and products as CSV or JSON lines. Rows are read
+with values_list().iterator(), which uses a server-side cursor on PostgreSQL,
+and written out one line at a time, so memory stays flat however many rows
+are exported. Used by the staff export views and the export_data command.
+"""
+import csv
+from django.core.serializers.json import DjangoJSONEncoder
+from apps.orders.filters import filter_by_dates, filter_orders
+from apps.orders.models import Order
+from apps.platforms.models import Product
+from apps.affiliate.models import Commission
+
+CHUNK_SIZE = 2000
+
+FORMATS = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson',
+}
+
+# Spreadsheets run a cell starting with one of these as a formula
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+# ===== DATASETS =====
+# Each dataset: (queryset builder taking the filter params, [(header, lookup)])
+
+def _orders(params):
+    return filter_orders(Order.objects.order_by('pk'), params)
+
+
+def _commissions(params):
+    commissions = Commission.objects.order_by('pk')
+    if params.get('status'):
+        commissions = commissions.filter(status=params['status'])
+    return filter_by_dates(commissions, params)
+
+
+def _products(params):
+    products = Product.objects.order_by('pk')
+    if params.get('status') in ('active', 'inactive'):
+        products = products.filter(is_active=params['status'] == 'active')
+    if params.get('search'):
+        products = products.filter(name__icontains=params['search'])
+    return filter_by_dates(products, params)
+
+
+DATASETS = {
+    'orders': (_orders, [
+        ('id', 'id'),
+        ('order_number', 'order_number'),
+        ('user', 'user__username'),
+        ('email', 'user__email'),
+        ('guest_email', 'guest_email'),
+        ('subtotal', 'subtotal'),
+        ('discount', 'discount'),
+        ('total', 'total'),
+        ('commission_total', 'commission_total'),
+        ('affiliate_commission', 'affiliate_commission'),
+        ('affiliate_code', 'affiliate_code'),
+        ('payment_method', 'payment_method'),
+        ('payment_id', 'payment_id'),
+        ('payment_status', 'payment_status'),
+        ('order_status', 'order_status'),
+        ('created_at', 'created_at'),
+        ('paid_at', 'paid_at'),
+    ]),
+    'commissions': (_commissions, [
+        ('id', 'id'),
+        ('affiliate', 'affiliate__referral_code'),
+        ('affiliate_user', 'affiliate__user__username'),
+        ('order_number', 'order__order_number'),
+        ('platform', 'platform__name'),
+        ('product', 'product__name'),
+        ('amount', 'amount'),
+        ('rate', 'rate'),
+        ('status', 'status'),
+        ('created_at', 'created_at'),
+        ('paid_at', 'paid_at'),
+    ]),
+    'products': (_products, [
+        ('id', 'id'),
+        ('slug', 'slug'),
+        ('name', 'name'),
+        ('platform', 'platform__slug'),
+        ('category', 'category__slug'),
+        ('product_type', 'product_type'),
+        ('difficulty', 'difficulty'),
+        ('original_price', 'original_price'),
+        ('our_price', 'our_price'),
+        ('commission_rate', 'commission_rate'),
+        ('commission_amount', 'commission_amount'),
+        ('is_free', 'is_free'),
+        ('is_active', 'is_active'),
+        ('created_at', 'created_at'),
+    ]),
+}
+
+
+class _Echo:
+    """File-like object whose write() hands the line back to csv.writer's caller"""
+
+    def write(self, value):
+        return value
+
+
+def csv_cell(value):
+    """Neutralise user-supplied text that a spreadsheet would evaluate"""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def rows(name, params):
+    """Header list and a lazy iterator of value tuples for a dataset"""
+    build, columns = DATASETS[name]
+    headers = [header for header, _ in columns]
+    queryset = build(params).values_list(*[lookup for _, lookup in columns])
+    return headers, queryset.iterator(chunk_size=CHUNK_SIZE)
+
+
+def stream(name, params, fmt='csv'):
+    """Yield the export line by line"""
+    headers, values = rows(name, params)
+    if fmt == 'csv':
+        writer = csv.writer(_Echo())
+        yield writer.writerow(headers)
+        for row in values:
+            yield writer.writerow([csv_cell(value) for value in row])
+        return
+
+    encoder = DjangoJSONEncoder()
+    for row in values:
+        yield encoder.encode(dict(zip(headers, row))) + '\n'
@@ -0,0 +1,79 @@
+"""
+Home Page Cache for Zero To Hero
+
+The home page context is assembled from independently cached fragments, so a
+change to a hidden gem only rebuilds the fragments that show gems. Fragments
+are invalidated by the signals in apps.core.signals and expire after
+HOME_CACHE_TIMEOUT seconds regardless. A warm home page costs no queries.
+Site settings come from the site_settings context processor, not from here.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import CharField, Count, Value
+from apps.platforms.models import Platform, Product
+from apps.learning.models import HiddenGem
+
+CACHE_PREFIX = 'core:home:'
+
+
+def _featured_platforms():
+    return {
+        'featured_platforms': list(Platform.objects.filter(is_featured=True, is_active=True)[:4]),
+    }
+
+
+def _featured_gems():
+    return {
+        'featured_gems': list(HiddenGem.objects.filter(is_featured=True, is_active=True)[:4]),
+    }
+
+
+def _stats():
+    """Active platform / gem / product counts in a single round-trip"""
+    querysets = {
+        'total_platforms': Platform.objects.filter(is_active=True),
+        'total_hidden_gems': HiddenGem.objects.filter(is_active=True),
+        'total_products': Product.objects.filter(is_active=True),
+    }
+    # One COUNT per table, labelled and combined with UNION ALL
+    counts = [
+        queryset.order_by().values(stat=Value(name, output_field=CharField()))
+        .annotate(total=Count('pk')).values_list('stat', 'total')
+        for name, queryset in querysets.items()
+    ]
+    totals = dict(counts[0].union(*counts[1:], all=True))
+    return {name: totals.get(name, 0) for name in querysets}
+
+
+FRAGMENTS = {
+    'featured_platforms': _featured_platforms,
+    'featured_gems': _featured_gems,
+    'stats': _stats,
+}
+
+# Fragments that go stale when a row of the given model changes
+INVALIDATED_BY = {
+    Platform: ('featured_platforms', 'stats'),
+    Product: ('stats',),
+    HiddenGem: ('featured_gems', 'stats'),
+}
+
+
+def get_context():
+    """Home page context, rebuilding only the fragments missing from cache"""
+    keys = {name: CACHE_PREFIX + name for name in FRAGMENTS}
+    cached = cache.get_many(keys.values())
+
+    context, rebuilt = {}, {}
+    for name, key in keys.items():
+        if key not in cached:
+            cached[key] = rebuilt[key] = FRAGMENTS[name]()
+        context.update(cached[key])
+
+    if rebuilt:
+        cache.set_many(rebuilt, getattr(settings, 'HOME_CACHE_TIMEOUT', 300))
+    return context
+
+
+def invalidate(*names):
+    cache.delete_many([CACHE_PREFIX + name for name in names or FRAGMENTS])
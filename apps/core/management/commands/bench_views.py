@@ -0,0 +1,84 @@
+"""
+Benchmark every GET-able URL in config/urls.py through the test client.
+
+    python manage.py bench_views --output bench-main.json
+    python manage.py bench_views --compare bench-main.json --fail-on-regression
+
+Each URL gets a warm-up request and then --runs timed requests; the report
+records p50/p90/p99 latency, the number of queries and the response size.
+Dashboard and cart pages run as a regular user, analytics as a staff user
+(bench-staff, created for the run and deleted after it). Seed the database
+with seed_bench first. Refuses to run with DEBUG off unless
+--i-know-this-is-not-production is passed.
+"""
+import json
+import subprocess
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.utils import timezone
+from apps.core import benchmarks
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+class Command(BaseCommand):
+    help = 'Record latency percentiles, query counts and bytes for every public view'
+
+    def add_arguments(self, parser):
+        parser.add_argument('views', nargs='*', help='Only these URL names or paths (default: all)')
+        parser.add_argument('--runs', type=int, default=20, help='Timed requests per URL')
+        parser.add_argument('--warmup', type=int, default=1, help='Untimed requests per URL first')
+        parser.add_argument('--output', help='Write the report to this JSON file')
+        parser.add_argument('--compare', help='A previous --output report to compare against')
+        parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed p50 slowdown (fraction)')
+        parser.add_argument('--fail-on-regression', action='store_true')
+        benchmarks.add_safety_argument(parser)
+
+    def handle(self, *args, **options):
+        benchmarks.check_not_production(options)
+        # Allows the test client's host and keeps outgoing mail in memory
+        setup_test_environment()
+        try:
+            report = benchmarks.run_views(options['views'], runs=options['runs'], warmup=options['warmup'])
+        finally:
+            teardown_test_environment()
+        report.update({
+            'commit': _commit(),
+            'vendor': connection.vendor,
+            'runs': options['runs'],
+            'generated_at': timezone.now().isoformat(),
+        })
+
+        self.stdout.write(f"{'path':<42} {'as':<9} {'status':>6} {'p50':>8} {'p90':>8} {'p99':>8} {'queries':>7} {'bytes':>8}")
+        for path, result in report['views'].items():
+            self.stdout.write(
+                f"{path:<42} {result['as']:<9} {result['status']:>6} {result['p50_ms']:>8.2f} "
+                f"{result['p90_ms']:>8.2f} {result['p99_ms']:>8.2f} {result['queries']:>7} {result['bytes']:>8}"
+            )
+        for name, reason in report['skipped'].items():
+            self.stdout.write(self.style.WARNING(f'skipped {name}: {reason}'))
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as output:
+                json.dump(report, output, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"✅ Wrote {len(report['views'])} result(s) to {options['output']}"))
+
+        if options['compare']:
+            with open(options['compare'], encoding='utf-8') as baseline_file:
+                baseline = json.load(baseline_file)
+            regressions = benchmarks.compare(report, baseline, tolerance=options['tolerance'])
+            label = baseline.get('commit') or options['compare']
+            if not regressions:
+                self.stdout.write(self.style.SUCCESS(f'✅ No regressions against {label}'))
+            for path, change in regressions:
+                self.stdout.write(self.style.ERROR(f'❌ {path}: {change}'))
+            if regressions and options['fail_on_regression']:
+                raise CommandError(f'{len(regressions)} regression(s) against {label}')
@@ -0,0 +1,54 @@
+"""
+Deliver queued EmailOutbox messages (see apps.core.outbox).
+
+Runs until stopped, polling for due messages. The SMTP connection is kept
+open while there is mail to send and closed when the queue goes idle.
+SIGTERM (a deploy or restart) lets the current batch finish, then exits.
+Several workers can run at once; on PostgreSQL they claim disjoint rows.
+
+For local testing point EMAIL_HOST/EMAIL_PORT at any SMTP stand-in, e.g.
+EMAIL_HOST=localhost EMAIL_PORT=1025 EMAIL_USE_TLS=False with
+`python -m aiosmtpd -n -l localhost:1025`, and run with --once.
+"""
+import signal
+import threading
+from django.core import mail
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from apps.core import outbox
+
+
+class Command(BaseCommand):
+    help = 'Send queued emails from the outbox, retrying failures with backoff'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain the queue once and exit')
+        parser.add_argument('--batch-size', type=int, default=50)
+        parser.add_argument('--poll-interval', type=float, default=5, help='Seconds to sleep when idle')
+
+    def handle(self, *args, **options):
+        stopping = threading.Event()
+        signal.signal(signal.SIGTERM, lambda signum, frame: stopping.set())
+
+        connection = mail.get_connection()
+        total_sent = total_failed = 0
+        try:
+            while not stopping.is_set():
+                close_old_connections()
+                sent, failed = outbox.process(options['batch_size'], connection=connection)
+                total_sent += sent
+                total_failed += failed
+                if sent or failed:
+                    self.stdout.write(f'📧 Sent {sent}, failed {failed}')
+                    continue
+
+                connection.close()
+                if options['once']:
+                    break
+                stopping.wait(options['poll_interval'])
+        except KeyboardInterrupt:
+            pass
+        finally:
+            connection.close()
+
+        self.stdout.write(self.style.SUCCESS(f'✅ Outbox drained: {total_sent} sent, {total_failed} failed'))
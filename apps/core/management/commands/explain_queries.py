@@ -0,0 +1,53 @@
+"""
+Record EXPLAIN plans and timings for the hot queries in apps.core.benchmarks.
+
+    python manage.py explain_queries --output before.json
+    python manage.py migrate
+    python manage.py explain_queries --compare before.json --output after.json
+
+Run it against a seeded database (seed_bench) so the planner sees realistic
+table sizes. --analyze uses EXPLAIN ANALYZE on PostgreSQL.
+"""
+import json
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from apps.core import benchmarks
+
+
+class Command(BaseCommand):
+    help = 'Show EXPLAIN plans and median timings for the hot view queries'
+
+    def add_arguments(self, parser):
+        parser.add_argument('names', nargs='*', help='Only these queries (default: all)')
+        parser.add_argument('--runs', type=int, default=5, help='Timed runs per query')
+        parser.add_argument('--analyze', action='store_true', help='EXPLAIN ANALYZE (PostgreSQL)')
+        parser.add_argument('--output', help='Write the results to this JSON file')
+        parser.add_argument('--compare', help='A previous --output file to compare against')
+        parser.add_argument('--plans', action='store_true', help='Print the full plans')
+
+    def handle(self, *args, **options):
+        unknown = set(options['names']) - set(benchmarks.queries())
+        if unknown:
+            raise CommandError(f"Unknown queries: {', '.join(sorted(unknown))}")
+
+        previous = {}
+        if options['compare']:
+            with open(options['compare'], encoding='utf-8') as baseline:
+                previous = json.load(baseline)['queries']
+
+        results = benchmarks.run(options['names'], runs=options['runs'], analyze=options['analyze'])
+        for name, result in results.items():
+            indexes = ', '.join(result['indexes']) or 'no index'
+            line = f"{name:<34} {result['median_ms']:>9.3f} ms  {indexes}"
+            before = previous.get(name)
+            if before:
+                before_indexes = ', '.join(before['indexes']) or 'no index'
+                line += f"   (was {before['median_ms']:.3f} ms, {before_indexes})"
+            self.stdout.write(line)
+            if options['plans']:
+                self.stdout.write(result['plan'] + '\n')
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as output:
+                json.dump({'vendor': connection.vendor, 'queries': results}, output, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"✅ Wrote {len(results)} plan(s) to {options['output']}"))
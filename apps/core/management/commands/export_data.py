@@ -0,0 +1,47 @@
+"""
+Export orders, commissions or products as CSV / JSON lines (see apps.core.exports).
+
+    python manage.py export_data orders --date-from 2025-01-01 --status completed > orders.csv
+    python manage.py export_data commissions --format jsonl --output commissions.jsonl
+
+Filters match the dashboard orders page: --search, --status, --payment-status,
+--date-from and --date-to (YYYY-MM-DD). Rows are streamed, so memory use does
+not grow with the size of the export.
+"""
+import sys
+from django.core.management.base import BaseCommand
+from apps.core import exports
+
+
+class Command(BaseCommand):
+    help = 'Stream an orders / commissions / products export to a file or stdout'
+
+    def add_arguments(self, parser):
+        parser.add_argument('dataset', choices=exports.DATASETS)
+        parser.add_argument('--format', choices=exports.FORMATS, default='csv')
+        parser.add_argument('--output', default='-', help="File path, or '-' for stdout")
+        parser.add_argument('--search')
+        parser.add_argument('--status')
+        parser.add_argument('--payment-status')
+        parser.add_argument('--date-from')
+        parser.add_argument('--date-to')
+
+    def handle(self, *args, **options):
+        params = {
+            key: options[key]
+            for key in ('search', 'status', 'payment_status', 'date_from', 'date_to')
+            if options[key]
+        }
+        lines = exports.stream(options['dataset'], params, options['format'])
+
+        if options['output'] == '-':
+            for line in lines:
+                sys.stdout.write(line)
+            return
+
+        count = -1 if options['format'] == 'csv' else 0  # don't count the CSV header
+        with open(options['output'], 'w', newline='', encoding='utf-8') as output:
+            for line in lines:
+                output.write(line)
+                count += 1
+        self.stderr.write(self.style.SUCCESS(f"✅ Exported {count} {options['dataset']} to {options['output']}"))
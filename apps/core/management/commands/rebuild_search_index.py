@@ -0,0 +1,31 @@
+"""
+Rebuild the search index from scratch.
+
+Signals keep the index current for normal saves; run this after deploying
+migration 0002, after bulk imports, or after renaming categories.
+"""
+import time
+from django.core.management.base import BaseCommand
+from apps.core import search
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the search index for platforms, products and hidden gems'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--entity',
+            action='append',
+            choices=['platform', 'product', 'gem'],
+            help='Only rebuild this entity type (repeatable)',
+        )
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        counts = search.rebuild(entities=options['entity'], batch_size=options['batch_size'])
+        for entity, count in counts.items():
+            self.stdout.write(f'{entity}: {count} indexed')
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ Search index rebuilt in {time.monotonic() - started:.2f}s'
+        ))
@@ -0,0 +1,317 @@
+"""
+Fill a database with a realistic load-test dataset.
+
+    python manage.py seed_bench                 # 100k users, 1M orders, 5k products, 500 platforms
+    python manage.py seed_bench --scale 0.01    # 1% of that, for a quick local run
+
+Everything is written with bulk_create in batches, from a fixed random seed,
+so two runs at the same scale produce the same data. Rows that signals would
+normally maintain (sales ledger, rollups, product counts, search index,
+dashboard summaries) are rebuilt once at the end.
+
+Meant for a throwaway database: run it after migrate on an empty database,
+then point bench_views / explain_queries at it. Never run it in production;
+with DEBUG off it refuses unless --i-know-this-is-not-production is passed.
+"""
+import random
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from decimal import Decimal
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from apps.affiliate.models import Affiliate, Commission
+from apps.core import benchmarks
+from apps.orders.models import Order, OrderItem
+from apps.platforms.models import Platform, PlatformCategory, Product, ProductCategory
+from apps.users.models import Enrollment, User
+
+PREFIX = 'bench'
+
+VOLUMES = {
+    'platforms': 500,
+    'products': 5000,
+    'users': 100000,
+    'orders': 1000000,
+    'enrollments': 200000,
+}
+
+# Share of users with an affiliate account, and of orders referred by one
+AFFILIATE_SHARE = 0.02
+REFERRED_SHARE = 0.1
+
+PAYMENT_STATUSES = [('paid', 70), ('pending', 20), ('failed', 7), ('refunded', 3)]
+DAYS = 365
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """Let bulk_create store the created_at values we generate"""
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now_add', False)
+    ]
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+class Command(BaseCommand):
+    help = 'Generate a large, deterministic dataset for benchmarks and load tests'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=float, default=1.0, help='Multiply every volume by this')
+        for name, default in VOLUMES.items():
+            parser.add_argument(f'--{name}', type=int, help=f'Number of {name} (default {default} x scale)')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=42)
+        benchmarks.add_safety_argument(parser)
+
+    def handle(self, *args, **options):
+        benchmarks.check_not_production(options)
+        if User.objects.filter(username__startswith=f'{PREFIX}-').exists():
+            raise CommandError('This database already has bench data; seed a fresh database instead')
+
+        self.random = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.now = timezone.now()
+        volumes = {
+            name: options[name] if options[name] is not None else max(1, int(default * options['scale']))
+            for name, default in VOLUMES.items()
+        }
+
+        started = time.monotonic()
+        with explicit_timestamps(User, Order, OrderItem, Commission, Product, Platform, Affiliate, Enrollment):
+            platform_ids = self.seed_platforms(volumes['platforms'])
+            products = self.seed_products(volumes['products'], platform_ids)
+            user_ids = self.seed_users(volumes['users'])
+            affiliates = self.seed_affiliates(user_ids)
+            self.seed_orders(volumes['orders'], user_ids, products, affiliates)
+            self.seed_enrollments(volumes['enrollments'], user_ids, [product[0] for product in products])
+
+        self.rebuild_derived(platform_ids, user_ids)
+        self.stdout.write(self.style.SUCCESS(f'✅ Seeded bench data in {time.monotonic() - started:.1f}s'))
+
+    # ===== HELPERS =====
+
+    def moment(self):
+        """A random time within the last DAYS days"""
+        return self.now - timedelta(seconds=self.random.randrange(DAYS * 86400))
+
+    def create(self, model, rows):
+        """bulk_create an iterable of unsaved instances in batches"""
+        created, batch = 0, []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                created += len(self.flush(model, batch))
+                batch = []
+        if batch:
+            created += len(self.flush(model, batch))
+        self.stdout.write(f'{model.__name__}: {created}')
+        return created
+
+    def flush(self, model, batch):
+        with transaction.atomic():
+            return model.objects.bulk_create(batch, batch_size=self.batch_size)
+
+    # ===== CATALOGUE =====
+
+    def seed_platforms(self, count):
+        categories = [
+            PlatformCategory.objects.get_or_create(
+                slug=f'{PREFIX}-{name.lower()}', defaults={'name': name, 'order': index}
+            )[0]
+            for index, name in enumerate(['Cybersecurity', 'Programming', 'Data Science', 'Cloud', 'Design'])
+        ]
+        rng = self.random
+        self.create(Platform, (
+            Platform(
+                name=f'Bench Platform {i}',
+                slug=f'{PREFIX}-platform-{i}',
+                website=f'https://platform-{i}.example.com',
+                category=rng.choice(categories),
+                difficulty=rng.choice(['beginner', 'intermediate', 'advanced', 'all']),
+                description=f'<p>Benchmark platform {i}</p>',
+                commission_rate=Decimal(rng.choice([0, 3, 5, 7])),
+                is_hidden_gem=rng.random() < 0.1,
+                is_featured=rng.random() < 0.05,
+                is_active=rng.random() < 0.95,
+                created_at=self.moment(),
+            )
+            for i in range(count)
+        ))
+        return list(Platform.objects.filter(slug__startswith=f'{PREFIX}-').values_list('pk', flat=True))
+
+    def seed_products(self, count, platform_ids):
+        categories = [
+            ProductCategory.objects.get_or_create(slug=f'{PREFIX}-{name.lower()}', defaults={'name': name})[0]
+            for name in ['Course', 'Lab', 'Certification', 'Subscription']
+        ]
+        rng = self.random
+
+        def rows():
+            for i in range(count):
+                original = Decimal(rng.choice([0, 499, 999, 1999, 4999, 9999]))
+                rate = Decimal(rng.choice([0, 3, 5, 7]))
+                yield Product(
+                    platform_id=rng.choice(platform_ids),
+                    category=rng.choice(categories),
+                    name=f'Bench Course {i}',
+                    slug=f'{PREFIX}-product-{i}',
+                    description=f'<p>Benchmark course {i}</p>',
+                    original_price=original,
+                    our_price=(original * Decimal('0.94')).quantize(Decimal('0.01')),
+                    commission_rate=rate,
+                    commission_amount=original * rate / 100,
+                    product_type=rng.choice(['course', 'subscription', 'lab', 'certification']),
+                    difficulty=rng.choice(['beginner', 'intermediate', 'advanced', 'all']),
+                    is_free=not original,
+                    is_featured=rng.random() < 0.05,
+                    is_active=rng.random() < 0.95,
+                    created_at=self.moment(),
+                )
+
+        self.create(Product, rows())
+        return list(
+            Product.objects.filter(slug__startswith=f'{PREFIX}-', is_active=True)
+            .values_list('pk', 'name', 'platform__name', 'our_price', 'commission_rate')
+        )
+
+    # ===== PEOPLE =====
+
+    def seed_users(self, count):
+        password = make_password('bench-password')
+        rng = self.random
+        self.create(User, (
+            User(
+                username=f'{PREFIX}-user-{i}',
+                email=f'{PREFIX}-user-{i}@example.com',
+                first_name=f'User{i}',
+                password=password,
+                affiliate_code=f'BN{i:08d}',
+                user_type='student',
+                date_joined=self.moment(),
+                created_at=self.moment(),
+                is_active=rng.random() < 0.98,
+            )
+            for i in range(count)
+        ))
+        return list(User.objects.filter(username__startswith=f'{PREFIX}-').values_list('pk', flat=True))
+
+    def seed_affiliates(self, user_ids):
+        chosen = self.random.sample(user_ids, max(1, int(len(user_ids) * AFFILIATE_SHARE)))
+        User.objects.filter(pk__in=chosen).update(user_type='affiliate')
+        self.create(Affiliate, (
+            Affiliate(user_id=user_id, referral_code=f'BNREF{index:07d}', joined_at=self.moment())
+            for index, user_id in enumerate(chosen)
+        ))
+        return list(Affiliate.objects.filter(referral_code__startswith='BNREF').values_list('pk', 'referral_code'))
+
+    # ===== ORDERS =====
+
+    def seed_orders(self, count, user_ids, products, affiliates):
+        """Orders with 1-3 items each, plus commissions for referred orders"""
+        rng = self.random
+        statuses = [status for status, weight in PAYMENT_STATUSES for _ in range(weight)]
+        totals = {'orders': 0, 'items': 0, 'commissions': 0}
+
+        for start in range(0, count, self.batch_size):
+            orders, lines = [], []
+            for i in range(start, min(start + self.batch_size, count)):
+                created = self.moment()
+                payment_status = rng.choice(statuses)
+                chosen = rng.sample(products, rng.choice([1, 1, 1, 2, 3]))
+                subtotal = sum(price for _, _, _, price, _ in chosen)
+                affiliate = rng.choice(affiliates) if rng.random() < REFERRED_SHARE else None
+                commission = sum(price * rate / 100 for _, _, _, price, rate in chosen)
+                orders.append(Order(
+                    order_number=f'BENCH-{i:08d}',
+                    user_id=rng.choice(user_ids),
+                    subtotal=subtotal,
+                    total=subtotal,
+                    commission_total=commission,
+                    affiliate_commission=commission if affiliate else 0,
+                    affiliate_id=affiliate[0] if affiliate else None,
+                    affiliate_code=affiliate[1] if affiliate else '',
+                    payment_method=rng.choice(['razorpay', 'stripe']),
+                    payment_status=payment_status,
+                    order_status={'paid': 'completed', 'refunded': 'refunded'}.get(payment_status, 'pending'),
+                    created_at=created,
+                    paid_at=created if payment_status in ('paid', 'refunded') else None,
+                ))
+                lines.append((chosen, affiliate, created, payment_status))
+
+            with transaction.atomic():
+                orders = Order.objects.bulk_create(orders)
+                items, commissions = [], []
+                for order, (chosen, affiliate, created, payment_status) in zip(orders, lines):
+                    for pk, name, platform_name, price, rate in chosen:
+                        items.append(OrderItem(
+                            order_id=order.pk, product_id=pk, product_name=name,
+                            platform_name=platform_name, price=price, commission_rate=rate,
+                            commission_amount=price * rate / 100, created_at=created,
+                        ))
+                    if affiliate and payment_status == 'paid':
+                        commissions.append(Commission(
+                            affiliate_id=affiliate[0], order_id=order.pk, amount=order.affiliate_commission,
+                            rate=Decimal('3'), status=rng.choice(['pending', 'approved', 'paid']),
+                            created_at=created,
+                        ))
+                OrderItem.objects.bulk_create(items)
+                Commission.objects.bulk_create(commissions)
+
+            totals['orders'] += len(orders)
+            totals['items'] += len(items)
+            totals['commissions'] += len(commissions)
+            self.stdout.write(f"Order: {totals['orders']}/{count}", ending='\r')
+        self.stdout.write(f"Order: {totals['orders']}, OrderItem: {totals['items']}, Commission: {totals['commissions']}")
+
+    def seed_enrollments(self, count, user_ids, product_ids):
+        rng = self.random
+        per_user = 5
+        users = rng.sample(user_ids, min(len(user_ids), max(1, count // per_user)))
+
+        def rows():
+            made = 0
+            for user_id in users:
+                for product_id in rng.sample(product_ids, min(per_user, len(product_ids))):
+                    if made >= count:
+                        return
+                    made += 1
+                    yield Enrollment(
+                        user_id=user_id, product_id=product_id,
+                        progress=rng.randrange(101),
+                        status=rng.choice(['active', 'active', 'completed', 'expired']),
+                        enrolled_at=self.moment(),
+                    )
+
+        self.create(Enrollment, rows())
+
+    # ===== DERIVED DATA =====
+
+    def rebuild_derived(self, platform_ids, user_ids):
+        from apps.core import caching, home, rollups, search
+        from apps.orders import ledger
+        from apps.platforms import counts
+        from apps.users import summary
+
+        steps = [
+            ('product counts', lambda: counts.recount(platform_ids)),
+            ('sales ledger', ledger.rebuild),
+            ('daily rollups', lambda: rollups.rollup(full=True)),
+            ('search index', search.rebuild),
+            ('dashboard summaries', lambda: summary.rebuild_all(user_ids)),
+        ]
+        for label, step in steps:
+            started = time.monotonic()
+            step()
+            self.stdout.write(f'{label}: rebuilt in {time.monotonic() - started:.1f}s')
+        caching.bump(Product)
+        home.invalidate()
@@ -0,0 +1,66 @@
+"""
+Send an announcement to many users over pooled SMTP connections
+(see apps.core.bulk_email).
+
+    python manage.py send_bulk_email --subject "New courses" \
+        --headline "Fresh drops this week" --message "..." --cta-url https://...
+
+By default only users who opted in to marketing email are included.
+Use --dry-run to count recipients and render every variant without sending.
+"""
+from django.core.management.base import BaseCommand
+from apps.core import bulk_email
+
+
+class Command(BaseCommand):
+    help = 'Send a templated email to opted-in users in batches over pooled connections'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--subject', required=True, help='Subject line; $first_name etc. are substituted')
+        parser.add_argument('--template', default='emails/announcement.html')
+        parser.add_argument('--headline', default='')
+        parser.add_argument('--message', default='')
+        parser.add_argument('--cta-url', default='')
+        parser.add_argument('--cta-label', default='')
+        parser.add_argument(
+            '--audience',
+            choices=['marketing', 'all'],
+            default='marketing',
+            help='marketing: opted-in users only (default); all: every active user',
+        )
+        parser.add_argument('--connections', type=int, default=3, help='Parallel SMTP connections')
+        parser.add_argument('--chunk-size', type=int, default=50, help='Messages per send_messages() call')
+        parser.add_argument('--limit', type=int, help='Only the first N recipients')
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        if options['audience'] == 'all':
+            recipients = bulk_email.all_recipients()
+        else:
+            recipients = bulk_email.marketing_recipients()
+        if options['limit']:
+            recipients = recipients[:options['limit']]
+
+        stats = bulk_email.send_bulk(
+            options['template'],
+            options['subject'],
+            recipients,
+            context={
+                'headline': options['headline'],
+                'message': options['message'],
+                'cta_url': options['cta_url'],
+                'cta_label': options['cta_label'],
+            },
+            connections=options['connections'],
+            chunk_size=options['chunk_size'],
+            dry_run=options['dry_run'],
+        )
+
+        prefix = '🧪 Dry run: ' if options['dry_run'] else ''
+        self.stdout.write(
+            f"{prefix}{stats['recipients']} recipients, {stats['variants']} variant(s) rendered, "
+            f"{stats['sent']} sent, {stats['failed']} failed "
+            f"in {stats['seconds']}s ({stats['per_second']}/s)"
+        )
+        style = self.style.WARNING if stats['failed'] else self.style.SUCCESS
+        self.stdout.write(style('✅ Bulk send complete' if not stats['failed'] else '⚠️ Bulk send finished with failures'))
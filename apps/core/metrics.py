@@ -0,0 +1,134 @@
+"""
+Metrics for Zero To Hero
+
+Prometheus metrics for view latency and database time per URL name, email
+outcomes (outbox and bulk sends) and payment gateway calls, served as text
+at /metrics.
+
+Under gunicorn every worker is a separate process, so metrics are written to
+files in PROMETHEUS_MULTIPROC_DIR (set up by start.sh / gunicorn.conf.py)
+and /metrics sums the files of all workers, including the email worker.
+Without that variable (runserver, shell) the in-process registry is served.
+
+/metrics requires "Authorization: Bearer <METRICS_TOKEN>" when METRICS_TOKEN
+is set, and a staff login otherwise.
+"""
+import os
+import time
+from contextlib import ExitStack, contextmanager
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess,
+)
+
+# ===== METRICS =====
+
+REQUEST_LATENCY = Histogram(
+    'zth_http_request_duration_seconds', 'View latency by URL name', ['view', 'method'],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS = Counter('zth_http_requests_total', 'Requests by URL name and status', ['view', 'method', 'status'])
+REQUEST_DB_TIME = Histogram(
+    'zth_http_request_db_seconds', 'Time spent in SQL per request', ['view'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+REQUEST_QUERIES = Histogram(
+    'zth_http_request_queries', 'Queries per request', ['view'],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200),
+)
+
+# kind: transactional (outbox) or bulk; outcome: queued, sent, retried, failed
+EMAILS = Counter('zth_emails_total', 'Emails by kind and outcome', ['kind', 'outcome'])
+
+GATEWAY_LATENCY = Histogram(
+    'zth_payment_gateway_duration_seconds', 'Payment gateway call latency', ['gateway', 'operation'],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+GATEWAY_ERRORS = Counter(
+    'zth_payment_gateway_errors_total', 'Payment gateway calls that raised', ['gateway', 'operation'],
+)
+
+
+# Anything else a client sends is counted as 'other', keeping label values bounded
+METHODS = {'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'}
+
+
+def method_label(method):
+    return method if method in METHODS else 'other'
+
+
+def email(outcome, kind='transactional', count=1):
+    if count:
+        EMAILS.labels(kind=kind, outcome=outcome).inc(count)
+
+
+@contextmanager
+def gateway_call(gateway, operation):
+    """Time a call to a payment gateway and count it if it raises"""
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        GATEWAY_ERRORS.labels(gateway=gateway, operation=operation).inc()
+        raise
+    finally:
+        GATEWAY_LATENCY.labels(gateway=gateway, operation=operation).observe(time.perf_counter() - started)
+
+
+# ===== EXPOSITION =====
+
+def exposition():
+    """The text format for every process's metrics"""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry)
+
+
+def authorized(request):
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token:
+        return request.headers.get('Authorization', '') == f'Bearer {token}'
+    return request.user.is_authenticated and request.user.is_staff
+
+
+# ===== MIDDLEWARE =====
+
+class MetricsMiddleware:
+    """Observes latency, query count and SQL time for every request"""
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'METRICS_ENABLED', True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        database = {'queries': 0, 'seconds': 0.0}
+
+        def observe(execute, sql, params, many, context):
+            started = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                database['queries'] += 1
+                database['seconds'] += time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(observe))
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - started
+
+        match = request.resolver_match
+        view = (match.view_name if match else None) or 'unresolved'
+        method = method_label(request.method)
+        REQUEST_LATENCY.labels(view=view, method=method).observe(elapsed)
+        REQUESTS.labels(view=view, method=method, status=response.status_code).inc()
+        REQUEST_DB_TIME.labels(view=view).observe(database['seconds'])
+        REQUEST_QUERIES.labels(view=view).observe(database['queries'])
+        return response
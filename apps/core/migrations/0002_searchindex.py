@@ -0,0 +1,113 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:20
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+# Full-text side of SearchIndex. Kept as raw SQL because it differs per backend;
+# both variants are fed by triggers so Python code only writes plain columns.
+SEARCH_BACKEND_SQL = {
+    'postgresql': {
+        'forward': [
+            """
+            CREATE FUNCTION core_searchindex_vector_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector :=
+                    setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+                    setweight(to_tsvector('english', coalesce(NEW.keywords, '')), 'B') ||
+                    setweight(to_tsvector('english', coalesce(NEW.body, '')), 'C');
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+            """,
+            """
+            CREATE TRIGGER core_searchindex_vector
+            BEFORE INSERT OR UPDATE ON core_searchindex
+            FOR EACH ROW EXECUTE FUNCTION core_searchindex_vector_update()
+            """,
+            "CREATE INDEX core_searchindex_vector_gin ON core_searchindex USING gin (search_vector)",
+        ],
+        'reverse': [
+            "DROP INDEX IF EXISTS core_searchindex_vector_gin",
+            "DROP TRIGGER IF EXISTS core_searchindex_vector ON core_searchindex",
+            "DROP FUNCTION IF EXISTS core_searchindex_vector_update()",
+        ],
+    },
+    'sqlite': {
+        'forward': [
+            """
+            CREATE VIRTUAL TABLE core_searchindex_fts USING fts5(
+                title, keywords, body,
+                content='core_searchindex', content_rowid='id',
+                tokenize='porter unicode61 remove_diacritics 2'
+            )
+            """,
+            """
+            CREATE TRIGGER core_searchindex_ai AFTER INSERT ON core_searchindex BEGIN
+                INSERT INTO core_searchindex_fts(rowid, title, keywords, body)
+                VALUES (new.id, new.title, new.keywords, new.body);
+            END
+            """,
+            """
+            CREATE TRIGGER core_searchindex_ad AFTER DELETE ON core_searchindex BEGIN
+                INSERT INTO core_searchindex_fts(core_searchindex_fts, rowid, title, keywords, body)
+                VALUES ('delete', old.id, old.title, old.keywords, old.body);
+            END
+            """,
+            """
+            CREATE TRIGGER core_searchindex_au AFTER UPDATE ON core_searchindex BEGIN
+                INSERT INTO core_searchindex_fts(core_searchindex_fts, rowid, title, keywords, body)
+                VALUES ('delete', old.id, old.title, old.keywords, old.body);
+                INSERT INTO core_searchindex_fts(rowid, title, keywords, body)
+                VALUES (new.id, new.title, new.keywords, new.body);
+            END
+            """,
+        ],
+        'reverse': [
+            "DROP TRIGGER IF EXISTS core_searchindex_au",
+            "DROP TRIGGER IF EXISTS core_searchindex_ad",
+            "DROP TRIGGER IF EXISTS core_searchindex_ai",
+            "DROP TABLE IF EXISTS core_searchindex_fts",
+        ],
+    },
+}
+
+
+def create_search_backend(apps, schema_editor):
+    for sql in SEARCH_BACKEND_SQL.get(schema_editor.connection.vendor, {}).get('forward', []):
+        schema_editor.execute(sql)
+
+
+def drop_search_backend(apps, schema_editor):
+    for sql in SEARCH_BACKEND_SQL.get(schema_editor.connection.vendor, {}).get('reverse', []):
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndex',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity', models.CharField(choices=[('platform', 'Platform'), ('product', 'Product'), ('gem', 'Hidden Gem')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.CharField(max_length=200)),
+                ('keywords', models.TextField(blank=True)),
+                ('body', models.TextField(blank=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Search Index Entry',
+                'verbose_name_plural': 'Search Index',
+                'unique_together': {('entity', 'object_id')},
+            },
+        ),
+        migrations.RunPython(create_search_backend, drop_search_backend),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_emailoutbox'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='faq',
+            index=models.Index(fields=['category', 'is_active', 'order'], name='core_faq_cat_active_order'),
+        ),
+    ]
@@ -1,6 +1,8 @@
 # apps/core/models.py
 from django.db import models
+from django.utils import timezone
 from django.utils.text import slugify
+from django.contrib.postgres.search import SearchVectorField
 from ckeditor.fields import RichTextField
 
 class SiteSettings(models.Model):
@@ -150,6 +152,10 @@ class FAQ(models.Model):
     
     class Meta:
         ordering = ['category', 'order']
+        indexes = [
+            # Active FAQs of a category in display order (FAQ page)
+            models.Index(fields=['category', 'is_active', 'order'], name='core_faq_cat_active_order'),
+        ]
     
     def __str__(self):
         return self.question[:100]
@@ -203,6 +209,10 @@ class BlogPost(models.Model):
     
     class Meta:
         ordering = ['-published_at']
+        indexes = [
+            # Blog list: published posts, newest first
+            models.Index(fields=['status', '-published_at'], name='core_blogpost_status_pub'),
+        ]
     
     def __str__(self):
         return self.title
@@ -212,3 +222,116 @@ class BlogPost(models.Model):
             from django.utils import timezone
             self.published_at = timezone.now()
         super().save(*args, **kwargs)
+
+
+class SearchIndex(models.Model):
+    """Search - Precomputed index over platforms, products & hidden gems
+
+    Rows are kept in sync by apps.core.signals. The full-text side lives in
+    the database: a tsvector column + GIN index on PostgreSQL, and an FTS5
+    table fed by triggers on SQLite (see migration 0002).
+    """
+    ENTITY_CHOICES = [
+        ('platform', 'Platform'),
+        ('product', 'Product'),
+        ('gem', 'Hidden Gem'),
+    ]
+    
+    entity = models.CharField(max_length=20, choices=ENTITY_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    
+    # Weighted columns: title > keywords > body
+    title = models.CharField(max_length=200)
+    keywords = models.TextField(blank=True)
+    body = models.TextField(blank=True)
+    
+    is_active = models.BooleanField(default=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = 'Search Index Entry'
+        verbose_name_plural = 'Search Index'
+        unique_together = ['entity', 'object_id']
+    
+    def __str__(self):
+        return f"{self.entity}:{self.object_id} - {self.title}"
+
+
+class DailyMetric(models.Model):
+    """Analytics - One row of pre-aggregated counters per calendar day
+
+    Filled by the rollup_metrics command (apps.core.rollups) so the analytics
+    charts group over days instead of scanning orders, users & affiliates.
+    """
+    date = models.DateField(unique=True)
+    
+    # Orders (all statuses) and the paid subset, by order creation date
+    orders = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    paid_orders = models.IntegerField(default=0)
+    paid_revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    
+    # Growth
+    signups = models.IntegerField(default=0)
+    affiliates_joined = models.IntegerField(default=0)
+    
+    # Affiliate commissions, by creation date
+    commissions = models.IntegerField(default=0)
+    commission_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['date']
+        verbose_name = 'Daily Metric'
+        verbose_name_plural = 'Daily Metrics'
+    
+    def __str__(self):
+        return str(self.date)
+
+
+class RollupWatermark(models.Model):
+    """Analytics - How far an incremental rollup has processed source changes"""
+    name = models.CharField(max_length=50, unique=True)
+    processed_until = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"{self.name} @ {self.processed_until}"
+
+
+class EmailOutbox(models.Model):
+    """Email - Messages queued by request handlers, delivered by email_worker"""
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+    
+    subject = models.CharField(max_length=255)
+    from_email = models.CharField(max_length=255, blank=True)
+    to = models.JSONField(default=list)
+    body = models.TextField(blank=True)
+    html_body = models.TextField(blank=True)
+    
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.IntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    
+    # Not picked up before this time (retry backoff)
+    send_after = models.DateTimeField(default=timezone.now)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['send_after']
+        verbose_name = 'Outgoing Email'
+        verbose_name_plural = 'Email Outbox'
+        indexes = [models.Index(fields=['status', 'send_after'])]
+    
+    def __str__(self):
+        return f"{self.subject} → {', '.join(self.to)} ({self.status})"
@@ -0,0 +1,141 @@
+"""
+Email Outbox for Zero To Hero
+
+Request handlers queue mail with send_mail(), which only inserts an
+EmailOutbox row. The email_worker command delivers queued rows over a single
+reused SMTP connection and retries failures with exponential backoff.
+With EMAIL_OUTBOX_ENABLED = False mail is sent inline, as before.
+"""
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.core import mail
+from django.db import transaction
+from django.utils import timezone
+from . import metrics
+from .models import EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+# A claimed row whose worker died is handed out again after this long
+CLAIM_TIMEOUT = timedelta(minutes=10)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def send_mail(subject, message, from_email, recipient_list, html_message=None, fail_silently=False):
+    """Drop-in for django.core.mail.send_mail that queues instead of sending"""
+    if not _setting('EMAIL_OUTBOX_ENABLED', True):
+        try:
+            sent = mail.send_mail(
+                subject, message, from_email, recipient_list,
+                html_message=html_message, fail_silently=fail_silently,
+            )
+        except Exception:
+            metrics.email('failed')
+            raise
+        metrics.email('sent' if sent else 'failed')
+        return sent
+
+    EmailOutbox.objects.create(
+        subject=subject,
+        from_email=from_email or '',
+        to=list(recipient_list),
+        body=message,
+        html_body=html_message or '',
+    )
+    metrics.email('queued')
+    return len(recipient_list)
+
+
+def _message(row, connection):
+    message = mail.EmailMultiAlternatives(
+        subject=row.subject,
+        body=row.body,
+        from_email=row.from_email or None,
+        to=row.to,
+        connection=connection,
+    )
+    if row.html_body:
+        message.attach_alternative(row.html_body, 'text/html')
+    return message
+
+
+# ===== WORKER =====
+
+def claim(batch_size=50):
+    """
+    Lock and mark up to batch_size due rows as sending. Concurrent workers
+    skip each other's locked rows instead of waiting on them.
+    """
+    now = timezone.now()
+    due = (
+        EmailOutbox.objects.filter(status='pending', send_after__lte=now)
+        | EmailOutbox.objects.filter(status='sending', claimed_at__lt=now - CLAIM_TIMEOUT)
+    )
+    with transaction.atomic():
+        rows = list(due.select_for_update(skip_locked=True).order_by('send_after')[:batch_size])
+        if rows:
+            EmailOutbox.objects.filter(pk__in=[row.pk for row in rows]).update(status='sending', claimed_at=now)
+    return rows
+
+
+def backoff(attempts):
+    """Seconds to wait before retry number `attempts`: base * 2^(n-1), capped"""
+    base = _setting('EMAIL_OUTBOX_RETRY_DELAY', 60)
+    return min(base * 2 ** (attempts - 1), 6 * 60 * 60)
+
+
+def _sent(row):
+    metrics.email('sent')
+    EmailOutbox.objects.filter(pk=row.pk).update(
+        status='sent', attempts=row.attempts + 1, sent_at=timezone.now(), last_error='',
+    )
+
+
+def _failed(row, error):
+    attempts = row.attempts + 1
+    if attempts >= _setting('EMAIL_OUTBOX_MAX_ATTEMPTS', 5):
+        changes = {'status': 'failed'}
+        metrics.email('failed')
+        logger.error('Giving up on outbox email %s after %s attempts: %s', row.pk, attempts, error)
+    else:
+        changes = {'status': 'pending', 'send_after': timezone.now() + timedelta(seconds=backoff(attempts))}
+        metrics.email('retried')
+        logger.warning('Outbox email %s failed (attempt %s), retrying: %s', row.pk, attempts, error)
+    EmailOutbox.objects.filter(pk=row.pk).update(attempts=attempts, last_error=str(error), **changes)
+
+
+def deliver(rows, connection):
+    """Send claimed rows over an open connection. Returns (sent, failed)."""
+    sent = failed = 0
+    for row in rows:
+        try:
+            # No-op while the connection is up; reconnects after a failure
+            connection.open()
+            _message(row, connection).send()
+        except Exception as error:
+            _failed(row, error)
+            failed += 1
+            # The server may have dropped us; start clean for the next message
+            connection.close()
+        else:
+            _sent(row)
+            sent += 1
+    return sent, failed
+
+
+def process(batch_size=50, connection=None):
+    """Claim and deliver one batch. Returns (sent, failed)."""
+    rows = claim(batch_size)
+    if not rows:
+        return 0, 0
+    if connection is not None:
+        return deliver(rows, connection)
+    connection = mail.get_connection()
+    try:
+        return deliver(rows, connection)
+    finally:
+        connection.close()
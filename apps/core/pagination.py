@@ -0,0 +1,168 @@
+"""
+Keyset Pagination for Zero To Hero
+
+Cursor-based paging for list views. Instead of OFFSET n, each page asks for
+rows that sort after (or before) the last row of the previous page, so page
+500 costs the same index range scan as page 1 and rows inserted meanwhile do
+not shift items between pages.
+
+Cursors are the ordering values of the boundary row, signed so clients see
+an opaque token (?cursor=...). Requests that still send ?page=N get the
+regular offset paginator. Ordering fields must be non-null; the primary key
+is appended as a tiebreaker.
+"""
+import hashlib
+from django.conf import settings
+from django.core import signing
+from django.core.cache import caches
+from django.db.models import Q
+from django.http import Http404
+
+CURSOR_SALT = 'core.pagination.cursor'
+
+# Counts churn with every filter combination; kept per process (see settings.CACHES)
+COUNT_CACHE_ALIAS = 'volatile'
+
+
+class KeysetPage:
+    """One page of results, shaped like a Django Page where it matters"""
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+def _ordering(queryset):
+    ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+    if not any(field.lstrip('-') in ('pk', 'id') for field in ordering):
+        ordering.append('pk')
+    return [(field.lstrip('-'), field.startswith('-')) for field in ordering]
+
+
+def _boundary(ordering, values, forward):
+    """Q matching rows strictly after (forward) or before the given values"""
+    condition = Q(pk__in=[])
+    equal = Q()
+    for (field, descending), value in zip(ordering, values):
+        # Moving forward past a descending field means smaller values
+        lookup = 'lt' if descending == forward else 'gt'
+        condition |= equal & Q(**{f'{field}__{lookup}': value})
+        equal &= Q(**{field: value})
+    return condition
+
+
+def _encode(ordering, obj, forward):
+    values = [getattr(obj, field) for field, _ in ordering]
+    return signing.dumps(
+        {'v': [str(v) if v is not None else None for v in values], 'f': forward},
+        salt=CURSOR_SALT,
+        compress=True,
+    )
+
+
+def _decode(model, ordering, token):
+    try:
+        data = signing.loads(token, salt=CURSOR_SALT)
+        values = [
+            model._meta.pk.to_python(value) if field == 'pk' else model._meta.get_field(field).to_python(value)
+            for (field, _), value in zip(ordering, data['v'])
+        ]
+        if len(values) != len(ordering):
+            raise ValueError
+        return values, bool(data['f'])
+    except (signing.BadSignature, KeyError, TypeError, ValueError):
+        raise Http404('Invalid cursor')
+
+
+def paginate(queryset, page_size, cursor=None):
+    """Return the KeysetPage for `cursor` (None for the first page)"""
+    ordering = _ordering(queryset)
+    forward = True
+    if cursor:
+        values, forward = _decode(queryset.model, ordering, cursor)
+        queryset = queryset.filter(_boundary(ordering, values, forward))
+
+    order_by = [
+        ('-' if descending == forward else '') + field
+        for field, descending in ordering
+    ]
+    rows = list(queryset.order_by(*order_by)[:page_size + 1])
+    more = len(rows) > page_size
+    rows = rows[:page_size]
+    if not forward:
+        rows.reverse()
+
+    if not rows:
+        return KeysetPage(rows)
+
+    # Going forward there is more ahead iff we over-fetched; anything reached
+    # through a cursor has something behind it. Mirror that going backwards.
+    has_next = more if forward else True
+    has_previous = bool(cursor) if forward else more
+    return KeysetPage(
+        rows,
+        next_cursor=_encode(ordering, rows[-1], True) if has_next else None,
+        previous_cursor=_encode(ordering, rows[0], False) if has_previous else None,
+    )
+
+
+def approximate_count(queryset, timeout=None):
+    """
+    Row count for display ("1,234 courses"), cached per query for
+    PAGINATION_COUNT_TIMEOUT seconds rather than recounted on every page.
+    """
+    sql, params = queryset.query.sql_with_params()
+    key = 'core:count:' + hashlib.md5(f'{sql}{params}'.encode()).hexdigest()
+    cache = caches[COUNT_CACHE_ALIAS]
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, timeout or getattr(settings, 'PAGINATION_COUNT_TIMEOUT', 300))
+    return count
+
+
+class KeysetPaginationMixin:
+    """
+    ListView mixin: cursor pagination by default, offset pagination for
+    ?page=N. Adds total_count to the context without counting twice.
+
+    count_mode: 'approximate' (cached count), 'exact', or None (no count)
+    """
+    cursor_kwarg = 'cursor'
+    count_mode = 'approximate'
+
+    def paginate_queryset(self, queryset, page_size):
+        if self.page_kwarg in self.request.GET:
+            return super().paginate_queryset(queryset, page_size)
+        page = paginate(queryset, page_size, self.request.GET.get(self.cursor_kwarg))
+        return None, page, page.object_list, page.has_other_pages()
+
+    def get_total_count(self, paginator, queryset):
+        if paginator is not None:
+            return paginator.count
+        if self.count_mode == 'exact':
+            return queryset.count()
+        if self.count_mode == 'approximate':
+            return approximate_count(queryset)
+        return None
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['total_count'] = self.get_total_count(context.get('paginator'), self.object_list)
+        return context
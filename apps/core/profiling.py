@@ -0,0 +1,197 @@
+"""
+Request Profiling for Zero To Hero
+
+ProfilingMiddleware records, for every request, the resolved URL name, the
+number of queries, total SQL time, template render time, wall time and the
+SQL statements that ran more than once (usually an N+1). Profiles are kept in
+an in-process ring buffer of the last PROFILING_BUFFER_SIZE requests and
+summarised per URL name at /analytics/profile/ (staff only). Requests over
+PROFILING_SLOW_MS, PROFILING_SLOW_QUERIES or with a statement repeated
+PROFILING_DUPLICATE_QUERIES times are logged as warnings.
+
+With PROFILING_ENABLED off the middleware removes itself at startup, so it
+costs nothing. Each gunicorn worker keeps its own buffer.
+"""
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextlib import ExitStack
+from contextvars import ContextVar
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_current = ContextVar('profile', default=None)
+_lock = threading.Lock()
+_buffer = deque(maxlen=500)
+
+# "IN (%s, %s, %s)" lists vary in length; treat them as one statement
+_IN_LIST = re.compile(r'IN \((?:%s, )*%s\)')
+
+
+def fingerprint(sql):
+    return _IN_LIST.sub('IN (...)', sql)
+
+
+class Profile:
+    """What one request did"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.sql_ms = 0.0
+        self.render_ms = 0.0
+        self.statements = Counter()
+
+    def record_query(self, sql, elapsed_ms):
+        self.queries += 1
+        self.sql_ms += elapsed_ms
+        self.statements[fingerprint(sql)] += 1
+
+    def duplicates(self, limit=5):
+        return [(sql, count) for sql, count in self.statements.most_common(limit) if count > 1]
+
+
+def _record_query(execute, sql, params, many, context):
+    profile = _current.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.record_query(sql, (time.perf_counter() - started) * 1000)
+
+
+def _instrument_templates():
+    """Time Template.render() of the Django backend (render(), TemplateResponse)"""
+    from django.template.backends.django import Template
+
+    if getattr(Template.render, 'profiled', False):
+        return
+    original = Template.render
+
+    def render(self, context=None, request=None):
+        profile = _current.get()
+        if profile is None:
+            return original(self, context, request)
+        started = time.perf_counter()
+        try:
+            return original(self, context, request)
+        finally:
+            profile.render_ms += (time.perf_counter() - started) * 1000
+
+    render.profiled = True
+    Template.render = render
+
+
+# ===== BUFFER =====
+
+def recent(limit=None):
+    with _lock:
+        entries = list(_buffer)
+    return entries[-limit:] if limit else entries
+
+
+def summary():
+    """Per URL name: requests, average and max time / queries, worst duplicates"""
+    views = {}
+    for entry in recent():
+        view = views.setdefault(entry['view'], {
+            'view': entry['view'], 'requests': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+            'sql_ms': 0.0, 'render_ms': 0.0, 'queries': 0, 'max_queries': 0, 'duplicates': {},
+        })
+        view['requests'] += 1
+        view['total_ms'] += entry['total_ms']
+        view['max_ms'] = max(view['max_ms'], entry['total_ms'])
+        view['sql_ms'] += entry['sql_ms']
+        view['render_ms'] += entry['render_ms']
+        view['queries'] += entry['queries']
+        view['max_queries'] = max(view['max_queries'], entry['queries'])
+        for sql, count in entry['duplicates']:
+            view['duplicates'][sql] = max(view['duplicates'].get(sql, 0), count)
+
+    rows = []
+    for view in views.values():
+        requests = view['requests']
+        rows.append({
+            'view': view['view'],
+            'requests': requests,
+            'avg_ms': round(view['total_ms'] / requests, 2),
+            'max_ms': round(view['max_ms'], 2),
+            'avg_sql_ms': round(view['sql_ms'] / requests, 2),
+            'avg_render_ms': round(view['render_ms'] / requests, 2),
+            'avg_queries': round(view['queries'] / requests, 1),
+            'max_queries': view['max_queries'],
+            'duplicates': sorted(view['duplicates'].items(), key=lambda item: -item[1])[:5],
+        })
+    return sorted(rows, key=lambda row: -row['avg_ms'] * row['requests'])
+
+
+def clear():
+    with _lock:
+        _buffer.clear()
+
+
+# ===== MIDDLEWARE =====
+
+class ProfilingMiddleware:
+    def __init__(self, get_response):
+        if not getattr(settings, 'PROFILING_ENABLED', False):
+            raise MiddlewareNotUsed
+        global _buffer
+        _buffer = deque(_buffer, maxlen=getattr(settings, 'PROFILING_BUFFER_SIZE', 500))
+        _instrument_templates()
+        self.get_response = get_response
+        self.slow_ms = getattr(settings, 'PROFILING_SLOW_MS', 500)
+        self.slow_queries = getattr(settings, 'PROFILING_SLOW_QUERIES', 50)
+        self.duplicate_queries = getattr(settings, 'PROFILING_DUPLICATE_QUERIES', 10)
+
+    def __call__(self, request):
+        profile = Profile()
+        token = _current.set(profile)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_record_query))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+
+        entry = self.record(request, response, profile)
+        response['Server-Timing'] = (
+            f"db;dur={entry['sql_ms']:.1f}, render;dur={entry['render_ms']:.1f}, total;dur={entry['total_ms']:.1f}"
+        )
+        return response
+
+    def record(self, request, response, profile):
+        match = request.resolver_match
+        entry = {
+            'view': (match.view_name if match else None) or 'unresolved',
+            'path': request.path,
+            'method': request.method,
+            'status': response.status_code,
+            'total_ms': round((time.perf_counter() - profile.started) * 1000, 2),
+            'sql_ms': round(profile.sql_ms, 2),
+            'render_ms': round(profile.render_ms, 2),
+            'queries': profile.queries,
+            'duplicates': profile.duplicates(),
+            'at': time.time(),
+        }
+        with _lock:
+            _buffer.append(entry)
+
+        worst = entry['duplicates'][0][1] if entry['duplicates'] else 0
+        if (entry['total_ms'] > self.slow_ms or entry['queries'] > self.slow_queries
+                or worst >= self.duplicate_queries):
+            logger.warning(
+                'Slow request %s %s (%s): %.0f ms, %d queries in %.0f ms, render %.0f ms, '
+                'most repeated statement x%d',
+                entry['method'], entry['path'], entry['view'], entry['total_ms'],
+                entry['queries'], entry['sql_ms'], entry['render_ms'], worst,
+            )
+        return entry
@@ -0,0 +1,175 @@
+"""
+Daily Rollups for Zero To Hero
+
+Maintains DailyMetric: one row per day with order, revenue, signup, affiliate
+and commission counters. rollup() finds the days whose source rows
+changed since the last watermark and recomputes just those days with grouped
+aggregates, so a run costs a handful of queries no matter how large the
+tables are. Deletions leave no trace to detect; use a full run (or --since)
+after bulk deletes.
+
+Nothing schedules rollup_metrics besides the deploy, so the analytics views
+call refresh(), which catches up whenever the last run is older than MAX_AGE.
+"""
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate, TruncMonth
+from django.utils import timezone
+from apps.users.models import User
+from apps.orders.models import Order
+from apps.affiliate.models import Affiliate, Commission
+from .models import DailyMetric, RollupWatermark
+
+WATERMARK = 'daily_metrics'
+
+# How stale the rollups may get before a read triggers an incremental run
+MAX_AGE = timedelta(minutes=5)
+
+METRIC_FIELDS = [
+    'orders', 'revenue', 'paid_orders', 'paid_revenue',
+    'signups', 'affiliates_joined', 'commissions', 'commission_amount',
+]
+
+
+# ===== SOURCES =====
+# Each source: (queryset, date field, "changed since" filter, aggregates)
+
+def _sources():
+    return [
+        (Order.objects.all(), 'created_at', lambda since: Q(updated_at__gte=since), {
+            'orders': Count('id'),
+            'revenue': Sum('total'),
+            'paid_orders': Count('id', filter=Q(payment_status='paid')),
+            'paid_revenue': Sum('total', filter=Q(payment_status='paid')),
+        }),
+        (User.objects.all(), 'date_joined', lambda since: Q(date_joined__gte=since), {
+            'signups': Count('id'),
+        }),
+        (Affiliate.objects.all(), 'joined_at', lambda since: Q(updated_at__gte=since), {
+            'affiliates_joined': Count('id'),
+        }),
+        # Commission has no updated_at; paid_at catches the payout transition
+        (Commission.objects.all(), 'created_at',
+         lambda since: Q(created_at__gte=since) | Q(paid_at__gte=since), {
+            'commissions': Count('id'),
+            'commission_amount': Sum('amount'),
+        }),
+    ]
+
+
+def _days(queryset, date_field):
+    return set(
+        queryset.annotate(day=TruncDate(date_field))
+        .order_by()
+        .values_list('day', flat=True)
+        .distinct()
+    )
+
+
+def dirty_days(since):
+    """Days with source rows created or modified at or after `since`"""
+    days = {timezone.localdate()}
+    for queryset, date_field, changed_since, _ in _sources():
+        days |= _days(queryset.filter(changed_since(since)), date_field)
+    return days
+
+
+def all_days():
+    days = {timezone.localdate()}
+    for queryset, date_field, _, _ in _sources():
+        days |= _days(queryset, date_field)
+    return days
+
+
+# ===== ROLLUP =====
+
+def compute(days):
+    """Metric rows for the given days, straight from the source tables"""
+    rows = {day: dict.fromkeys(METRIC_FIELDS, 0) for day in days}
+    for queryset, date_field, _, aggregates in _sources():
+        grouped = (
+            queryset.filter(**{f'{date_field}__date__in': days})
+            .annotate(day=TruncDate(date_field))
+            .order_by()
+            .values('day')
+            .annotate(**aggregates)
+        )
+        for row in grouped:
+            day = row.pop('day')
+            rows[day].update({key: value or 0 for key, value in row.items()})
+    return rows
+
+
+def _store(rows):
+    DailyMetric.objects.bulk_create(
+        [DailyMetric(date=day, **values) for day, values in rows.items()],
+        update_conflicts=True,
+        unique_fields=['date'],
+        update_fields=METRIC_FIELDS + ['updated_at'],
+    )
+
+
+def rollup(full=False, since=None, chunk_size=90):
+    """
+    Bring DailyMetric up to date. Returns the number of days recomputed.
+
+    By default only days touched since the stored watermark are processed;
+    `since` overrides the watermark and `full` recomputes every day.
+    """
+    # Taken before reading, so rows changed mid-run are picked up next time
+    started = timezone.now()
+    watermark, _ = RollupWatermark.objects.get_or_create(name=WATERMARK)
+    since = since or watermark.processed_until
+
+    if full or since is None:
+        days = all_days()
+    else:
+        days = dirty_days(since)
+
+    days = sorted(days)
+    with transaction.atomic():
+        for start in range(0, len(days), chunk_size):
+            _store(compute(days[start:start + chunk_size]))
+        watermark.processed_until = started
+        watermark.save(update_fields=['processed_until', 'updated_at'])
+    return len(days)
+
+
+def refresh(max_age=MAX_AGE):
+    """Run an incremental rollup if the last one is older than max_age"""
+    processed_until = (
+        RollupWatermark.objects.filter(name=WATERMARK)
+        .values_list('processed_until', flat=True)
+        .first()
+    )
+    if processed_until and timezone.now() - processed_until < max_age:
+        return 0
+    return rollup()
+
+
+# ===== READS =====
+
+def daily(since, until=None):
+    """Per-day metric rows from `since` onwards"""
+    metrics = DailyMetric.objects.filter(date__gte=since)
+    if until is not None:
+        metrics = metrics.filter(date__lte=until)
+    return metrics
+
+
+def monthly(since=None, **sums):
+    """
+    Month buckets summed from the daily rows, e.g.
+    monthly(revenue=Sum('paid_revenue')) -> [{'month': ..., 'revenue': ...}]
+    """
+    metrics = DailyMetric.objects.all()
+    if since is not None:
+        metrics = metrics.filter(date__gte=since)
+    return list(
+        metrics.annotate(month=TruncMonth('date'))
+        .values('month')
+        .annotate(**sums)
+        .order_by('month')
+    )
+
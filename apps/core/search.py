@@ -0,0 +1,222 @@
+"""
+Search Index for Zero To Hero
+
+Platforms, products and hidden gems are flattened into SearchIndex rows
+(title / keywords / body). Matching and ranking run inside the database:
+PostgreSQL uses the tsvector column + GIN index, SQLite uses the FTS5 table
+created in migration 0002. Any other backend falls back to icontains over
+the index table.
+"""
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
+from django.utils.html import strip_tags
+
+from .models import SearchIndex
+
+RESULTS_PER_ENTITY = 10
+
+FTS_TABLE = 'core_searchindex_fts'
+
+# bm25() column weights for (title, keywords, body)
+FTS_WEIGHTS = (10.0, 5.0, 1.0)
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+# ===== DOCUMENT BUILDERS =====
+
+def _join(*parts):
+    return ' '.join(part for part in parts if part)
+
+
+def platform_document(platform):
+    return {
+        'title': platform.name,
+        'keywords': _join(platform.category.name if platform.category_id else '', platform.country),
+        'body': strip_tags(platform.description),
+        'is_active': platform.is_active,
+    }
+
+
+def product_document(product):
+    return {
+        'title': product.name,
+        'keywords': _join(
+            product.platform.name,
+            product.category.name if product.category_id else '',
+            product.short_description,
+        ),
+        'body': strip_tags(product.description),
+        'is_active': product.is_active,
+    }
+
+
+def gem_document(gem):
+    return {
+        'title': gem.name,
+        'keywords': _join(gem.category.name, gem.provider, gem.country),
+        'body': _join(gem.description, gem.why_hidden),
+        'is_active': gem.is_active,
+    }
+
+
+def _registry():
+    """entity -> (model, document builder, related fields to load)"""
+    from apps.platforms.models import Platform, Product
+    from apps.learning.models import HiddenGem
+    return {
+        'platform': (Platform, platform_document, ['category']),
+        'product': (Product, product_document, ['platform', 'category']),
+        'gem': (HiddenGem, gem_document, ['category']),
+    }
+
+
+def entity_for(instance):
+    for entity, (model, _, _) in _registry().items():
+        if isinstance(instance, model):
+            return entity
+    return None
+
+
+# ===== INDEXING =====
+
+def index_object(instance):
+    """Insert or refresh the index row for a single object"""
+    entity = entity_for(instance)
+    _, build, _ = _registry()[entity]
+    SearchIndex.objects.update_or_create(
+        entity=entity,
+        object_id=instance.pk,
+        defaults=build(instance),
+    )
+
+
+def remove_object(instance):
+    """Drop the index row for a deleted object"""
+    SearchIndex.objects.filter(entity=entity_for(instance), object_id=instance.pk).delete()
+
+
+def index_queryset(entity, queryset, batch_size=500):
+    """Upsert index rows for every object in queryset. Returns the row count."""
+    _, build, related = _registry()[entity]
+    batch = []
+    count = 0
+    for obj in queryset.select_related(*related).iterator(chunk_size=batch_size):
+        batch.append(SearchIndex(entity=entity, object_id=obj.pk, **build(obj)))
+        if len(batch) >= batch_size:
+            count += _upsert(batch)
+            batch = []
+    if batch:
+        count += _upsert(batch)
+    return count
+
+
+def _upsert(entries):
+    SearchIndex.objects.bulk_create(
+        entries,
+        update_conflicts=True,
+        unique_fields=['entity', 'object_id'],
+        update_fields=['title', 'keywords', 'body', 'is_active'],
+    )
+    return len(entries)
+
+
+def rebuild(entities=None, batch_size=500):
+    """Re-index everything (or the given entities) and prune orphaned rows"""
+    counts = {}
+    for entity, (model, _, _) in _registry().items():
+        if entities and entity not in entities:
+            continue
+        counts[entity] = index_queryset(entity, model.objects.all(), batch_size=batch_size)
+        SearchIndex.objects.filter(entity=entity).exclude(
+            object_id__in=model.objects.values('pk')
+        ).delete()
+    return counts
+
+
+# ===== QUERYING =====
+
+def _tokens(query):
+    return TOKEN_RE.findall(query.lower())
+
+
+def _ranked_ids_sqlite(tokens, limit):
+    match = ' '.join(f'"{token}"*' for token in tokens)
+    weights = ', '.join(str(weight) for weight in FTS_WEIGHTS)
+    sql = f"""
+        SELECT entity, object_id FROM (
+            SELECT idx.entity, idx.object_id,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY idx.entity ORDER BY bm25({FTS_TABLE}, {weights})
+                   ) AS position
+            FROM {FTS_TABLE}
+            JOIN {SearchIndex._meta.db_table} idx ON idx.id = {FTS_TABLE}.rowid
+            WHERE {FTS_TABLE} MATCH %s AND idx.is_active
+        )
+        WHERE position <= %s
+        ORDER BY entity, position
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [match, limit])
+        return cursor.fetchall()
+
+
+def _ranked_ids_postgresql(tokens, limit):
+    query = SearchQuery(' & '.join(f'{token}:*' for token in tokens), search_type='raw', config='english')
+    return (
+        SearchIndex.objects.filter(is_active=True, search_vector=query)
+        .annotate(
+            rank=SearchRank(F('search_vector'), query),
+            position=Window(RowNumber(), partition_by=F('entity'), order_by=F('rank').desc()),
+        )
+        .filter(position__lte=limit)
+        .order_by('entity', 'position')
+        .values_list('entity', 'object_id')
+    )
+
+
+def _ranked_ids_fallback(tokens, limit):
+    condition = Q()
+    for token in tokens:
+        condition &= Q(title__icontains=token) | Q(keywords__icontains=token) | Q(body__icontains=token)
+    return (
+        SearchIndex.objects.filter(condition, is_active=True)
+        .annotate(position=Window(RowNumber(), partition_by=F('entity'), order_by=F('title').asc()))
+        .filter(position__lte=limit)
+        .order_by('entity', 'position')
+        .values_list('entity', 'object_id')
+    )
+
+
+def search(query, limit=RESULTS_PER_ENTITY):
+    """
+    Ranked search across all indexed entities.
+    Returns {'platform': [...], 'product': [...], 'gem': [...]} - one index
+    query for the ranking plus one fetch per entity type with hits.
+    """
+    registry = _registry()
+    results = {entity: [] for entity in registry}
+    tokens = _tokens(query)
+    if not tokens:
+        return results
+
+    ranked = {
+        'sqlite': _ranked_ids_sqlite,
+        'postgresql': _ranked_ids_postgresql,
+    }.get(connection.vendor, _ranked_ids_fallback)(tokens, limit)
+
+    ids = {entity: [] for entity in registry}
+    for entity, object_id in ranked:
+        ids[entity].append(object_id)
+
+    for entity, object_ids in ids.items():
+        if not object_ids:
+            continue
+        model, _, related = registry[entity]
+        objects = model.objects.filter(pk__in=object_ids, is_active=True).select_related(*related).in_bulk()
+        results[entity] = [objects[pk] for pk in object_ids if pk in objects]
+    return results
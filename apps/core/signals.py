@@ -0,0 +1,67 @@
+"""
+Signal handlers for Zero To Hero core
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.platforms.models import Platform, PlatformCategory, Product, ProductCategory
+from apps.learning.models import GemCategory, HiddenGem
+from . import caching, faq, home, search
+from .models import FAQ, FAQCategory, Founder, SearchIndex, SiteSettings
+
+
+# ===== SEARCH INDEX =====
+
+@receiver(post_save, sender=Platform)
+def index_platform(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous_name = SearchIndex.objects.filter(
+        entity='platform', object_id=instance.pk
+    ).values_list('title', flat=True).first()
+    search.index_object(instance)
+    
+    # Products carry their platform name as a keyword
+    if previous_name is not None and previous_name != instance.name:
+        search.index_queryset('product', instance.products.all())
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_save, sender=HiddenGem)
+def index_catalogue_item(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    search.index_object(instance)
+
+
+@receiver(post_delete, sender=Platform)
+@receiver(post_delete, sender=Product)
+@receiver(post_delete, sender=HiddenGem)
+def unindex_catalogue_item(sender, instance, **kwargs):
+    search.remove_object(instance)
+
+
+# ===== HOME PAGE CACHE =====
+
+@receiver(post_save, sender=Platform)
+@receiver(post_save, sender=Product)
+@receiver(post_save, sender=HiddenGem)
+@receiver(post_delete, sender=Platform)
+@receiver(post_delete, sender=Product)
+@receiver(post_delete, sender=HiddenGem)
+def invalidate_home_fragments(sender, **kwargs):
+    home.invalidate(*home.INVALIDATED_BY[sender])
+
+
+# ===== FAQ CACHE =====
+
+@receiver(post_save, sender=FAQ)
+@receiver(post_save, sender=FAQCategory)
+@receiver(post_delete, sender=FAQ)
+@receiver(post_delete, sender=FAQCategory)
+def invalidate_faq(sender, **kwargs):
+    faq.invalidate()
+
+
+# ===== MODEL CACHE VERSIONS =====
+
+caching.watch(SiteSettings, Founder, PlatformCategory, ProductCategory, GemCategory)
@@ -0,0 +1,33 @@
+"""
+Pagination links for Zero To Hero
+
+    {% load cursors %}
+    {% if page_obj.has_next %}<a href="{% page_url page_obj 'next' %}">→</a>{% endif %}
+
+Works for both kinds of page a KeysetPaginationMixin view produces: keyset
+pages link by ?cursor=, offset pages (?page=N) by page number. The other
+query parameters (search, filters) are kept.
+"""
+from django.template import Library
+
+register = Library()
+
+
+@register.simple_tag(takes_context=True)
+def page_url(context, page, direction):
+    """URL of the next or previous page, or '' if there is none"""
+    params = context['request'].GET.copy()
+    params.pop('cursor', None)
+    params.pop('page', None)
+    forward = direction == 'next'
+
+    if hasattr(page, 'next_cursor'):
+        cursor = page.next_cursor if forward else page.previous_cursor
+        if cursor is None:
+            return ''
+        params['cursor'] = cursor
+    else:
+        if not (page.has_next() if forward else page.has_previous()):
+            return ''
+        params['page'] = page.next_page_number() if forward else page.previous_page_number()
+    return '?' + params.urlencode()
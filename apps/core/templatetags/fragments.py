@@ -0,0 +1,60 @@
+"""
+Template fragment caching for Zero To Hero
+
+    {% load fragments %}
+    {% fragment navbar user|viewer %} ... {% endfragment %}
+    {% fragment product_card product|version %} ... {% endfragment %}
+
+{% fragment %} is Django's {% cache %} with the timeout taken from
+FRAGMENT_CACHE_TIMEOUT. Partials vary on who is looking (anonymous or the
+user type) and cards vary on the object's id and updated_at, so an edit in
+the admin produces a fresh key instead of needing an invalidation. That also
+makes them safe to keep in the per-process 'volatile' cache.
+"""
+from django.conf import settings
+from django.template import Library, TemplateSyntaxError
+from django.templatetags.cache import CacheNode
+
+register = Library()
+
+CACHE_ALIAS = 'volatile'
+
+
+class _Timeout:
+    """Stands in for the timeout variable of CacheNode; read at render time"""
+    var = 'FRAGMENT_CACHE_TIMEOUT'
+
+    def resolve(self, context):
+        return getattr(settings, 'FRAGMENT_CACHE_TIMEOUT', 600)
+
+
+@register.tag('fragment')
+def do_fragment(parser, token):
+    nodelist = parser.parse(('endfragment',))
+    parser.delete_first_token()
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise TemplateSyntaxError("'fragment' tag requires a fragment name")
+    return CacheNode(
+        nodelist,
+        _Timeout(),
+        bits[1],
+        [parser.compile_filter(bit) for bit in bits[2:]],
+        parser.compile_filter(f"'{CACHE_ALIAS}'"),
+    )
+
+
+@register.filter
+def viewer(user):
+    """Cache key part for partials: 'anon' or the signed-in user's type"""
+    if user is None or not user.is_authenticated:
+        return 'anon'
+    return f"user:{getattr(user, 'user_type', '')}"
+
+
+@register.filter
+def version(obj):
+    """Cache key part for cards: model, id and last modification time"""
+    updated_at = getattr(obj, 'updated_at', None)
+    stamp = updated_at.timestamp() if updated_at else ''
+    return f'{obj._meta.label_lower}:{obj.pk}:{stamp}'
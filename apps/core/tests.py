@@ -1,3 +1,247 @@
-from django.test import TestCase
+from datetime import timedelta
+from decimal import Decimal
+from django.core.management import CommandError, call_command
+from django.core import mail
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from apps.learning.models import GemCategory, HiddenGem
+from apps.orders.models import Order
+from apps.platforms.models import Platform, Product
+from apps.users.models import User
+from . import benchmarks, counters, exports, home, metrics, outbox, pagination, rollups, search
+from .models import BlogPost, DailyMetric, EmailOutbox, RollupWatermark, SearchIndex
 
-# Create your tests here.
+
+class ViewCounterTests(TestCase):
+    def setUp(self):
+        counters.flush()
+        self.post = BlogPost.objects.create(title='Post', slug='post', excerpt='Excerpt', status='published')
+
+    def test_increments_are_buffered_until_flushed(self):
+        for _ in range(3):
+            counters.increment(self.post)
+        self.assertEqual(counters.pending_count(), 3)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 0)
+
+        self.assertEqual(counters.flush(), 3)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 3)
+        self.assertEqual(counters.pending_count(), 0)
+
+    @override_settings(VIEW_COUNTER_FLUSH_INTERVAL=0)
+    def test_zero_interval_writes_through(self):
+        counters.increment(self.post)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 1)
+
+
+class HomeStatsTests(TestCase):
+    def test_counts_active_rows_only(self):
+        platform = Platform.objects.create(name='Platform', slug='platform', website='https://example.com')
+        Platform.objects.create(name='Hidden', slug='hidden', website='https://example.com', is_active=False)
+        for i, active in enumerate([True, True, False]):
+            Product.objects.create(
+                platform=platform, name=f'Course {i}', slug=f'course-{i}', is_active=active,
+                original_price=Decimal('10'), our_price=Decimal('10'), commission_rate=Decimal('0'),
+            )
+
+        with self.assertNumQueries(1):
+            stats = home._stats()
+        self.assertEqual(stats, {'total_platforms': 1, 'total_hidden_gems': 0, 'total_products': 2})
+
+    def test_hidden_gems_counted(self):
+        category = GemCategory.objects.create(name='Government', slug='government')
+        HiddenGem.objects.create(
+            name='Gem', slug='gem', category=category, provider='Provider', country='India',
+            flag='🇮🇳', description='Free course', why_hidden='Few know it', url='https://example.com',
+        )
+        self.assertEqual(home._stats()['total_hidden_gems'], 1)
+
+
+class SearchIndexTests(TestCase):
+    def test_long_product_keywords_are_indexed_in_full(self):
+        platform = Platform.objects.create(name='P' * 100, slug='platform', website='https://example.com')
+        product = Product.objects.create(
+            platform=platform, name='Course', slug='course', short_description='x' * 294 + ' zebra',
+            original_price=Decimal('10'), our_price=Decimal('10'), commission_rate=Decimal('0'),
+        )
+
+        row = SearchIndex.objects.get(entity='product', object_id=product.pk)
+        self.assertTrue(row.keywords.endswith(' zebra'))
+        self.assertEqual(search.search('zebra')['product'], [product])
+
+
+class RollupRefreshTests(TestCase):
+    def orders_today(self):
+        return DailyMetric.objects.get(date=timezone.localdate()).paid_orders
+
+    def test_refresh_catches_up_once_stale(self):
+        Order.objects.create(subtotal=10, total=10, payment_status='paid')
+        rollups.refresh()
+        self.assertEqual(self.orders_today(), 1)
+
+        Order.objects.create(subtotal=10, total=10, payment_status='paid')
+        self.assertEqual(rollups.refresh(), 0)
+        self.assertEqual(self.orders_today(), 1)
+
+        RollupWatermark.objects.update(processed_until=timezone.now() - rollups.MAX_AGE)
+        rollups.refresh()
+        self.assertEqual(self.orders_today(), 2)
+
+    def test_dashboard_refreshes_the_charts(self):
+        staff = User.objects.create_user(username='staff', email='staff@example.com', password='x', is_staff=True)
+        Order.objects.create(subtotal=10, total=10, payment_status='paid')
+        self.client.force_login(staff)
+        self.client.get(reverse('analytics-dashboard'))
+        self.assertEqual(self.orders_today(), 1)
+
+
+class ExportTests(TestCase):
+    def setUp(self):
+        platform = Platform.objects.create(name='Platform', slug='platform', website='https://example.com')
+        Product.objects.create(
+            platform=platform, name='=HYPERLINK("http://evil.example")', slug='evil',
+            original_price=Decimal('10'), our_price=Decimal('-1'), commission_rate=Decimal('0'),
+        )
+
+    def test_csv_escapes_formulas(self):
+        lines = list(exports.stream('products', {}, 'csv'))
+        self.assertEqual(len(lines), 2)
+        self.assertIn('"\'=HYPERLINK(""http://evil.example"")"', lines[1])
+        # Numbers are left alone, even negative ones
+        self.assertIn(',-1.00,', lines[1])
+
+    def test_jsonl_is_not_escaped(self):
+        line = list(exports.stream('products', {}, 'jsonl'))[0]
+        self.assertIn('"name": "=HYPERLINK', line)
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        for i in range(20):
+            BlogPost.objects.create(title=f'Post {i}', slug=f'post-{i}', excerpt='Excerpt', status='published')
+        self.posts = BlogPost.objects.order_by('-pk')
+
+    def test_cursors_walk_forward_and_back(self):
+        first = pagination.paginate(self.posts, 9)
+        self.assertFalse(first.has_previous())
+        second = pagination.paginate(self.posts, 9, first.next_cursor)
+        third = pagination.paginate(self.posts, 9, second.next_cursor)
+        self.assertEqual(len(third), 2)
+        self.assertFalse(third.has_next())
+
+        seen = [post.pk for page in (first, second, third) for post in page]
+        self.assertEqual(seen, list(self.posts.values_list('pk', flat=True)))
+
+        back = pagination.paginate(self.posts, 9, second.previous_cursor)
+        self.assertEqual([post.pk for post in back], [post.pk for post in first])
+
+    def test_listing_links_to_the_next_page(self):
+        response = self.client.get(reverse('blog'), {'q': 'x'})
+        next_url = response.context['page_obj'].next_cursor
+        self.assertContains(response, '?q=x&amp;cursor=')
+        self.assertIsNone(response.context['total_count'])
+
+        response = self.client.get(reverse('blog'), {'cursor': next_url})
+        self.assertEqual(len(response.context['posts']), 9)
+
+    def test_offset_pages_link_by_number(self):
+        response = self.client.get(reverse('blog'), {'page': 2})
+        self.assertContains(response, 'href="?page=1"')
+        self.assertContains(response, 'href="?page=3"')
+
+    def test_bad_cursor_is_404(self):
+        self.assertEqual(self.client.get(reverse('blog'), {'cursor': 'nope'}).status_code, 404)
+
+    def test_counts_are_cached_in_the_volatile_alias(self):
+        caches['volatile'].clear()
+        self.assertEqual(pagination.approximate_count(self.posts), 20)
+        BlogPost.objects.create(title='Post 20', slug='post-20', excerpt='Excerpt', status='published')
+        with self.assertNumQueries(0):
+            self.assertEqual(pagination.approximate_count(self.posts), 20)
+        caches['volatile'].clear()
+        self.assertEqual(pagination.approximate_count(self.posts), 21)
+
+
+@override_settings(DEBUG=False)
+class BenchmarkSafetyTests(TestCase):
+    def test_refuses_without_debug_or_flag(self):
+        for command in ('seed_bench', 'bench_views'):
+            with self.assertRaises(CommandError):
+                call_command(command)
+
+    def test_staff_account_removed_after_run(self):
+        benchmarks.run_views(only=['home'], runs=1, warmup=0)
+        self.assertFalse(User.objects.filter(username=benchmarks.BENCH_STAFF).exists())
+
+
+class MetricsTests(TestCase):
+    def test_unknown_methods_share_one_label(self):
+        self.client.generic('BREW', reverse('home'))
+        self.client.generic('FOO123', reverse('home'))
+        self.assertIsNotNone(metrics.REGISTRY.get_sample_value(
+            'zth_http_requests_total', {'view': 'home', 'method': 'other', 'status': '405'},
+        ))
+        self.assertIsNone(metrics.REGISTRY.get_sample_value(
+            'zth_http_requests_total', {'view': 'home', 'method': 'BREW', 'status': '405'},
+        ))
+
+
+class FailingConnection:
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send_messages(self, messages):
+        raise OSError('SMTP down')
+
+
+@override_settings(EMAIL_OUTBOX_ENABLED=True, EMAIL_OUTBOX_MAX_ATTEMPTS=2, EMAIL_OUTBOX_RETRY_DELAY=60)
+class OutboxTests(TestCase):
+    def queue(self):
+        outbox.send_mail('Welcome', 'Hello', 'team@example.com', ['student@example.com'])
+        return EmailOutbox.objects.get()
+
+    def test_send_mail_only_queues(self):
+        row = self.queue()
+        self.assertEqual((row.status, row.to), ('pending', ['student@example.com']))
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_process_delivers_and_marks_sent(self):
+        row = self.queue()
+        self.assertEqual(outbox.process(), (1, 0))
+        row.refresh_from_db()
+        self.assertEqual((row.status, row.attempts), ('sent', 1))
+        self.assertEqual(mail.outbox[0].subject, 'Welcome')
+        self.assertEqual(outbox.process(), (0, 0))
+
+    def test_failure_is_retried_with_backoff_then_given_up(self):
+        row = self.queue()
+        self.assertEqual(outbox.process(connection=FailingConnection()), (0, 1))
+        row.refresh_from_db()
+        self.assertEqual((row.status, row.attempts, row.last_error), ('pending', 1, 'SMTP down'))
+        self.assertGreater(row.send_after, timezone.now() + timedelta(seconds=50))
+
+        # Not due yet
+        self.assertEqual(outbox.claim(), [])
+
+        EmailOutbox.objects.update(send_after=timezone.now())
+        outbox.process(connection=FailingConnection())
+        row.refresh_from_db()
+        self.assertEqual((row.status, row.attempts), ('failed', 2))
+
+    def test_claimed_rows_are_not_handed_out_twice(self):
+        self.queue()
+        self.assertEqual(len(outbox.claim()), 1)
+        self.assertEqual(outbox.claim(), [])
+
+    def test_stale_claims_are_handed_out_again(self):
+        self.queue()
+        outbox.claim()
+        EmailOutbox.objects.update(claimed_at=timezone.now() - outbox.CLAIM_TIMEOUT - timedelta(minutes=1))
+        self.assertEqual(len(outbox.claim()), 1)
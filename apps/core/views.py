@@ -11,6 +11,8 @@ from django.utils.encoding import force_bytes, force_str
 from django.core.mail import send_mail
 from django.conf import settings
 from .models import *
+from . import caching, counters, faq, home, search
+from .pagination import KeysetPaginationMixin
 from apps.platforms.models import Platform, Product, Bundle
 from apps.learning.models import HiddenGem
 
@@ -21,25 +23,8 @@ class HomeView(TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        # Site Settings
-        context['settings'] = SiteSettings.objects.first()
-        
-        # Featured Platforms (4 platforms)
-        context['featured_platforms'] = Platform.objects.filter(
-            is_featured=True, 
-            is_active=True
-        )[:4]
-        
-        # Featured Hidden Gems (4 gems)
-        context['featured_gems'] = HiddenGem.objects.filter(
-            is_featured=True,
-            is_active=True
-        )[:4]
-        
-        # Stats
-        context['total_platforms'] = Platform.objects.filter(is_active=True).count()
-        context['total_hidden_gems'] = HiddenGem.objects.filter(is_active=True).count()
-        context['total_products'] = Product.objects.filter(is_active=True).count()
+        # Site settings, featured platforms/gems & stats - cached per fragment
+        context.update(home.get_context())
         
         return context
 
@@ -50,7 +35,7 @@ class AboutView(TemplateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['founder'] = Founder.objects.first()
+        context['founder'] = caching.cached_get(Founder)
         context['missions'] = Mission.objects.all()
         context['impact_stats'] = ImpactStat.objects.all()
         return context
@@ -87,18 +72,18 @@ class FAQView(TemplateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['categories'] = FAQCategory.objects.prefetch_related('faqs').filter(
-            faqs__is_active=True
-        ).distinct()
+        context['categories'] = faq.tree()
         return context
 
 
-class BlogListView(ListView):
+class BlogListView(KeysetPaginationMixin, ListView):
     """Blog Listing Page"""
     model = BlogPost
     template_name = 'core/blog.html'
     context_object_name = 'posts'
     paginate_by = 9
+    # The blog template shows no total
+    count_mode = None
     
     def get_queryset(self):
         return BlogPost.objects.filter(status='published').select_related('category')
@@ -112,8 +97,9 @@ class BlogDetailView(DetailView):
     
     def get_object(self):
         obj = super().get_object()
+        # Buffered; written back in batches by apps.core.counters
+        counters.increment(obj)
         obj.views += 1
-        obj.save()
         return obj
 
 
@@ -329,34 +315,13 @@ def search_view(request):
             'total_results': 0
         })
     
-    # Search in platforms
-    platforms = Platform.objects.filter(
-        is_active=True
-    ).filter(
-        Q(name__icontains=query) | 
-        Q(description__icontains=query) |
-        Q(category__name__icontains=query)
-    ).distinct()[:10]
-    
-    # Search in products/courses
-    products = Product.objects.filter(
-        is_active=True
-    ).filter(
-        Q(name__icontains=query) |
-        Q(description__icontains=query) |
-        Q(platform__name__icontains=query)
-    ).distinct()[:10]
-    
-    # Search in hidden gems
-    hidden_gems = HiddenGem.objects.filter(
-        is_active=True
-    ).filter(
-        Q(title__icontains=query) |
-        Q(description__icontains=query) |
-        Q(category__icontains=query)
-    ).distinct()[:10]
+    # Ranked lookup against the precomputed index (apps.core.search)
+    results = search.search(query)
+    platforms = results['platform']
+    products = results['product']
+    hidden_gems = results['gem']
     
-    total_results = platforms.count() + products.count() + hidden_gems.count()
+    total_results = len(platforms) + len(products) + len(hidden_gems)
     
     return render(request, 'core/search.html', {
         'query': query,
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='hiddengem',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-is_featured', 'name'], name='learning_gem_active_order'),
+        ),
+    ]
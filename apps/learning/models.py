@@ -62,6 +62,14 @@ class HiddenGem(models.Model):
     
     class Meta:
         ordering = ['-is_featured', 'name']
+        indexes = [
+            # Hidden gems page and home page: active gems in display order
+            # (category filters use the category_id foreign key index)
+            models.Index(
+                fields=['-is_featured', 'name'], condition=models.Q(is_active=True),
+                name='learning_gem_active_order',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.flag} {self.name}"
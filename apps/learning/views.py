@@ -1,6 +1,7 @@
 from django.shortcuts import render, get_object_or_404
 from django.views.generic import ListView, DetailView
 from django.db.models import Q
+from apps.core import caching, counters
 from .models import HiddenGem, Roadmap, RoadmapPhase, Certification, Lab, GemCategory
 
 def hidden_gems(request):
@@ -26,7 +27,7 @@ def hidden_gems(request):
     
     context = {
         'gems': gems,
-        'categories': GemCategory.objects.all(),
+        'categories': caching.cached_queryset(GemCategory.objects.all()),
         'featured': featured,
         'total_count': gems.count(),
     }
@@ -35,8 +36,9 @@ def hidden_gems(request):
 def hidden_gem_detail(request, slug):
     """Single Hidden Gem Detail"""
     gem = get_object_or_404(HiddenGem, slug=slug, is_active=True)
+    # Buffered; written back in batches by apps.core.counters
+    counters.increment(gem)
     gem.views += 1
-    gem.save()
     return render(request, 'learning/hidden-gem-detail.html', {'gem': gem})
 
 def roadmap(request):
@@ -0,0 +1,43 @@
+"""
+Order Filters for Zero To Hero
+
+The search / status / payment status / date range filters behind the
+dashboard orders page, shared with the staff exports.
+"""
+from datetime import datetime
+
+
+def parse_date(value):
+    """YYYY-MM-DD to a date, or None if blank or malformed"""
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        return None
+
+
+def filter_by_dates(queryset, params, field='created_at'):
+    date_from = parse_date(params.get('date_from', ''))
+    if date_from:
+        queryset = queryset.filter(**{f'{field}__date__gte': date_from})
+    date_to = parse_date(params.get('date_to', ''))
+    if date_to:
+        queryset = queryset.filter(**{f'{field}__date__lte': date_to})
+    return queryset
+
+
+def filter_orders(orders, params):
+    """Apply the GET filters of the orders page to an Order queryset"""
+    # Search by order number
+    search_query = params.get('search', '').strip()
+    if search_query:
+        orders = orders.filter(order_number__icontains=search_query)
+    
+    status_filter = params.get('status', '')
+    if status_filter:
+        orders = orders.filter(order_status=status_filter)
+    
+    payment_status = params.get('payment_status', '')
+    if payment_status:
+        orders = orders.filter(payment_status=payment_status)
+    
+    return filter_by_dates(orders, params)
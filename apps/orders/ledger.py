@@ -0,0 +1,134 @@
+"""
+Platform Sales Ledger for Zero To Hero
+
+Keeps PlatformSalesLedger in step with order items so per-platform sales can
+be read without joining through products and order items. Every change is a
+relative F() update on a (platform, day) row, so concurrent checkouts never
+overwrite each other. Days are the day the order item was created.
+"""
+from decimal import Decimal
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+from .models import OrderItem, PlatformSalesLedger
+
+
+def is_refunded(order):
+    return order.payment_status == 'refunded' or order.order_status == 'refunded'
+
+
+def _line_total(item):
+    return Decimal(item.price) * item.quantity
+
+
+# ===== POSTING =====
+
+def post(platform_id, day, sign=1, **amounts):
+    """Add (sign=1) or subtract (sign=-1) amounts on one ledger row"""
+    changes = {field: F(field) + sign * value for field, value in amounts.items()}
+    entries = PlatformSalesLedger.objects.filter(platform_id=platform_id, date=day)
+    if entries.update(**changes):
+        return
+    # First sale for this platform today; a concurrent insert is fine, the
+    # second update below lands on whichever row won
+    PlatformSalesLedger.objects.bulk_create(
+        [PlatformSalesLedger(platform_id=platform_id, date=day)],
+        ignore_conflicts=True,
+    )
+    entries.update(**changes)
+
+
+def record_item(item, sign=1):
+    """Book (or reverse) a single order item"""
+    from apps.platforms.models import Product
+
+    if item.product_id is None:
+        return
+    platform_id = Product.objects.filter(pk=item.product_id).values_list('platform_id', flat=True).first()
+    if platform_id is None:
+        return
+    post(
+        platform_id,
+        timezone.localdate(item.created_at),
+        sign,
+        items=1,
+        units=item.quantity,
+        revenue=_line_total(item),
+        commission=item.commission_amount,
+    )
+
+
+def _grouped(items):
+    """Ledger amounts per (platform, day) for an OrderItem queryset"""
+    return (
+        items.filter(product__isnull=False)
+        .annotate(day=TruncDate('created_at'))
+        .order_by()
+        .values('product__platform_id', 'day')
+        .annotate(
+            line_items=Count('id'),
+            line_units=Sum('quantity'),
+            line_revenue=Sum(F('price') * F('quantity'), output_field=DecimalField(max_digits=14, decimal_places=2)),
+            line_commission=Sum('commission_amount'),
+        )
+    )
+
+
+def record_order(order, sign=1):
+    """Book (or reverse) every item of an order, one update per platform/day"""
+    for row in _grouped(OrderItem.objects.filter(order=order)):
+        post(
+            row['product__platform_id'],
+            row['day'],
+            sign,
+            items=row['line_items'],
+            units=row['line_units'],
+            revenue=row['line_revenue'],
+            commission=row['line_commission'],
+        )
+
+
+def rebuild():
+    """Recompute the whole ledger from order items. Returns the row count."""
+    items = OrderItem.objects.exclude(order__payment_status='refunded').exclude(order__order_status='refunded')
+    entries = [
+        PlatformSalesLedger(
+            platform_id=row['product__platform_id'],
+            date=row['day'],
+            items=row['line_items'],
+            units=row['line_units'],
+            revenue=row['line_revenue'],
+            commission=row['line_commission'],
+        )
+        for row in _grouped(items)
+    ]
+    with transaction.atomic():
+        PlatformSalesLedger.objects.all().delete()
+        PlatformSalesLedger.objects.bulk_create(entries, batch_size=1000)
+    return len(entries)
+
+
+# ===== READS =====
+
+def with_sales(platforms, since=None):
+    """
+    Annotate a Platform queryset with order_count (line items) and
+    total_sales (revenue) from the ledger, one correlated subquery each.
+    """
+    entries = PlatformSalesLedger.objects.filter(platform=OuterRef('pk'))
+    if since is not None:
+        entries = entries.filter(date__gte=since)
+    totals = entries.order_by().values('platform')
+
+    return platforms.annotate(
+        order_count=Coalesce(
+            Subquery(totals.annotate(total=Sum('items')).values('total')),
+            0,
+        ),
+        total_sales=Coalesce(
+            Subquery(totals.annotate(total=Sum('revenue')).values('total')),
+            Decimal('0'),
+            output_field=DecimalField(max_digits=14, decimal_places=2),
+        ),
+    )
@@ -0,0 +1,21 @@
+"""
+Rebuild the platform sales ledger from order items.
+
+Signals keep the ledger current for normal checkouts and refunds; run this
+after the migration that adds it, after bulk order imports or deletes, or
+whenever the ledger looks out of step with the order items.
+"""
+import time
+from django.core.management.base import BaseCommand
+from apps.orders import ledger
+
+
+class Command(BaseCommand):
+    help = 'Recompute PlatformSalesLedger from order items'
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        count = ledger.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ Sales ledger rebuilt: {count} platform/day rows in {time.monotonic() - started:.2f}s'
+        ))
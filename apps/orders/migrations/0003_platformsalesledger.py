@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, DecimalField, F, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_ledger(apps, schema_editor):
+    OrderItem = apps.get_model('orders', 'OrderItem')
+    PlatformSalesLedger = apps.get_model('orders', 'PlatformSalesLedger')
+
+    rows = (
+        OrderItem.objects.filter(product__isnull=False)
+        .exclude(order__payment_status='refunded')
+        .exclude(order__order_status='refunded')
+        .annotate(day=TruncDate('created_at'))
+        .order_by()
+        .values('product__platform_id', 'day')
+        .annotate(
+            line_items=Count('id'),
+            line_units=Sum('quantity'),
+            line_revenue=Sum(F('price') * F('quantity'), output_field=DecimalField(max_digits=14, decimal_places=2)),
+            line_commission=Sum('commission_amount'),
+        )
+    )
+    PlatformSalesLedger.objects.bulk_create([
+        PlatformSalesLedger(
+            platform_id=row['product__platform_id'],
+            date=row['day'],
+            items=row['line_items'],
+            units=row['line_units'],
+            revenue=row['line_revenue'],
+            commission=row['line_commission'],
+        )
+        for row in rows
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_initial'),
+        ('platforms', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlatformSalesLedger',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('items', models.IntegerField(default=0)),
+                ('units', models.IntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('commission', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('platform', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sales_ledger', to='platforms.platform')),
+            ],
+            options={
+                'ordering': ['-date'],
+                'unique_together': {('platform', 'date')},
+            },
+        ),
+        migrations.RunPython(backfill_ledger, migrations.RunPython.noop),
+    ]
@@ -56,6 +56,18 @@ class Order(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Dashboard: a user's recent orders, and their paid totals
+            models.Index(fields=['user', '-created_at'], name='orders_order_user_recent'),
+            models.Index(fields=['user', 'payment_status', 'created_at'], name='orders_order_user_paid'),
+            # Analytics: paid orders by date range
+            models.Index(
+                fields=['created_at'], condition=models.Q(payment_status='paid'),
+                name='orders_order_paid_created',
+            ),
+            # Rollups: orders changed since the last run
+            models.Index(fields=['updated_at'], name='orders_order_updated'),
+        ]
     
     def __str__(self):
         return f"Order #{self.order_number}"
@@ -85,4 +97,27 @@ class OrderItem(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     
     def __str__(self):
-        return f"{self.order.order_number} - {self.product_name}"
\ No newline at end of file
+        return f"{self.order.order_number} - {self.product_name}"
+
+
+class PlatformSalesLedger(models.Model):
+    """Per-platform, per-day sales totals
+
+    Booked by apps.orders.signals when order items are created, and reversed
+    when they are deleted or their order is refunded. Revenue is the line
+    total (price x quantity), so an order is never counted once per item.
+    """
+    platform = models.ForeignKey('platforms.Platform', on_delete=models.CASCADE, related_name='sales_ledger')
+    date = models.DateField()
+    
+    items = models.IntegerField(default=0)
+    units = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    commission = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    
+    class Meta:
+        unique_together = ['platform', 'date']
+        ordering = ['-date']
+    
+    def __str__(self):
+        return f"{self.platform_id} @ {self.date}"
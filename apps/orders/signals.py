@@ -0,0 +1,54 @@
+"""
+Signal handlers for the orders app
+"""
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
+from . import ledger
+from .models import Order, OrderItem
+
+
+# ===== PLATFORM SALES LEDGER =====
+
+STATUS_FIELDS = {'payment_status', 'order_status'}
+
+
+def _order_refunded(order_id):
+    order = Order.objects.filter(pk=order_id).only('payment_status', 'order_status').first()
+    return order is None or ledger.is_refunded(order)
+
+
+@receiver(post_save, sender=OrderItem)
+def book_order_item(sender, instance, created, raw=False, **kwargs):
+    if raw or not created or _order_refunded(instance.order_id):
+        return
+    ledger.record_item(instance)
+
+
+@receiver(post_delete, sender=OrderItem)
+def reverse_order_item(sender, instance, **kwargs):
+    if _order_refunded(instance.order_id):
+        return
+    ledger.record_item(instance, sign=-1)
+
+
+def _status_saved(update_fields):
+    """Whether a save can change the order's refund state"""
+    return update_fields is None or not STATUS_FIELDS.isdisjoint(update_fields)
+
+
+@receiver(pre_save, sender=Order)
+def remember_refund_state(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or instance.pk is None or not _status_saved(update_fields):
+        return
+    previous = Order.objects.filter(pk=instance.pk).only('payment_status', 'order_status').first()
+    instance._was_refunded = previous is not None and ledger.is_refunded(previous)
+
+
+@receiver(post_save, sender=Order)
+def book_refund(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw or created or not _status_saved(update_fields):
+        return
+    refunded = ledger.is_refunded(instance)
+    if refunded != getattr(instance, '_was_refunded', refunded):
+        # Refunded: take the items back out; un-refunded: book them again
+        ledger.record_order(instance, sign=-1 if refunded else 1)
@@ -1,3 +1,54 @@
+from decimal import Decimal
 from django.test import TestCase
+from django.utils import timezone
+from apps.platforms.models import Platform, Product
+from .models import Order, OrderItem, PlatformSalesLedger
 
-# Create your tests here.
+
+class SalesLedgerTests(TestCase):
+    def setUp(self):
+        self.platform = Platform.objects.create(name='Platform', slug='platform', website='https://example.com')
+        self.product = Product.objects.create(
+            platform=self.platform, name='Course', slug='course',
+            original_price=Decimal('100'), our_price=Decimal('90'), commission_rate=Decimal('5'),
+        )
+        self.order = Order.objects.create(subtotal=180, total=180, payment_status='paid')
+
+    def add_item(self, quantity=2):
+        return OrderItem.objects.create(
+            order=self.order, product=self.product, product_name='Course', platform_name='Platform',
+            price=Decimal('90'), quantity=quantity, commission_rate=Decimal('5'), commission_amount=Decimal('9'),
+        )
+
+    def ledger(self):
+        entry = PlatformSalesLedger.objects.filter(platform=self.platform, date=timezone.localdate()).first()
+        return (entry.items, entry.units, entry.revenue) if entry else None
+
+    def test_items_are_booked_and_reversed(self):
+        item = self.add_item()
+        self.assertEqual(self.ledger(), (1, 2, Decimal('180')))
+        item.delete()
+        self.assertEqual(self.ledger(), (0, 0, Decimal('0')))
+
+    def test_refund_reverses_and_unrefund_rebooks(self):
+        self.add_item()
+        self.order.payment_status = 'refunded'
+        self.order.save()
+        self.assertEqual(self.ledger(), (0, 0, Decimal('0')))
+
+        self.order.payment_status = 'paid'
+        self.order.save(update_fields=['payment_status'])
+        self.assertEqual(self.ledger(), (1, 2, Decimal('180')))
+
+    def test_items_of_refunded_orders_are_not_booked(self):
+        self.order.order_status = 'refunded'
+        self.order.save()
+        self.add_item()
+        self.assertIsNone(self.ledger())
+
+    def test_saves_without_status_fields_skip_the_lookup(self):
+        self.add_item()
+        # Just the UPDATE: no SELECT of the previous status
+        with self.assertNumQueries(1):
+            self.order.save(update_fields=['total'])
+        self.assertEqual(self.ledger(), (1, 2, Decimal('180')))
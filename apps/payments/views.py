@@ -6,6 +6,8 @@ from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from apps.cart.cart import Cart
+from apps.core.metrics import gateway_call
 import json
 
 # Stripe setup
@@ -17,15 +19,13 @@ razorpay_client = razorpay.Client(auth=(settings.RAZORPAY_KEY_ID, settings.RAZOR
 @login_required
 def checkout(request):
     """Display checkout page"""
-    cart = request.session.get('cart', {})
-    if not cart:
+    summary = Cart(request).summary()
+    if not summary['count']:
         messages.warning(request, 'Your cart is empty')
         return redirect('cart')
     
-    # Calculate total
-    total = 0
-    for product_id, quantity in cart.items():
-        total += 100 * quantity  # Placeholder price
+    # Total from the cart's price snapshot
+    total = summary['total']
     
     context = {
         'stripe_publishable_key': settings.STRIPE_PUBLISHABLE_KEY,
@@ -41,14 +41,14 @@ def process_payment(request):
     
     try:
         # Create PaymentIntent
-        cart = request.session.get('cart', {})
-        total = sum(100 * qty for qty in cart.values())  # Placeholder
+        total = Cart(request).summary()['total']
         
-        intent = stripe.PaymentIntent.create(
-            amount=int(total * 100),  # Convert to cents
-            currency=settings.STRIPE_CURRENCY,
-            metadata={'user_id': request.user.id},
-        )
+        with gateway_call('stripe', 'create_payment_intent'):
+            intent = stripe.PaymentIntent.create(
+                amount=int(total * 100),  # Convert to cents
+                currency=settings.STRIPE_CURRENCY,
+                metadata={'user_id': request.user.id},
+            )
         
         return JsonResponse({
             'clientSecret': intent.client_secret
@@ -60,8 +60,7 @@ def process_payment(request):
 def payment_success(request):
     """Payment success page"""
     # Clear cart
-    request.session['cart'] = {}
-    request.session.modified = True
+    Cart(request).clear()
     
     messages.success(request, '🎉 Payment successful! Your order has been placed.')
     return render(request, 'payments/success.html')
@@ -78,9 +77,10 @@ def stripe_webhook(request):
     sig_header = request.META.get('HTTP_STRIPE_SIGNATURE')
     
     try:
-        event = stripe.Webhook.construct_event(
-            payload, sig_header, settings.STRIPE_WEBHOOK_SECRET
-        )
+        with gateway_call('stripe', 'verify_webhook'):
+            event = stripe.Webhook.construct_event(
+                payload, sig_header, settings.STRIPE_WEBHOOK_SECRET
+            )
         
         if event['type'] == 'payment_intent.succeeded':
             # Handle successful payment
@@ -97,15 +97,13 @@ def stripe_webhook(request):
 @login_required
 def razorpay_checkout(request):
     """Display Razorpay checkout page"""
-    cart = request.session.get('cart', {})
-    if not cart:
+    summary = Cart(request).summary()
+    if not summary['count']:
         messages.warning(request, 'Your cart is empty')
         return redirect('cart')
     
-    # Calculate total in paise (INR smallest unit)
-    total = 0
-    for product_id, quantity in cart.items():
-        total += 100 * quantity  # Placeholder price in INR
+    # Total in INR from the cart's price snapshot
+    total = summary['total']
     
     # Create Razorpay order
     try:
@@ -118,7 +116,8 @@ def razorpay_checkout(request):
                 'user_email': request.user.email,
             }
         }
-        razorpay_order = razorpay_client.order.create(order_data)
+        with gateway_call('razorpay', 'create_order'):
+            razorpay_order = razorpay_client.order.create(order_data)
         
         context = {
             'razorpay_key_id': settings.RAZORPAY_KEY_ID,
@@ -155,11 +154,11 @@ def razorpay_payment_verify(request):
             'razorpay_signature': razorpay_signature
         }
         
-        razorpay_client.utility.verify_payment_signature(params_dict)
+        with gateway_call('razorpay', 'verify_payment'):
+            razorpay_client.utility.verify_payment_signature(params_dict)
         
         # Payment successful - clear cart
-        request.session['cart'] = {}
-        request.session.modified = True
+        Cart(request).clear()
         
         return JsonResponse({
             'status': 'success',
@@ -183,7 +182,8 @@ def razorpay_webhook(request):
         
         # Verify webhook signature if secret is configured
         if webhook_secret:
-            razorpay_client.utility.verify_webhook_signature(payload, signature, webhook_secret)
+            with gateway_call('razorpay', 'verify_webhook'):
+                razorpay_client.utility.verify_webhook_signature(payload, signature, webhook_secret)
         
         data = json.loads(payload)
         event = data.get('event')
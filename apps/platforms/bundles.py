@@ -0,0 +1,50 @@
+"""
+Bundle Pricing for Zero To Hero
+
+Bundle.original_total / savings_* are denormalised from the prices of the
+bundle's products. They are recomputed here from one Sum() aggregate per
+batch of bundles rather than by loading every product, and kept fresh by the
+signals in apps.platforms.signals: when the products M2M changes, when a
+product's our_price changes, and when a product in a bundle is deleted.
+
+queryset.update() and bulk_create() bypass those signals, so callers that
+reprice products in bulk should call recalculate_for_products() afterwards.
+"""
+from decimal import Decimal
+from django.db.models import Sum
+from django.db.models.functions import Coalesce
+
+TOTAL_FIELDS = ['original_total', 'savings_amount', 'savings_percentage']
+
+
+def bundle_ids_for_products(product_ids):
+    from .models import Bundle
+    return list(
+        Bundle.products.through.objects
+        .filter(product_id__in=product_ids)
+        .values_list('bundle_id', flat=True)
+        .distinct()
+    )
+
+
+def recalculate(bundle_ids):
+    """Recompute totals for the given bundles: one aggregate, one bulk UPDATE"""
+    from .models import Bundle
+
+    bundle_ids = [pk for pk in set(bundle_ids) if pk is not None]
+    if not bundle_ids:
+        return 0
+    bundles = list(
+        Bundle.objects.filter(pk__in=bundle_ids)
+        .annotate(products_total=Coalesce(Sum('products__our_price'), Decimal('0')))
+        .only('pk', 'bundle_price')
+    )
+    for bundle in bundles:
+        bundle.apply_totals(bundle.products_total)
+    Bundle.objects.bulk_update(bundles, TOTAL_FIELDS)
+    return len(bundles)
+
+
+def recalculate_for_products(product_ids):
+    """Recompute every bundle containing one of the given products"""
+    return recalculate(bundle_ids_for_products(product_ids))
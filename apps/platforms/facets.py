@@ -0,0 +1,140 @@
+"""
+Product Facets for Zero To Hero
+
+Filtering and facet counts for the product catalogue. For every value of
+every facet (category, difficulty, price band, product type) counts() returns
+how many products would match if that value were chosen, keeping the other
+active filters, all from one conditional aggregate.
+
+Filters behave as the listing always has: an unknown category, difficulty
+or product type matches nothing, and an unknown price band is ignored.
+
+Counts are cached through apps.core.caching, keyed on the Product and
+ProductCategory versions that every save or delete bumps, so a warm sidebar
+costs no queries and a stale one is never served. Searches (?q=) are not
+cached, since every search term would get its own key.
+"""
+from django.db.models import Count, Q
+from apps.core import caching
+from .models import Product, ProductCategory
+
+CACHE_TIMEOUT = 60 * 60
+
+# Matches no rows, for filter values that don't exist
+NOTHING = Q(pk__in=[])
+
+PRICE_BANDS = [
+    ('free', 'Free', Q(is_free=True)),
+    ('under1000', 'Under ₹1,000', Q(our_price__lt=1000)),
+    ('1000-5000', '₹1,000 - ₹5,000', Q(our_price__gte=1000, our_price__lte=5000)),
+]
+
+FACETS = ['category', 'difficulty', 'price', 'product_type']
+
+
+def _categories():
+    return caching.cached_queryset(
+        ProductCategory.objects.order_by('name').values_list('pk', 'slug', 'name'), name='facets',
+    )
+
+
+# ===== FILTERS =====
+
+def _options(facet):
+    """(value, label, Q) for every value of a facet"""
+    if facet == 'category':
+        return [(slug, name, Q(category_id=pk)) for pk, slug, name in _categories()]
+    if facet == 'price':
+        return PRICE_BANDS
+    field = Product._meta.get_field(facet)
+    return [(value, label, Q(**{facet: value})) for value, label in field.choices]
+
+
+def _known(facet, value):
+    return any(option == value for option, _, _ in _options(facet))
+
+
+def selected(params):
+    """The facet values chosen in a GET QueryDict (unknown price bands dropped)"""
+    chosen = {}
+    for facet in FACETS:
+        value = params.get(facet)
+        if not value:
+            continue
+        if facet == 'price' and not _known(facet, value):
+            continue
+        chosen[facet] = value
+    return chosen
+
+
+def _search(params):
+    q = params.get('q')
+    if not q:
+        return Q()
+    return Q(name__icontains=q) | Q(description__icontains=q) | Q(platform__name__icontains=q)
+
+
+def _condition(chosen, exclude=None):
+    condition = Q()
+    for facet, value in chosen.items():
+        if facet != exclude:
+            condition &= next((q for option, _, q in _options(facet) if option == value), NOTHING)
+    return condition
+
+
+def apply(queryset, params):
+    """Filter a product queryset by the search term and chosen facets"""
+    return queryset.filter(_search(params) & _condition(selected(params)))
+
+
+# ===== COUNTS =====
+
+def _compute(params, chosen):
+    aggregates = {'total': Count('id', filter=_condition(chosen))}
+    for facet in FACETS:
+        others = _condition(chosen, exclude=facet)
+        for index, (_, _, q) in enumerate(_options(facet)):
+            aggregates[f'{facet}_{index}'] = Count('id', filter=others & q)
+
+    row = Product.objects.filter(_search(params), is_active=True).aggregate(**aggregates)
+
+    result = {'total': row['total']}
+    for facet in FACETS:
+        result[facet] = [
+            {
+                'value': value,
+                'label': label,
+                'count': row[f'{facet}_{index}'],
+                'selected': chosen.get(facet) == value,
+            }
+            for index, (value, label, _) in enumerate(_options(facet))
+        ]
+    return result
+
+
+def counts(params):
+    """
+    {'total': n, 'category': [{'value', 'label', 'count', 'selected'}, ...], ...}
+    for the active products matching the search term, one list per facet.
+    """
+    chosen = selected(params)
+    # Free text and unknown values would each get their own key; don't cache them
+    if params.get('q') or not all(_known(facet, value) for facet, value in chosen.items()):
+        return _compute(params, chosen)
+    name = 'facets:' + ','.join(f'{facet}={value}' for facet, value in sorted(chosen.items()))
+    return caching.cached_get(
+        Product, name, getter=lambda: _compute(params, chosen),
+        depends_on=(ProductCategory,), timeout=CACHE_TIMEOUT,
+    )
+
+
+def count_for(facets, facet, value):
+    """Count for a single facet value from a counts() result"""
+    return next((option['count'] for option in facets[facet] if option['value'] == value), 0)
+
+
+def free_count():
+    """Free products in the whole catalogue, regardless of filters"""
+    return caching.cached_get(
+        Product, 'free_count', getter=lambda: Product.objects.filter(is_free=True).count(), timeout=CACHE_TIMEOUT,
+    )
@@ -0,0 +1,259 @@
+"""
+Catalogue Import for Zero To Hero
+
+Streams platforms or products from CSV / JSONL into the database in chunks.
+Rows are matched on slug and upserted with bulk_create(update_conflicts=True);
+commission_amount is computed per row in Python, without Product.save().
+Only the columns present in the file are written, so a file with just
+slug + our_price reprices existing products and leaves the rest alone.
+
+Everything per-row signals would normally do - platform product counts,
+bundle totals, search index, facet and home page caches - is done once at
+the end.
+"""
+import csv
+import io
+import json
+import sys
+import time
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils.text import slugify
+from .models import Platform, PlatformCategory, Product, ProductCategory
+
+# Columns that name a related row by its slug
+RELATIONS = {
+    Platform: {'category': PlatformCategory},
+    Product: {'platform': Platform, 'category': ProductCategory},
+}
+
+# Filled in by the database or computed here, never read from the file
+SKIP_FIELDS = {'id', 'created_at', 'updated_at', 'total_products', 'commission_amount', 'logo', 'image'}
+
+
+class ImportStats:
+    def __init__(self):
+        self.rows = 0
+        self.imported = 0
+        self.errors = []
+        self.slugs = set()
+        # Platforms products moved away from, which need a recount too
+        self.previous_platform_ids = set()
+        self.started = time.monotonic()
+
+    @property
+    def seconds(self):
+        return time.monotonic() - self.started
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else float(self.rows)
+
+
+# ===== READING =====
+
+def read_rows(stream, fmt):
+    """Yield (line number, dict) from a text stream of CSV or JSON lines"""
+    if fmt == 'csv':
+        for number, row in enumerate(csv.DictReader(stream), start=2):
+            yield number, row
+        return
+    for number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as error:
+            yield number, error
+            continue
+        yield number, row
+
+
+def open_source(path):
+    if path == '-':
+        return io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8')
+    return open(path, newline='', encoding='utf-8')
+
+
+# ===== BUILDING =====
+
+class _Builder:
+    """Turns raw rows into unsaved model instances"""
+
+    def __init__(self, model):
+        self.model = model
+        self.relations = RELATIONS[model]
+        self.fields = {
+            field.name: field
+            for field in model._meta.concrete_fields
+            if field.name not in SKIP_FIELDS
+        }
+        # slug -> pk for every related table, loaded once
+        self.lookups = {
+            name: dict(related.objects.values_list('slug', 'pk'))
+            for name, related in self.relations.items()
+        }
+
+    def columns(self, row):
+        return [name for name in row if name in self.fields]
+
+    def _value(self, field, raw):
+        if isinstance(raw, str):
+            raw = raw.strip()
+        if raw in ('', None):
+            if field.null:
+                return None
+            if field.has_default():
+                return field.get_default()
+            return '' if field.empty_strings_allowed else None
+        return field.to_python(raw)
+
+    def build(self, row):
+        if not row.get('slug') and row.get('name'):
+            row['slug'] = slugify(row['name'])[:50]
+
+        instance = self.model()
+        errors = {}
+        for name in self.columns(row):
+            field = self.fields[name]
+            raw = row[name]
+            try:
+                if name in self.relations:
+                    slug = (raw or '').strip()
+                    if not slug:
+                        setattr(instance, field.attname, None)
+                    elif slug not in self.lookups[name]:
+                        raise ValidationError(f'unknown {name} "{slug}"')
+                    else:
+                        setattr(instance, field.attname, self.lookups[name][slug])
+                else:
+                    setattr(instance, field.attname, self._value(field, raw))
+            except ValidationError as error:
+                errors[name] = error.messages
+
+        exclude = [name for name in self.fields if name not in row] + list(self.relations)
+        try:
+            instance.clean_fields(exclude=exclude)
+        except ValidationError as error:
+            errors.update(error.message_dict)
+        return instance, errors
+
+    def complete(self, instance, current, columns):
+        """
+        Fill the columns the file did not supply: from the stored row for
+        updates, and by full validation for new rows. Returns errors.
+        """
+        missing = [field for name, field in self.fields.items() if name not in columns]
+        if current is not None:
+            for field in missing:
+                setattr(instance, field.attname, getattr(current, field.attname))
+        else:
+            errors = {}
+            try:
+                instance.clean_fields(exclude=list(SKIP_FIELDS) + list(self.relations))
+            except ValidationError as error:
+                errors.update(error.message_dict)
+            for name in self.relations:
+                field = self.fields[name]
+                if not field.null and getattr(instance, field.attname) is None:
+                    errors[name] = ['This field is required.']
+            if errors:
+                return errors
+
+        if self.model is Product:
+            # What Product.save() would have computed, without calling it
+            instance.commission_amount = (instance.original_price * instance.commission_rate) / 100
+        return {}
+
+
+# ===== WRITING =====
+
+def _upsert(model, instances, columns):
+    update_fields = [name for name in columns if name != 'slug'] + ['updated_at']
+    if model is Product:
+        update_fields.append('commission_amount')
+    with transaction.atomic():
+        model.objects.bulk_create(
+            instances,
+            update_conflicts=True,
+            unique_fields=['slug'],
+            update_fields=update_fields,
+        )
+
+
+def _finish(model, slugs, extra_platform_ids=()):
+    """Recounts, re-indexing and cache invalidation, once for the whole run"""
+    from apps.core import caching, home, search
+    from . import bundles, counts
+
+    if model is Platform:
+        platforms = Platform.objects.filter(slug__in=slugs)
+        # Products carry their platform's name in the search index
+        search.index_queryset('platform', platforms)
+        search.index_queryset('product', Product.objects.filter(platform__in=platforms))
+        platform_ids = list(platforms.values_list('pk', flat=True))
+    else:
+        products = Product.objects.filter(slug__in=slugs)
+        search.index_queryset('product', products)
+        bundles.recalculate_for_products(products.values_list('pk', flat=True))
+        platform_ids = list(products.order_by().values_list('platform_id', flat=True).distinct())
+
+    counts.recount(set(platform_ids) | set(extra_platform_ids))
+    caching.bump(Product)
+    home.invalidate()
+
+
+def import_rows(model, rows, batch_size=500, dry_run=False):
+    """
+    Import (line number, row) pairs as `model` instances. Invalid rows are
+    skipped and reported in stats.errors. Returns ImportStats.
+    """
+    builder = _Builder(model)
+    stats = ImportStats()
+    chunk, columns = {}, set()
+
+    def flush():
+        # One SELECT per chunk tells updates from inserts
+        existing = model.objects.in_bulk(list(chunk), field_name='slug')
+        valid = []
+        for slug, (number, instance) in chunk.items():
+            current = existing.get(slug)
+            errors = builder.complete(instance, current, columns)
+            if errors:
+                stats.errors.append((number, errors))
+                continue
+            valid.append(instance)
+            if current is not None and model is Product:
+                stats.previous_platform_ids.add(current.platform_id)
+        if valid and not dry_run:
+            _upsert(model, valid, columns)
+        stats.imported += len(valid)
+        stats.slugs.update(instance.slug for instance in valid)
+        chunk.clear()
+
+    for number, row in rows:
+        stats.rows += 1
+        if not isinstance(row, dict):
+            stats.errors.append((number, {'row': [str(row)]}))
+            continue
+        instance, errors = builder.build(row)
+        if errors:
+            stats.errors.append((number, errors))
+            continue
+
+        row_columns = set(builder.columns(row))
+        if chunk and row_columns != columns:
+            # bulk_create updates one column set per statement
+            flush()
+        columns = row_columns
+        # The last row wins if a slug repeats within a chunk
+        chunk[instance.slug] = (number, instance)
+        if len(chunk) >= batch_size:
+            flush()
+    if chunk:
+        flush()
+
+    if not dry_run and stats.slugs:
+        _finish(model, stats.slugs, stats.previous_platform_ids)
+    return stats
@@ -0,0 +1,64 @@
+"""
+Import platforms or products from CSV or JSON lines (see apps.platforms.importer).
+
+    python manage.py import_catalogue platforms.csv --model platform
+    python manage.py import_catalogue products.jsonl --model product --dry-run
+
+Rows are matched on slug (derived from name when missing). Related rows are
+referenced by slug: `category` for both models and `platform` for products.
+Import platforms before the products that point at them.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from apps.platforms import importer
+from apps.platforms.models import Platform, Product
+
+MODELS = {'platform': Platform, 'product': Product}
+
+
+class Command(BaseCommand):
+    help = 'Bulk upsert platforms or products from a CSV / JSONL file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV or JSONL file, or '-' for stdin")
+        parser.add_argument('--model', choices=MODELS, required=True)
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'jsonl'],
+            help='Defaults to the file extension (.csv, otherwise JSONL)',
+        )
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--dry-run', action='store_true', help='Validate every row without writing')
+        parser.add_argument('--max-errors', type=int, default=20, help='Error lines to print')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or ('csv' if path.lower().endswith('.csv') else 'jsonl')
+
+        try:
+            source = importer.open_source(path)
+        except OSError as error:
+            raise CommandError(f'Cannot read {path}: {error}')
+
+        with source:
+            stats = importer.import_rows(
+                MODELS[options['model']],
+                importer.read_rows(source, fmt),
+                batch_size=options['batch_size'],
+                dry_run=options['dry_run'],
+            )
+
+        for number, errors in stats.errors[:options['max_errors']]:
+            details = '; '.join(f"{field}: {' '.join(messages)}" for field, messages in errors.items())
+            self.stderr.write(f'Line {number}: {details}')
+        if len(stats.errors) > options['max_errors']:
+            self.stderr.write(f'... and {len(stats.errors) - options["max_errors"]} more')
+
+        verb = 'validated' if options['dry_run'] else 'imported'
+        summary = (
+            f"{stats.imported}/{stats.rows} rows {verb}, {len(stats.errors)} invalid, "
+            f"{stats.seconds:.2f}s ({stats.rows_per_second:,.0f} rows/s)"
+        )
+        if stats.errors:
+            self.stdout.write(self.style.WARNING(f'⚠️ {summary}'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'✅ {summary}'))
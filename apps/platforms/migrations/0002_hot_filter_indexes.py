@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('platforms', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='platform',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-is_featured', 'name'], name='platforms_platform_active'),
+        ),
+        migrations.AddIndex(
+            model_name='platform',
+            index=models.Index(fields=['is_active', 'is_hidden_gem'], name='platforms_platform_gem'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-is_featured', '-created_at'], name='platforms_product_active'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['platform', '-is_featured', '-created_at'], name='platforms_product_platform'),
+        ),
+    ]
@@ -77,6 +77,14 @@ class Platform(models.Model):
     
     class Meta:
         ordering = ['-is_featured', 'name']
+        indexes = [
+            # Platform list and home page: active platforms in default order
+            models.Index(
+                fields=['-is_featured', 'name'], condition=models.Q(is_active=True),
+                name='platforms_platform_active',
+            ),
+            models.Index(fields=['is_active', 'is_hidden_gem'], name='platforms_platform_gem'),
+        ]
     
     def __str__(self):
         return f"{self.flag} {self.name}"
@@ -88,8 +96,9 @@ class Platform(models.Model):
         return f"₹{self.commission_rate}"
     
     def update_product_count(self):
-        self.total_products = self.products.count()
-        self.save()
+        from .counts import recount
+        recount([self.pk])
+        self.refresh_from_db(fields=['total_products'])
 
 
 class ProductCategory(models.Model):
@@ -171,17 +180,41 @@ class Product(models.Model):
     
     class Meta:
         ordering = ['-is_featured', '-created_at']
+        indexes = [
+            # Product list and facets: active products in default order
+            models.Index(
+                fields=['-is_featured', '-created_at'], condition=models.Q(is_active=True),
+                name='platforms_product_active',
+            ),
+            # Platform page: a platform's active products
+            models.Index(
+                fields=['platform', '-is_featured', '-created_at'], condition=models.Q(is_active=True),
+                name='platforms_product_platform',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.platform.name} - {self.name}"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the platform as loaded, so a reassignment recounts both
+        instance._loaded_platform_id = instance.__dict__.get('platform_id')
+        # ...and the price, so only a real price change reprices bundles
+        instance._loaded_our_price = instance.__dict__.get('our_price')
+        return instance
+    
     def save(self, *args, **kwargs):
+        from .counts import schedule
+        
         # Auto-calculate commission amount
         self.commission_amount = (self.original_price * self.commission_rate) / 100
         super().save(*args, **kwargs)
         
-        # Update platform product count
-        self.platform.update_product_count()
+        # Platform product counts are recounted once per transaction, on commit
+        schedule(self.platform_id, getattr(self, '_loaded_platform_id', None))
+        self._loaded_platform_id = self.platform_id
     
     @property
     def savings_amount(self):
@@ -223,15 +256,19 @@ class Bundle(models.Model):
     def __str__(self):
         return self.name
     
-    def calculate_totals(self):
-        """Calculate original total and savings"""
-        total = sum(product.our_price for product in self.products.all())
+    def apply_totals(self, total):
+        """Set original total and savings from the sum of product prices"""
         self.original_total = total
         self.savings_amount = total - self.bundle_price
-        if total:
-            self.savings_percentage = int((self.savings_amount / total) * 100)
+        self.savings_percentage = int((self.savings_amount / total) * 100) if total else 0
+    
+    def calculate_totals(self):
+        """Calculate original total and savings"""
+        total = self.products.aggregate(total=models.Sum('our_price'))['total'] if self.pk else None
+        self.apply_totals(total or Decimal('0'))
     
     def save(self, *args, **kwargs):
-        if self.pk:
-            self.calculate_totals()
+        # New bundles have no products yet; adding them recalculates
+        # through the m2m_changed signal (see apps.platforms.bundles)
+        self.calculate_totals()
         super().save(*args, **kwargs)
\ No newline at end of file
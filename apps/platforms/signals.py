@@ -0,0 +1,61 @@
+"""
+Signal handlers for the platforms app
+"""
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete
+from django.dispatch import receiver
+from apps.core import caching
+from . import bundles, counts
+from .models import Bundle, Product, ProductCategory
+
+
+# ===== PLATFORM PRODUCT COUNTS =====
+
+@receiver(post_delete, sender=Product)
+def recount_platform_products(sender, instance, **kwargs):
+    counts.schedule(instance.platform_id)
+
+
+# ===== BUNDLE TOTALS =====
+
+@receiver(m2m_changed, sender=Bundle.products.through)
+def recalculate_bundle_totals(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        # bundle.products.add/remove/clear/set()
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            bundles.recalculate([instance.pk])
+        return
+
+    # product.bundles.add/remove/clear(): pk_set holds bundle ids, except
+    # on clear, where they have to be read before the rows go
+    if action == 'pre_clear':
+        instance._cleared_bundle_ids = bundles.bundle_ids_for_products([instance.pk])
+    elif action == 'post_clear':
+        bundles.recalculate(getattr(instance, '_cleared_bundle_ids', []))
+    elif action in ('post_add', 'post_remove'):
+        bundles.recalculate(pk_set)
+
+
+@receiver(post_save, sender=Product)
+def reprice_bundles(sender, instance, created, **kwargs):
+    loaded_price = getattr(instance, '_loaded_our_price', None)
+    if not created and instance.our_price != loaded_price:
+        bundles.recalculate_for_products([instance.pk])
+    instance._loaded_our_price = instance.our_price
+
+
+@receiver(pre_delete, sender=Product)
+def remember_product_bundles(sender, instance, **kwargs):
+    # The through rows are cascaded without m2m_changed
+    instance._bundle_ids = bundles.bundle_ids_for_products([instance.pk])
+
+
+@receiver(post_delete, sender=Product)
+def recalculate_after_product_delete(sender, instance, **kwargs):
+    bundles.recalculate(getattr(instance, '_bundle_ids', []))
+
+
+# ===== FACET COUNTS =====
+
+# Facet counts are cached on the Product and ProductCategory versions
+# (ProductCategory is watched by apps.core.signals)
+caching.watch(Product)
@@ -1,3 +1,174 @@
-from django.test import TestCase
+from decimal import Decimal
+from django.db import connection, transaction
+from django.http import QueryDict
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from . import facets
+from .models import Bundle, Platform, Product, ProductCategory
 
-# Create your tests here.
+
+def make_platform(slug='platform'):
+    return Platform.objects.create(name=slug.title(), slug=slug, website='https://example.com')
+
+
+def make_product(platform, slug, price='100'):
+    return Product.objects.create(
+        platform=platform, name=slug.title(), slug=slug,
+        original_price=Decimal(price), our_price=Decimal(price), commission_rate=Decimal('0'),
+    )
+
+
+def total_products(platform):
+    platform.refresh_from_db(fields=['total_products'])
+    return platform.total_products
+
+
+class PlatformCountTests(TestCase):
+    def setUp(self):
+        self.platform = make_platform()
+
+    def test_recounted_once_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(5):
+                make_product(self.platform, f'course-{i}')
+            self.assertEqual(total_products(self.platform), 0)
+        self.assertEqual(total_products(self.platform), 5)
+
+    def test_moving_a_product_recounts_both_platforms(self):
+        other = make_platform('other')
+        with self.captureOnCommitCallbacks(execute=True):
+            product = make_product(self.platform, 'course')
+        with self.captureOnCommitCallbacks(execute=True):
+            product = Product.objects.get(pk=product.pk)
+            product.platform = other
+            product.save()
+        self.assertEqual((total_products(self.platform), total_products(other)), (0, 1))
+
+    def test_delete_recounts(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            product = make_product(self.platform, 'course')
+        with self.captureOnCommitCallbacks(execute=True):
+            product.delete()
+        self.assertEqual(total_products(self.platform), 0)
+
+
+class PlatformCountRollbackTests(TransactionTestCase):
+    def test_recount_after_rolled_back_transaction(self):
+        platform = make_platform()
+        try:
+            with transaction.atomic():
+                make_product(platform, 'rolled-back')
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        with transaction.atomic():
+            make_product(platform, 'course')
+        self.assertEqual(total_products(platform), 1)
+
+    def test_recount_after_rolled_back_savepoint(self):
+        platform = make_platform()
+        with transaction.atomic():
+            try:
+                with transaction.atomic():
+                    make_product(platform, 'rolled-back')
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            make_product(platform, 'course')
+        self.assertEqual(total_products(platform), 1)
+
+
+LOCMEM = {
+    alias: {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': alias}
+    for alias in ('default', 'sessions', 'volatile')
+}
+
+
+@override_settings(CACHES=LOCMEM)
+class FacetTests(TestCase):
+    def setUp(self):
+        platform = make_platform()
+        self.course = ProductCategory.objects.create(name='Course', slug='course')
+        free = make_product(platform, 'free-course', price='0')
+        free.is_free = True
+        free.save()
+        paid = make_product(platform, 'paid-course', price='2000')
+        paid.category = self.course
+        paid.save()
+
+    def get(self, query):
+        return self.client.get(reverse('products'), QueryDict(query))
+
+    def test_unknown_category_matches_nothing(self):
+        self.assertEqual(len(self.get('category=nope').context['products']), 0)
+        self.assertEqual(len(self.get('category=course').context['products']), 1)
+
+    def test_unknown_price_band_is_ignored(self):
+        self.assertEqual(len(self.get('price=cheap').context['products']), 2)
+        self.assertEqual(len(self.get('price=free').context['products']), 1)
+
+    def test_free_count_ignores_filters(self):
+        self.assertEqual(self.get('category=course').context['free_count'], 1)
+
+    def test_counts_cached_until_a_product_changes(self):
+        params = QueryDict('category=course')
+        self.assertEqual(facets.counts(params)['total'], 1)
+        with CaptureQueriesContext(connection) as queries:
+            facets.counts(params)
+        self.assertEqual(len(queries), 0)
+
+        product = Product.objects.get(slug='free-course')
+        product.category = self.course
+        product.save()
+        self.assertEqual(facets.counts(params)['total'], 2)
+
+    def test_searches_are_not_cached(self):
+        facets.counts(QueryDict('q=paid'))
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(facets.counts(QueryDict('q=paid'))['total'], 1)
+        self.assertEqual(len(queries), 1)
+
+
+class BundleTotalsTests(TestCase):
+    def setUp(self):
+        platform = make_platform()
+        self.first = make_product(platform, 'first', '100')
+        self.second = make_product(platform, 'second', '50')
+        self.bundle = Bundle.objects.create(
+            name='Bundle', slug='bundle', description='Both', bundle_price=Decimal('120'),
+        )
+
+    def totals(self):
+        self.bundle.refresh_from_db()
+        return self.bundle.original_total, self.bundle.savings_amount, self.bundle.savings_percentage
+
+    def test_new_bundle_has_no_total(self):
+        self.assertEqual(self.totals(), (Decimal('0'), Decimal('-120'), 0))
+
+    def test_adding_and_removing_products(self):
+        self.bundle.products.add(self.first, self.second)
+        self.assertEqual(self.totals(), (Decimal('150'), Decimal('30'), 20))
+        self.bundle.products.remove(self.second)
+        self.assertEqual(self.totals()[0], Decimal('100'))
+        self.bundle.products.clear()
+        self.assertEqual(self.totals()[0], Decimal('0'))
+
+    def test_adding_from_the_product_side(self):
+        self.first.bundles.add(self.bundle)
+        self.second.bundles.add(self.bundle)
+        self.assertEqual(self.totals()[0], Decimal('150'))
+        self.second.bundles.clear()
+        self.assertEqual(self.totals()[0], Decimal('100'))
+
+    def test_product_price_change(self):
+        self.bundle.products.add(self.first, self.second)
+        self.first.our_price = Decimal('150')
+        self.first.save()
+        self.assertEqual(self.totals(), (Decimal('200'), Decimal('80'), 40))
+
+    def test_product_delete(self):
+        self.bundle.products.add(self.first, self.second)
+        self.second.delete()
+        self.assertEqual(self.totals(), (Decimal('100'), Decimal('-20'), -20))
@@ -1,14 +1,19 @@
 from django.shortcuts import render, get_object_or_404
 from django.views.generic import ListView, DetailView
 from django.db.models import Q, Count, Avg
+from apps.core import caching
+from apps.core.pagination import KeysetPaginationMixin
 from .models import Platform, Product, Bundle, PlatformCategory, ProductCategory
+from . import facets
 
-class PlatformListView(ListView):
+class PlatformListView(KeysetPaginationMixin, ListView):
     """500+ Platforms Listing"""
     model = Platform
     template_name = 'platforms/platforms.html'
     context_object_name = 'platforms'
     paginate_by = 12
+    # The platforms template shows no total
+    count_mode = None
     
     def get_queryset(self):
         queryset = Platform.objects.filter(is_active=True)
@@ -44,8 +49,7 @@ class PlatformListView(ListView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['categories'] = PlatformCategory.objects.all()
-        context['total_count'] = self.get_queryset().count()
+        context['categories'] = caching.cached_queryset(PlatformCategory.objects.all())
         context['hidden_gems_count'] = Platform.objects.filter(is_hidden_gem=True).count()
         return context
 
@@ -66,51 +70,26 @@ class PlatformDetailView(DetailView):
         return context
 
 
-class ProductListView(ListView):
+class ProductListView(KeysetPaginationMixin, ListView):
     """1000+ Products Listing"""
     model = Product
     template_name = 'platforms/products.html'
     context_object_name = 'products'
     paginate_by = 12
+    # total_count comes from the facet counts instead
+    count_mode = None
     
     def get_queryset(self):
-        queryset = Product.objects.filter(is_active=True)
-        
-        # Search
-        q = self.request.GET.get('q')
-        if q:
-            queryset = queryset.filter(
-                Q(name__icontains=q) |
-                Q(description__icontains=q) |
-                Q(platform__name__icontains=q)
-            )
-        
-        # Category Filter
-        category = self.request.GET.get('category')
-        if category:
-            queryset = queryset.filter(category__slug=category)
-        
-        # Price Filter
-        price = self.request.GET.get('price')
-        if price == 'free':
-            queryset = queryset.filter(is_free=True)
-        elif price == 'under1000':
-            queryset = queryset.filter(our_price__lt=1000)
-        elif price == '1000-5000':
-            queryset = queryset.filter(our_price__gte=1000, our_price__lte=5000)
-        
-        # Difficulty Filter
-        difficulty = self.request.GET.get('difficulty')
-        if difficulty:
-            queryset = queryset.filter(difficulty=difficulty)
-        
-        return queryset
+        # Search, category, price, difficulty & product type filters
+        return facets.apply(Product.objects.filter(is_active=True), self.request.GET)
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['categories'] = ProductCategory.objects.all()
-        context['total_count'] = self.get_queryset().count()
-        context['free_count'] = Product.objects.filter(is_free=True).count()
+        facet_counts = facets.counts(self.request.GET)
+        context['facets'] = facet_counts
+        context['categories'] = facet_counts['category']
+        context['total_count'] = facet_counts['total']
+        context['free_count'] = facets.free_count()
         return context
 
 
@@ -136,7 +115,8 @@ class BundleListView(ListView):
     context_object_name = 'bundles'
     
     def get_queryset(self):
-        return Bundle.objects.filter(is_active=True).prefetch_related('products')
+        # Savings are stored on the bundle, so products aren't needed here
+        return Bundle.objects.filter(is_active=True).order_by('-is_featured', '-created_at')
 
 
 # Function-based view for backwards compatibility
@@ -0,0 +1,24 @@
+"""
+Backfill UserDashboardSummary rows.
+
+Signals keep summaries current after this runs once; rerun it after bulk
+data changes that bypass model signals (raw SQL, queryset.update()).
+"""
+import time
+from django.core.management.base import BaseCommand
+from apps.users import summary
+
+
+class Command(BaseCommand):
+    help = 'Rebuild dashboard summaries for all users (or the given user ids)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, action='append', dest='user_ids', help='User id (repeatable)')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        count = summary.rebuild_all(user_ids=options['user_ids'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ Rebuilt {count} dashboard summaries in {time.monotonic() - started:.2f}s'
+        ))
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:23
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_emailotp_userskillprogress'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserDashboardSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_spent', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('commission_earned', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('total_courses', models.IntegerField(default=0)),
+                ('in_progress', models.IntegerField(default=0)),
+                ('completed', models.IntegerField(default=0)),
+                ('total_skills', models.IntegerField(default=0)),
+                ('avg_progress', models.FloatField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='dashboard_summary', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Dashboard Summary',
+                'verbose_name_plural': 'Dashboard Summaries',
+            },
+        ),
+    ]
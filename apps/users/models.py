@@ -311,3 +311,34 @@ class EmailOTP(models.Model):
         
         remaining = self.max_attempts - self.attempts
         return False, f"Invalid OTP. {remaining} attempts remaining"
+
+
+class UserDashboardSummary(models.Model):
+    """Dashboard - Denormalized overview stats, one row per user
+
+    Maintained by apps.users.signals as orders, enrollments and skills change;
+    rebuild with `manage.py rebuild_dashboard_summaries`.
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='dashboard_summary')
+    
+    # Paid orders
+    total_spent = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    commission_earned = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    
+    # Enrollments
+    total_courses = models.IntegerField(default=0)
+    in_progress = models.IntegerField(default=0)
+    completed = models.IntegerField(default=0)
+    
+    # Skills
+    total_skills = models.IntegerField(default=0)
+    avg_progress = models.FloatField(default=0)
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = 'Dashboard Summary'
+        verbose_name_plural = 'Dashboard Summaries'
+    
+    def __str__(self):
+        return f"Dashboard summary - {self.user.username}"
@@ -0,0 +1,34 @@
+"""
+Signal handlers for the users app
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.orders.models import Order
+from . import summary
+from .models import Enrollment, UserSkillProgress
+
+
+# ===== DASHBOARD SUMMARY =====
+
+@receiver(post_save, sender=Order)
+@receiver(post_delete, sender=Order)
+def refresh_order_summary(sender, instance, signal, raw=False, **kwargs):
+    if raw or instance.user_id is None:
+        return
+    summary.refresh_orders(instance.user_id, create=signal is post_save)
+
+
+@receiver(post_save, sender=Enrollment)
+@receiver(post_delete, sender=Enrollment)
+def refresh_enrollment_summary(sender, instance, signal, raw=False, **kwargs):
+    if raw:
+        return
+    summary.refresh_enrollments(instance.user_id, create=signal is post_save)
+
+
+@receiver(post_save, sender=UserSkillProgress)
+@receiver(post_delete, sender=UserSkillProgress)
+def refresh_skill_summary(sender, instance, signal, raw=False, **kwargs):
+    if raw:
+        return
+    summary.refresh_skills(instance.user_id, create=signal is post_save)
@@ -0,0 +1,157 @@
+"""
+Dashboard Summary for Zero To Hero
+
+Keeps UserDashboardSummary in step with a user's orders, enrollments and
+skills. Each refresh recomputes one section for one user with a single
+aggregate, so dashboard_overview reads all of its stats from one row.
+"""
+from decimal import Decimal
+from django.db.models import Avg, Count, Q, Sum
+from apps.orders.models import Order
+from .models import Enrollment, UserSkillProgress, UserDashboardSummary
+
+
+# ===== SECTIONS =====
+
+def _order_stats(orders):
+    stats = orders.filter(payment_status='paid').aggregate(
+        total_spent=Sum('total'),
+        commission_earned=Sum('affiliate_commission'),
+    )
+    return {
+        'total_spent': stats['total_spent'] or Decimal('0'),
+        'commission_earned': stats['commission_earned'] or Decimal('0'),
+    }
+
+
+def _enrollment_stats(enrollments):
+    return enrollments.aggregate(
+        total_courses=Count('id'),
+        in_progress=Count('id', filter=Q(status='active')),
+        completed=Count('id', filter=Q(status='completed')),
+    )
+
+
+def _skill_stats(skills):
+    stats = skills.aggregate(total_skills=Count('id'), avg_progress=Avg('progress_percent'))
+    stats['avg_progress'] = stats['avg_progress'] or 0
+    return stats
+
+
+def compute(user_id):
+    """All summary fields for a user, straight from the source tables"""
+    return {
+        **_order_stats(Order.objects.filter(user_id=user_id)),
+        **_enrollment_stats(Enrollment.objects.filter(user_id=user_id)),
+        **_skill_stats(UserSkillProgress.objects.filter(user_id=user_id)),
+    }
+
+
+# ===== MAINTENANCE =====
+
+def build(user_id):
+    from .models import User
+
+    # Nothing to build for a user that is gone (or being deleted)
+    if not User.objects.filter(pk=user_id).exists():
+        return None
+    summary, _ = UserDashboardSummary.objects.update_or_create(user_id=user_id, defaults=compute(user_id))
+    return summary
+
+
+def _apply(user_id, values, create=True):
+    # A user without a summary row yet gets a full build instead of a partial
+    # one. Deletes only update: they may be part of the user's own cascade,
+    # and a row built then would point at a user about to disappear.
+    if not UserDashboardSummary.objects.filter(user_id=user_id).update(**values) and create:
+        build(user_id)
+
+
+def refresh_orders(user_id, create=True):
+    _apply(user_id, _order_stats(Order.objects.filter(user_id=user_id)), create)
+
+
+def refresh_enrollments(user_id, create=True):
+    _apply(user_id, _enrollment_stats(Enrollment.objects.filter(user_id=user_id)), create)
+
+
+def refresh_skills(user_id, create=True):
+    _apply(user_id, _skill_stats(UserSkillProgress.objects.filter(user_id=user_id)), create)
+
+
+def get_summary(user):
+    """The user's summary row, computed and stored on the fly if missing"""
+    summary = UserDashboardSummary.objects.filter(user=user).first()
+    return summary or build(user.pk)
+
+
+def rebuild_all(user_ids=None, batch_size=1000):
+    """Backfill summaries with grouped aggregates instead of per-user queries"""
+    from .models import User
+
+    users = User.objects.order_by('pk').values_list('pk', flat=True)
+    if user_ids:
+        users = users.filter(pk__in=user_ids)
+
+    count = 0
+    batch = []
+    for user_id in users.iterator(chunk_size=batch_size):
+        batch.append(user_id)
+        if len(batch) >= batch_size:
+            count += _rebuild_batch(batch)
+            batch = []
+    if batch:
+        count += _rebuild_batch(batch)
+    return count
+
+
+def _rebuild_batch(user_ids):
+    orders = {
+        row['user_id']: row
+        for row in Order.objects.filter(user_id__in=user_ids, payment_status='paid')
+        .values('user_id')
+        .annotate(total_spent=Sum('total'), commission_earned=Sum('affiliate_commission'))
+    }
+    enrollments = {
+        row['user_id']: row
+        for row in Enrollment.objects.filter(user_id__in=user_ids)
+        .values('user_id')
+        .annotate(
+            total_courses=Count('id'),
+            in_progress=Count('id', filter=Q(status='active')),
+            completed=Count('id', filter=Q(status='completed')),
+        )
+    }
+    skills = {
+        row['user_id']: row
+        for row in UserSkillProgress.objects.filter(user_id__in=user_ids)
+        .values('user_id')
+        .annotate(total_skills=Count('id'), avg_progress=Avg('progress_percent'))
+    }
+
+    summaries = []
+    for user_id in user_ids:
+        order_row = orders.get(user_id, {})
+        enrollment_row = enrollments.get(user_id, {})
+        skill_row = skills.get(user_id, {})
+        summaries.append(UserDashboardSummary(
+            user_id=user_id,
+            total_spent=order_row.get('total_spent') or Decimal('0'),
+            commission_earned=order_row.get('commission_earned') or Decimal('0'),
+            total_courses=enrollment_row.get('total_courses', 0),
+            in_progress=enrollment_row.get('in_progress', 0),
+            completed=enrollment_row.get('completed', 0),
+            total_skills=skill_row.get('total_skills', 0),
+            avg_progress=skill_row.get('avg_progress') or 0,
+        ))
+
+    UserDashboardSummary.objects.bulk_create(
+        summaries,
+        update_conflicts=True,
+        unique_fields=['user'],
+        update_fields=[
+            'total_spent', 'commission_earned', 'total_courses', 'in_progress',
+            'completed', 'total_skills', 'avg_progress', 'updated_at',
+        ],
+    )
+    return len(summaries)
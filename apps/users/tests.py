@@ -1,3 +1,64 @@
-from django.test import TestCase
+from decimal import Decimal
+from django.test import TestCase, TransactionTestCase
+from apps.orders.models import Order
+from apps.platforms.models import Platform, Product
+from .models import Enrollment, User, UserDashboardSummary, UserSkillProgress
 
-# Create your tests here.
+
+def make_product(slug='course', price='100'):
+    platform, _ = Platform.objects.get_or_create(
+        slug='platform', defaults={'name': 'Platform', 'website': 'https://example.com'}
+    )
+    return Product.objects.create(
+        platform=platform, name=slug.title(), slug=slug,
+        original_price=Decimal(price), our_price=Decimal(price), commission_rate=Decimal('0'),
+    )
+
+
+class DashboardSummaryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('student', 'student@example.com', 'password')
+        self.product = make_product()
+
+    def summary(self):
+        return UserDashboardSummary.objects.get(user=self.user)
+
+    def test_paid_orders_are_summed(self):
+        Order.objects.create(user=self.user, subtotal=100, total=100, payment_status='paid')
+        order = Order.objects.create(user=self.user, subtotal=50, total=50, payment_status='pending')
+        self.assertEqual(self.summary().total_spent, Decimal('100'))
+
+        order.payment_status = 'paid'
+        order.save()
+        self.assertEqual(self.summary().total_spent, Decimal('150'))
+
+        order.delete()
+        self.assertEqual(self.summary().total_spent, Decimal('100'))
+
+    def test_enrollments_and_skills(self):
+        enrollment = Enrollment.objects.create(user=self.user, product=self.product, status='active')
+        UserSkillProgress.objects.create(user=self.user, skill_name='Python', progress_percent=40)
+        summary = self.summary()
+        self.assertEqual((summary.total_courses, summary.in_progress, summary.completed), (1, 1, 0))
+        self.assertEqual((summary.total_skills, summary.avg_progress), (1, 40))
+
+        enrollment.status = 'completed'
+        enrollment.save()
+        summary = self.summary()
+        self.assertEqual((summary.in_progress, summary.completed), (0, 1))
+
+
+class DeleteUserTests(TransactionTestCase):
+    """Deleting a user cascades through rows whose signals touch the summary"""
+
+    def test_delete_user_with_orders_and_enrollments(self):
+        user = User.objects.create_user('leaver', 'leaver@example.com', 'password')
+        Order.objects.create(user=user, subtotal=100, total=100, payment_status='paid')
+        Enrollment.objects.create(user=user, product=make_product(), status='active')
+        UserSkillProgress.objects.create(user=user, skill_name='Python', progress_percent=10)
+        self.assertTrue(UserDashboardSummary.objects.filter(user=user).exists())
+
+        user.delete()
+
+        self.assertFalse(User.objects.filter(username='leaver').exists())
+        self.assertFalse(UserDashboardSummary.objects.exists())
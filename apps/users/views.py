@@ -5,41 +5,38 @@ from django.contrib import messages
 from django.db.models import Sum, Count, Avg
 from decimal import Decimal
 from apps.orders.models import Order
+from apps.orders.filters import filter_orders
 from apps.users.models import Enrollment, Wishlist, UserSkillProgress
+from apps.core import analytics
+from . import summary
 
 # ===== DASHBOARD VIEWS =====
 
 @login_required
 def dashboard_overview(request):
     try:
-        # Get user's orders statistics
-        orders = Order.objects.filter(user=request.user)
-        total_spent = orders.filter(payment_status='paid').aggregate(Sum('total'))['total__sum'] or Decimal('0')
-        total_saved = total_spent * Decimal('0.06')  # 6% average savings
-        commission_earned = orders.filter(payment_status='paid').aggregate(Sum('affiliate_commission'))['affiliate_commission__sum'] or Decimal('0')
-        
-        # Get course statistics using Enrollment
-        enrollments = Enrollment.objects.filter(user=request.user)
-        total_courses = enrollments.count()
-        in_progress = enrollments.filter(status='active').count()
-        completed = enrollments.filter(status='completed').count()
-        
-        # Get skill statistics
-        skills = UserSkillProgress.objects.filter(user=request.user)
+        # All overview stats come from one denormalized row (apps.users.summary)
+        stats = summary.get_summary(request.user)
         
         # Auto-create default skills if user doesn't have any
-        if not skills.exists():
+        if not stats.total_skills:
             UserSkillProgress.create_default_skills(request.user)
-            skills = UserSkillProgress.objects.filter(user=request.user)
+            stats.refresh_from_db()
         
-        total_skills = skills.count()
-        avg_progress = skills.aggregate(Avg('progress_percent'))['progress_percent__avg'] or 0
+        total_spent = stats.total_spent
+        total_saved = total_spent * Decimal('0.06')  # 6% average savings
+        commission_earned = stats.commission_earned
+        total_courses = stats.total_courses
+        in_progress = stats.in_progress
+        completed = stats.completed
+        total_skills = stats.total_skills
+        avg_progress = stats.avg_progress
         
         # Recent orders (last 5)
-        recent_orders = orders.order_by('-created_at')[:5]
+        recent_orders = Order.objects.filter(user=request.user).order_by('-created_at')[:5]
         
         # Recent enrollments (last 5)
-        recent_courses = enrollments.order_by('-enrolled_at')[:5]
+        recent_courses = Enrollment.objects.filter(user=request.user).order_by('-enrolled_at')[:5]
     except Exception as e:
         # If there's any error, use default values
         print(f"Dashboard error: {e}")
@@ -97,39 +94,13 @@ def dashboard_orders(request):
     # Get all user's orders
     orders = Order.objects.filter(user=request.user)
     
-    # Search functionality - Search by Order Number
+    # Search, status, payment status & date range filters
+    orders = filter_orders(orders, request.GET)
     search_query = request.GET.get('search', '').strip()
-    if search_query:
-        orders = orders.filter(order_number__icontains=search_query)
-    
-    # Status filter
     status_filter = request.GET.get('status', '')
-    if status_filter:
-        orders = orders.filter(order_status=status_filter)
-    
-    # Payment status filter
     payment_status = request.GET.get('payment_status', '')
-    if payment_status:
-        orders = orders.filter(payment_status=payment_status)
-    
-    # Date range filter
     date_from = request.GET.get('date_from', '')
     date_to = request.GET.get('date_to', '')
-    if date_from:
-        from datetime import datetime
-        try:
-            date_from_parsed = datetime.strptime(date_from, '%Y-%m-%d')
-            orders = orders.filter(created_at__date__gte=date_from_parsed)
-        except ValueError:
-            pass
-    
-    if date_to:
-        from datetime import datetime
-        try:
-            date_to_parsed = datetime.strptime(date_to, '%Y-%m-%d')
-            orders = orders.filter(created_at__date__lte=date_to_parsed)
-        except ValueError:
-            pass
     
     # Sorting
     sort_by = request.GET.get('sort', '-created_at')
@@ -201,8 +172,9 @@ def dashboard_affiliate(request):
     
     # Get commission statistics
     if affiliate:
-        total_commission = Commission.objects.filter(affiliate=affiliate, status='paid').aggregate(Sum('amount'))['amount__sum'] or 0
-        pending_commission = Commission.objects.filter(affiliate=affiliate, status='pending').aggregate(Sum('amount'))['amount__sum'] or 0
+        commissions = analytics.commission_metrics(affiliate=affiliate)
+        total_commission = commissions['total_commissions']
+        pending_commission = commissions['pending_commissions']
         withdrawals = affiliate.withdrawals.all()[:5]
     else:
         total_commission = 0
@@ -14,6 +14,15 @@ python manage.py collectstatic --no-input
 echo "🗄️ Running migrations..."
 python manage.py migrate --run-syncdb
 
+echo "🔎 Rebuilding search index..."
+python manage.py rebuild_search_index
+
+echo "📊 Refreshing analytics rollups..."
+python manage.py rollup_metrics
+
+echo "🧹 Removing expired sessions..."
+python manage.py clearsessions
+
 echo "👤 Creating admin user..."
 python manage.py shell << 'EOF'
 from django.contrib.auth import get_user_model
@@ -65,6 +65,8 @@ CKEDITOR_CONFIGS = {
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Add Whitenoise for static files
+    'apps.core.metrics.MetricsMiddleware',  # Prometheus request metrics at /metrics
+    'apps.core.profiling.ProfilingMiddleware',  # No-op unless PROFILING_ENABLED
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -91,6 +93,17 @@ TEMPLATES = [{
     },
 }]
 
+# Compile templates once per process in production. In DEBUG Django's
+# default loaders are kept so template edits show up without a restart.
+if not DEBUG:
+    TEMPLATES[0]['APP_DIRS'] = False
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        ('django.template.loaders.cached.Loader', [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ]),
+    ]
+
 WSGI_APPLICATION = 'config.wsgi.application'
 
 # ===== DATABASE =====
@@ -134,7 +147,15 @@ LOGIN_REDIRECT_URL = 'dashboard-overview'
 LOGOUT_REDIRECT_URL = 'home'
 
 # Session settings
-SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+# SESSION_BACKEND picks where sessions live:
+#   cached_db      - read from the 'sessions' cache, written through to the database (default)
+#   cache          - the 'sessions' cache only; sessions go if the cache is cleared
+#   signed_cookies - a signed cookie in the browser, no server-side state
+#   db             - the database only
+# Expired rows are removed by `manage.py clearsessions` (build.sh; run it daily from cron too).
+SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'cached_db')
+SESSION_ENGINE = f'django.contrib.sessions.backends.{SESSION_BACKEND}'
+SESSION_CACHE_ALIAS = 'sessions'
 SESSION_COOKIE_AGE = 86400  # 24 hours in seconds
 
 AUTH_PASSWORD_VALIDATORS = []
@@ -156,6 +177,89 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# ===== CACHES =====
+# CACHE_BACKEND / SESSION_CACHE_BACKEND: redis (default when REDIS_URL is set),
+# file (default otherwise) or locmem.
+#   redis  - REDIS_URL; anything speaking the Redis protocol (Redis, Valkey,
+#            KeyDB, a local stand-in) works, and it is shared across nodes
+#   file   - shared by every worker on the node. Django's file cache lists its
+#            directory on every set() and stats every file when it culls, so
+#            writes cost O(entries); FILE_CACHE_MAX_ENTRIES keeps that small.
+#            Culled entries are only recomputed (sessions reload from the db).
+#   locmem - per process: only for runserver / a single worker, since a
+#            change handled by one worker would not invalidate the others
+# The sessions cache must be shared by every worker (see SESSION_BACKEND).
+# The 'volatile' alias holds high-churn entries that are safe to keep per
+# process (template fragments keyed on updated_at, list counts with a TTL):
+# locmem unless Redis is in use.
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'redis' if os.environ.get('REDIS_URL') else 'file')
+SESSION_CACHE_BACKEND = os.environ.get('SESSION_CACHE_BACKEND', CACHE_BACKEND)
+VOLATILE_CACHE_BACKEND = os.environ.get(
+    'VOLATILE_CACHE_BACKEND', 'redis' if CACHE_BACKEND == 'redis' else 'locmem'
+)
+CACHE_DIR = os.environ.get('CACHE_DIR', '/tmp/zth-cache')
+FILE_CACHE_MAX_ENTRIES = int(os.environ.get('FILE_CACHE_MAX_ENTRIES', 2000))
+REDIS_URL = os.environ.get('REDIS_URL', 'redis://127.0.0.1:6379/0')
+
+
+def cache_config(backend, name, timeout=300):
+    if backend == 'redis':
+        return {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': name,
+            'TIMEOUT': timeout,
+        }
+    if backend == 'locmem':
+        return {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': name,
+            'TIMEOUT': timeout,
+        }
+    return {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(CACHE_DIR, name),
+        'TIMEOUT': timeout,
+        'OPTIONS': {'MAX_ENTRIES': FILE_CACHE_MAX_ENTRIES},
+    }
+
+
+CACHES = {
+    'default': cache_config(CACHE_BACKEND, 'default'),
+    'sessions': cache_config(SESSION_CACHE_BACKEND, 'sessions', timeout=SESSION_COOKIE_AGE),
+    'volatile': cache_config(VOLATILE_CACHE_BACKEND, 'volatile'),
+}
+
+# ===== HOME PAGE CACHE =====
+# Seconds a cached home page fragment lives before it is rebuilt
+HOME_CACHE_TIMEOUT = int(os.environ.get('HOME_CACHE_TIMEOUT', 300))
+
+# ===== TEMPLATE FRAGMENT CACHE =====
+# {% fragment %} blocks (navbar, footer, cards) - see apps/core/templatetags/fragments.py
+FRAGMENT_CACHE_TIMEOUT = int(os.environ.get('FRAGMENT_CACHE_TIMEOUT', 600))  # seconds
+
+# ===== PAGINATION =====
+# How long list views reuse a cached total_count (see apps/core/pagination.py)
+PAGINATION_COUNT_TIMEOUT = int(os.environ.get('PAGINATION_COUNT_TIMEOUT', 300))
+
+# ===== VIEW COUNTERS =====
+# Seconds between batched flushes of BlogPost/HiddenGem view counts (0 = write-through)
+VIEW_COUNTER_FLUSH_INTERVAL = int(os.environ.get('VIEW_COUNTER_FLUSH_INTERVAL', 30))
+
+# ===== PROFILING =====
+# Per-request query/latency profiles at /analytics/profile/ (see apps/core/profiling.py)
+PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', 'False') == 'True'
+PROFILING_BUFFER_SIZE = int(os.environ.get('PROFILING_BUFFER_SIZE', 500))  # requests kept per worker
+PROFILING_SLOW_MS = int(os.environ.get('PROFILING_SLOW_MS', 500))
+PROFILING_SLOW_QUERIES = int(os.environ.get('PROFILING_SLOW_QUERIES', 50))
+PROFILING_DUPLICATE_QUERIES = int(os.environ.get('PROFILING_DUPLICATE_QUERIES', 10))  # same statement N times
+
+# ===== METRICS =====
+# Prometheus metrics at /metrics (see apps/core/metrics.py). Under gunicorn,
+# PROMETHEUS_MULTIPROC_DIR must be set in the environment before startup.
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True') == 'True'
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')  # Bearer token for scrapers; staff login if empty
+
 # ===== EMAIL SETTINGS =====
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = os.environ.get('EMAIL_HOST', 'smtp.gmail.com')
@@ -165,6 +269,14 @@ EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
 EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
 DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', EMAIL_HOST_USER)
 
+# ===== EMAIL OUTBOX =====
+# Queue mail in EmailOutbox and deliver it with `manage.py email_worker`.
+# Off by default (mail is sent inline): only turn it on where the worker runs.
+# start.sh runs the worker and enables it for Docker, Railway and Render.
+EMAIL_OUTBOX_ENABLED = os.environ.get('EMAIL_OUTBOX_ENABLED', 'False') == 'True'
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.environ.get('EMAIL_OUTBOX_MAX_ATTEMPTS', 5))
+EMAIL_OUTBOX_RETRY_DELAY = int(os.environ.get('EMAIL_OUTBOX_RETRY_DELAY', 60))  # seconds, doubled per attempt
+
 # ===== RAZORPAY PAYMENT SETTINGS =====
 RAZORPAY_KEY_ID = os.environ.get('RAZORPAY_KEY_ID', '')
 RAZORPAY_KEY_SECRET = os.environ.get('RAZORPAY_KEY_SECRET', '')
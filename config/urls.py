@@ -9,6 +9,7 @@ from django.contrib import admin
 from django.urls import path, include
 from django.views.generic import RedirectView
 from apps.core.views import HomeView
+from apps.core.analytics_views import metrics_endpoint
 from django.conf import settings
 from django.conf.urls.static import static
 
@@ -25,6 +26,7 @@ urlpatterns = [
     path('cart/', include('apps.cart.urls')),
     path('payments/', include('apps.payments.urls')),
     path('analytics/', include('apps.core.analytics_urls')),
+    path('metrics', metrics_endpoint, name='metrics'),
 ]
 
 if settings.DEBUG:
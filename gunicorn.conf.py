@@ -0,0 +1,22 @@
+# gunicorn.conf.py - loaded automatically by gunicorn from the project root
+import os
+
+# Workers write their metrics to files here and /metrics adds them up (see
+# apps/core/metrics.py). start.sh empties it before the email worker starts.
+METRICS_DIR = os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/zth-metrics')
+
+
+def on_starting(server):
+    os.makedirs(METRICS_DIR, exist_ok=True)
+
+
+def worker_exit(server, worker):
+    """Drain in-process buffers before the worker goes away"""
+    from apps.core import counters
+    counters.flush()
+
+
+def child_exit(server, worker):
+    """Drop the live-process series of a worker that has exited"""
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
@@ -1,8 +1,38 @@
 #!/bin/bash
-# Start script for Railway deployment
+# Start script for Docker, Railway and Render deployments
 
 # Run migrations
 python manage.py migrate
 
-# Start gunicorn
-gunicorn config.wsgi:application --bind 0.0.0.0:$PORT
+# Shared, empty directory for the per-process metrics files behind /metrics
+export PROMETHEUS_MULTIPROC_DIR=${PROMETHEUS_MULTIPROC_DIR:-/tmp/zth-metrics}
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
+# Queue outgoing mail in the outbox; the worker below delivers it
+export EMAIL_OUTBOX_ENABLED=${EMAIL_OUTBOX_ENABLED:-True}
+
+# Deliver queued emails in the background, restarting the worker if it dies.
+# On SIGTERM the worker finishes its current batch and the loop stops.
+supervise_email_worker() {
+    trap 'kill -TERM "$worker" 2>/dev/null; wait "$worker"; exit 0' TERM
+    while true; do
+        python manage.py email_worker &
+        worker=$!
+        wait "$worker"
+        echo "email_worker exited with status $?, restarting in 5s" >&2
+        sleep 5
+    done
+}
+supervise_email_worker &
+EMAIL_WORKER=$!
+
+# Start gunicorn; stop both on SIGTERM / SIGINT, and the worker if gunicorn exits
+gunicorn config.wsgi:application --bind 0.0.0.0:$PORT &
+GUNICORN=$!
+trap 'kill -TERM "$GUNICORN" "$EMAIL_WORKER" 2>/dev/null' TERM INT
+wait "$GUNICORN"
+status=$?
+kill -TERM "$EMAIL_WORKER" 2>/dev/null
+wait
+exit $status